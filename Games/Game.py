@@ -1,23 +1,29 @@
 from abc import ABC, abstractmethod
 from utils.errors import *
-from config import config
+from utils.instrumentation import metrics
+from Games.registry import registry
 
 class Game(ABC):
+    # Whether a solved puzzle's words are accepted answers worth recording
+    records_actual_words: bool = True
+
     def __init__(self, word_manager, **game_params):
         self.word_manager = word_manager
         self.game_type = self._get_game_type()
-        self.config = config.CONFIGS[self.game_type]
+        self.config = word_manager.config.CONFIGS[self.game_type]
+        self.config.ensure_dirs()
+        self.word_manager.subscribe(self)
         
         # Load daily config if no params provided
         daily_config = None if game_params else self.LoadDailyConfig()
         self.InitializeGame(**(game_params or daily_config or {}))
 
     def _get_game_type(self) -> str:
-        """Get game type code from class name."""
-        for code, (_, class_name) in config.GAMES.items():
-            if class_name == self.__class__.__name__:
-                return code
-        raise GameConfigError(f"Unknown game type: {self.__class__.__name__}")
+        """Get game type code from the registry."""
+        code = registry.code_of(type(self))
+        if code is None:
+            raise GameConfigError(f"Unknown game type: {self.__class__.__name__}")
+        return code
 
     @abstractmethod
     def validate_game_specific(self, word: str) -> bool:
@@ -39,16 +45,60 @@ class Game(ABC):
     @abstractmethod
     def InitializeGame(self, **params): pass
 
+    def filter_kernel(self, table):
+        """
+        Candidate rows of the shared WordFeatureTable for this puzzle.
+
+        Games compile their puzzle into masks once in InitializeGame and look
+        candidates up through the table's indexes (letter-set order, prefix
+        trie) instead of scanning every word. Return row numbers, which may
+        include rows validate_game_specific still rejects, or None to fall
+        back to per-word checks over the whole word list.
+        """
+        return None
+
     def FindValidWords(self):
         """Cache and return valid words."""
         if not hasattr(self, '_word_cache'):
-            word_list = self.word_manager.GetWordList(self.game_type)
-            self._word_cache = {
-                word for word in word_list
-                if self.ValidateWord(word)
-            }
+            with metrics.stage('get_word_list', game=self.game_type):
+                table = self.word_manager.GetFeatureTable(self.game_type)
+            with metrics.stage('filter', game=self.game_type):
+                rows = self.filter_kernel(table)
+                if rows is None:
+                    candidates = self.word_manager.GetWordList(self.game_type)
+                else:
+                    metrics.count('words_scanned', len(rows))
+                    rows = rows[table.active(self.game_type)[rows] & (table.length[rows] >= self.config.min_length)]
+                    candidates = table.select_rows(rows)
+                self._word_cache = {
+                    word for word in candidates
+                    if self.ValidateWord(word)
+                }
+            metrics.count('words_validated', len(candidates))
+            metrics.count('words_valid', len(self._word_cache))
         return self._word_cache
 
+    def PuzzleKey(self):
+        """
+        Normalized form of the puzzle, equal for puzzles with the same answers.
+
+        Used to key cached results; None disables caching for the game.
+        """
+        return None
+
+    def GetResult(self) -> dict:
+        """JSON-serializable solved state, restorable with RestoreResult."""
+        return {'words': sorted(self.FindValidWords())}
+
+    def RestoreResult(self, result: dict) -> None:
+        """Adopt a cached result instead of solving."""
+        self._word_cache = set(result['words'])
+
+    def on_invalid_words(self, words) -> None:
+        """Drop newly invalid words from the cached valid words."""
+        if hasattr(self, '_word_cache'):
+            self._word_cache.difference_update(words)
+
     @abstractmethod
     def GetGameRules(self): pass
 
@@ -58,7 +108,7 @@ class Game(ABC):
         self.word_manager.SaveDailyData(self.game_type, config)
 
     def LoadDailyConfig(self):
-        """Load and validate daily configuration."""
+        """Load daily configuration (validated by WordManager.LoadDailyData)."""
         config = self.word_manager.LoadDailyData(self.game_type)
         if not config:
             raise GameConfigError(f"No daily configuration found for {self.game_type}")
@@ -1,7 +1,20 @@
 from Games.Game import Game
-from typing import Set
+from Games.LetterBoxedSolver import LetterBoxedSolver
+from utils.errors import GameConfigError, SolverBudgetError
+from utils.instrumentation import metrics
+from utils.letter_index import letter_mask, letters_to_mask
+from utils.word_features import pair_mask
+from typing import Callable, Dict, Iterator, List, Optional, Set
+from itertools import islice
+import logging
+import numpy as np
+
+logger = logging.getLogger(__name__)
 
 class LetterBoxed(Game):
+    # Processes for the path search of 3+ words; None searches serially
+    solver_workers: Optional[int] = None
+
     def InitializeGame(self, **data):
         # Convert the JSON data format into a list of sides
         sides = [data['TOP'], data['LEFT'], data['BOTTOM'], data['RIGHT']]
@@ -14,6 +27,18 @@ class LetterBoxed(Game):
             char: idx for idx, side in enumerate(self.sides)
             for char in side
         }
+        # Consecutive letters from the same side are forbidden pairs; both
+        # masks are built once per board and reused by every word check
+        self.allowed_mask = letters_to_mask(self.allowed_chars)
+        self.forbidden_pairs = pair_mask(
+            (a, b) for side in self.sides for a in side for b in side
+        )
+        # The same bitset as one Python int, for checking single words
+        self._forbidden_pair_bits = int.from_bytes(self.forbidden_pairs.astype('<u8').tobytes(), 'little')
+
+    def PuzzleKey(self) -> str:
+        # Side order and letter order within a side do not change the answers
+        return '|'.join(sorted(''.join(sorted(side)) for side in self.sides))
 
     def GetValidationParams(self):
         return {
@@ -32,106 +57,128 @@ class LetterBoxed(Game):
         )
 
     def validate_game_specific(self, word: str) -> bool:
-        return (all(c in self.allowed_chars for c in word) and
-                all(self.char_to_side[word[i]] != self.char_to_side[word[i + 1]] 
-                    for i in range(len(word) - 1)))
+        if letter_mask(word) & ~self.allowed_mask:
+            return False
+        forbidden = self._forbidden_pair_bits
+        return not any(
+            forbidden >> ((ord(word[i]) - 97) * 26 + ord(word[i + 1]) - 97) & 1
+            for i in range(len(word) - 1)
+        )
+
+    def filter_kernel(self, table):
+        # Walk the dictionary's prefix trie along the side constraints, so
+        # only rows under a playable opening are checked letter by letter
+        rows = table.prefix_rows(self._next_side, None)
+        if rows is None:
+            return np.flatnonzero(table.letters_within(self.allowed_mask) &
+                                  table.avoids_pairs(self.forbidden_pairs))
+
+        keep = table.letters_within(self.allowed_mask, rows) & table.avoids_pairs(self.forbidden_pairs, rows)
+        return rows[keep]
+
+    def _next_side(self, side: Optional[int], letter: str) -> Optional[int]:
+        """Side of letter if it can follow a letter on side, else None."""
+        next_side = self.char_to_side.get(letter)
+        return None if next_side == side else next_side
 
     def FindValidWords(self) -> Set[str]:
-        """Override to find valid words and calculate solution path."""
+        """Override to find valid words and calculate solution path once."""
         valid_words = super().FindValidWords()
-        self.solution_path = self.find_solution_path(valid_words)
+        if not hasattr(self, 'solution_path'):
+            self.solution_path = self.find_solution_path(valid_words)
         return valid_words
 
+    def GetResult(self) -> Dict:
+        result = super().GetResult()
+        result['solution_path'] = self.solution_path
+        return result
+
+    def RestoreResult(self, result: Dict) -> None:
+        super().RestoreResult(result)
+        self.solution_path = result.get('solution_path') or []
+
+    def on_invalid_words(self, words) -> None:
+        """Drop newly invalid words, re-solving only if the solution path used one of them."""
+        cached = getattr(self, '_word_cache', set())
+        removed = [word for word in words if word in cached]
+        super().on_invalid_words(words)
+        if not removed:
+            return
+        if any(word in getattr(self, 'solution_path', []) for word in removed):
+            self.solution_path = self.find_solution_path(self._word_cache)
+        else:
+            # Removing words cannot shorten the path, so it still stands; only
+            # the solver's word index (used to enumerate solutions) is stale
+            self.__dict__.pop('solver', None)
+
     def find_solution_path(self, words: Set[str]) -> list:
-        """Find the shortest solution path that uses all letters."""
-        if not words:
-            return []
-
-        # Create optimized word connections dictionary with letter coverage
-        word_connections = {}
-        word_letters = {}
-        for word in words:
-            word_letters[word] = set(word)
-            word_connections[word] = {
-                w for w in words 
-                if w[0] == word[-1]
-            }
-
-        # Try increasing path lengths until solution found
-        target_chars = set(self.allowed_chars)
-        max_path_length = 6
-
-        for path_length in range(1, max_path_length + 1):
-            # Start with words that cover more unique letters
-            start_words = sorted(
-                words,
-                key=lambda w: len(word_letters[w] & target_chars),
-                reverse=True
-            )
-
-            for start_word in start_words:
-                path = self._find_optimal_path(
-                    start_word,
-                    target_chars,
-                    word_connections,
-                    word_letters,
-                    [],
-                    path_length
-                )
-                if path:
-                    return path
-
-        return []
-
-    def _find_optimal_path(
-        self, 
-        word: str,
-        target_chars: set,
-        connections: dict,
-        word_letters: dict,
-        current_path: list,
-        target_length: int,
-        memo: dict = None
-    ) -> list:
-        """Recursively find the optimal path with pruning and memoization."""
-        if memo is None:
-            memo = {}
-
-        current_path = current_path + [word]
-        remaining = target_chars - set.union(*[word_letters[w] for w in current_path])
-
-        # Early termination if we can't cover remaining letters
-        if len(current_path) == target_length:
-            return current_path if not remaining else None
-
-        # Check if we need more words than we have length for
-        min_words_needed = len(remaining) // max(len(w) for w in connections[word])
-        if len(current_path) + min_words_needed > target_length:
+        """Find a proven-shortest solution path that uses all letters."""
+        with metrics.stage('find_solution_path', game=self.game_type):
+            self.solver = LetterBoxedSolver(words, self.allowed_chars, workers=self.solver_workers)
+            if not words:
+                return []
+
+            try:
+                return self.solver.solve()
+            except SolverBudgetError as e:
+                logger.warning(f"No Letter Boxed solution: {e}")
+                return []
+            finally:
+                metrics.count_all('lb_solver', self.solver.stats)
+
+    def iter_solutions(
+        self,
+        max_words: int = 3,
+        rank_by: Optional[str] = 'letters',
+        word_scores: Optional[Dict[str, float]] = None,
+        limit: Optional[int] = None
+    ) -> Iterator[List[str]]:
+        """
+        Lazily yield every 1- to max_words-word solution, fewest words first.
+
+        Within each word count, rank_by='letters' orders paths by total letters
+        (shortest first) and rank_by='frequency' by the summed word_scores
+        (highest first); rank_by=None streams them unranked. Stops after
+        limit paths, having only searched as far as those needed.
+        """
+        word_cost = self._word_cost(rank_by, word_scores)
+        solutions = self._get_solver().iter_solutions(max_words, word_cost)
+        yield from islice(solutions, limit)
+
+    def find_all_solutions(
+        self,
+        max_words: int = 3,
+        limit_per_count: Optional[int] = None,
+        rank_by: Optional[str] = 'letters',
+        word_scores: Optional[Dict[str, float]] = None
+    ) -> Dict[int, List[List[str]]]:
+        """Collect ranked solutions as {word_count: [paths]} for display_letter_boxed_path."""
+        word_cost = self._word_cost(rank_by, word_scores)
+        solver = self._get_solver()
+        solutions = {}
+        for depth in range(1, max_words + 1):
+            ranked = solver.iter_solutions_of_length(depth, word_cost)
+            paths = list(islice(ranked, limit_per_count))
+            if paths:
+                solutions[depth] = paths
+        return solutions
+
+    def _get_solver(self) -> LetterBoxedSolver:
+        if not hasattr(self, 'solver'):
+            self.FindValidWords()
+        if not hasattr(self, 'solver'):
+            # Restored from a cached result, so no search has run yet
+            self.solver = LetterBoxedSolver(self._word_cache, self.allowed_chars, workers=self.solver_workers)
+        return self.solver
+
+    @staticmethod
+    def _word_cost(rank_by: Optional[str], word_scores: Optional[Dict[str, float]]) -> Optional[Callable[[str], float]]:
+        """Map a ranking name to a per-word cost; lower totals rank first."""
+        if rank_by is None:
             return None
-
-        # Create state key for memoization
-        state = (word, frozenset(remaining), len(current_path))
-        if state in memo:
-            return memo[state]
-
-        # Sort next words by coverage of remaining letters
-        next_words = sorted(
-            [w for w in connections[word] if w not in current_path],
-            key=lambda w: len(word_letters[w] & remaining),
-            reverse=True
-        )
-
-        for next_word in next_words:
-            result = self._find_optimal_path(
-                next_word,
-                target_chars,
-                connections,
-                word_letters,
-                current_path,
-                target_length,
-                memo
-            )
-            if result:
-                return result
-
-        return None
\ No newline at end of file
+        if rank_by == 'letters':
+            return len
+        if rank_by == 'frequency':
+            scores = word_scores or {}
+            return lambda word: -scores.get(word, 0.0)
+        raise GameConfigError(f"Unknown Letter Boxed ranking: {rank_by}")
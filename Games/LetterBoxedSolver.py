@@ -0,0 +1,721 @@
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from itertools import count, product
+import heapq
+import logging
+import multiprocessing
+import time
+
+from utils.errors import SolverBudgetError
+
+# (first letter, last letter, coverage mask)
+WordClass = Tuple[str, str, int]
+# (last letter, covered mask)
+State = Tuple[str, int]
+# (last letter, mask still to cover, words left)
+TableKey = Tuple[str, int, int]
+
+logger = logging.getLogger(__name__)
+
+# Solver and shared bound inherited by (or sent to) parallel search workers
+_partition_state: Dict = {}
+
+
+class _SearchCancelled(Exception):
+    """Raised inside a partition worker once a better partition has a solution."""
+
+
+class TranspositionTable:
+    """
+    Bounded LRU map from (last letter, remaining mask, words left) to whether
+    the remaining letters can be covered with exactly that many more words.
+
+    One table is shared by every start word, deepening level and path
+    enumeration of a solver, so each sub-problem is solved once while it stays
+    resident; the least recently used entries are evicted past max_entries.
+    """
+
+    def __init__(self, max_entries: int, stats: Dict[str, int]):
+        self.max_entries = max_entries
+        self.stats = stats
+        self._entries: 'OrderedDict[TableKey, bool]' = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: TableKey) -> Optional[bool]:
+        found = self._entries.get(key)
+        if found is not None:
+            self._entries.move_to_end(key)
+            self.stats['table_hits'] += 1
+        return found
+
+    def put(self, key: TableKey, found: bool) -> None:
+        self._entries[key] = found
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats['table_evictions'] += 1
+
+
+class LetterBoxedSolver:
+    """
+    Exact minimum-word solver for Letter Boxed.
+
+    Words are compressed into classes sharing (first letter, last letter,
+    coverage mask) over the board's letters, and a breadth-first search runs
+    over (last letter, covered mask) states. BFS levels are word counts, so
+    the first level that can reach the full mask is the proven minimum.
+
+    strategy='dfs' instead runs an iterative-deepening depth-first search
+    whose memory is bounded by the transposition table (max_table_entries);
+    the default 'bfs' falls back to it when BFS exceeds max_states.
+
+    With workers > 1, searches of three or more words run depth-first across a
+    process pool, one partition per first letter, and return the same path
+    as strategy='dfs'.
+
+    Attributes:
+        letters (list[str]): Board letters, one bit each in coverage masks
+        full_mask (int): Mask with every board letter covered
+        classes (dict): Word class -> sorted words in that class
+        stats (dict): Search counters (classes, states, expansions, memo_hits,
+            table_hits, table_evictions)
+
+    The search is bounded by time_budget seconds and by max_states stored
+    states and lookup entries; exceeding either raises SolverBudgetError.
+    """
+
+    def __init__(
+        self,
+        words: Iterable[str],
+        letters: Iterable[str],
+        max_words: int = 6,
+        time_budget: float = 10.0,
+        max_states: int = 2_000_000,
+        strategy: str = 'bfs',
+        max_table_entries: int = 200_000,
+        workers: Optional[int] = None
+    ):
+        self.letters = sorted(set(letters))
+        self.bits = {c: 1 << i for i, c in enumerate(self.letters)}
+        self.full_mask = (1 << len(self.letters)) - 1
+        self.max_words = max_words
+        self.time_budget = time_budget
+        self.max_states = max_states
+        self.strategy = strategy
+        self.workers = workers
+
+        self.classes: Dict[WordClass, List[str]] = {}
+        for word in words:
+            if not word or any(c not in self.bits for c in word):
+                continue
+            self.classes.setdefault((word[0], word[-1], self.word_mask(word)), []).append(word)
+        for group in self.classes.values():
+            group.sort()
+
+        # Classes by first letter, and by first letter then exact mask
+        self._starting: Dict[str, List[WordClass]] = {}
+        self._starting_by_mask: Dict[str, Dict[int, List[WordClass]]] = {}
+        for key in sorted(self.classes):
+            self._starting.setdefault(key[0], []).append(key)
+            self._starting_by_mask.setdefault(key[0], {}).setdefault(key[2], []).append(key)
+
+        self._covering_memo: Dict[State, List[WordClass]] = {}
+        self._transitions: Optional[Dict[str, List[WordClass]]] = None
+        self._witness: Optional[Tuple[int, List[WordClass]]] = None
+        self._path: Optional[Tuple[int, List[str]]] = None
+        self._deadline = 0.0
+        self._cancelled: Optional[Callable[[], bool]] = None
+        self.stats = {
+            'classes': len(self.classes), 'states': 0, 'expansions': 0,
+            'memo_hits': 0, 'table_hits': 0, 'table_evictions': 0
+        }
+        self._table = TranspositionTable(max_table_entries, self.stats)
+
+    def word_mask(self, word: str) -> int:
+        mask = 0
+        for c in word:
+            mask |= self.bits[c]
+        return mask
+
+    def minimum_word_count(self) -> int:
+        """Proven minimum number of words without repeats, or 0 if no solution within max_words."""
+        return self._solution()[0]
+
+    def solve(self) -> List[str]:
+        """Return one minimum-length solution path, or [] if none exists."""
+        return list(self._solution()[1])
+
+    def solve_all(self, max_solutions: Optional[int] = None) -> List[List[str]]:
+        """Return every minimum-length solution path, up to max_solutions."""
+        solutions = []
+        for path in self.iter_minimal_solutions():
+            solutions.append(path)
+            if max_solutions is not None and len(solutions) >= max_solutions:
+                break
+        return solutions
+
+    def iter_minimal_solutions(self) -> Iterator[List[str]]:
+        """Lazily yield minimum-length solutions without repeated words."""
+        depth = self.minimum_word_count()
+        if not depth:
+            return
+        self._start_clock()
+        for class_path in self.iter_class_paths(depth):
+            for path in product(*(self.classes[key] for key in class_path)):
+                if len(set(path)) == depth:
+                    yield list(path)
+
+    def _solution(self) -> Tuple[int, List[str]]:
+        """
+        The minimum word count and one path using no word twice.
+
+        The searches ignore word reuse, so their depth is only a lower bound:
+        when every word choice along the witness repeats a word, the class
+        paths of that depth are enumerated, then deeper ones up to max_words.
+        """
+        if self._path is None:
+            depth, class_path = self._search()
+            self._path = (0, [])
+            if depth:
+                self._path = next(self._distinct_paths([class_path]), None) or self._deepen(depth)
+        return self._path
+
+    def _deepen(self, first_depth: int) -> Tuple[int, List[str]]:
+        self._start_clock()
+        for depth in range(first_depth, self.max_words + 1):
+            found = next(self._distinct_paths(self.iter_class_paths(depth)), None)
+            if found:
+                return found
+        return 0, []
+
+    def _distinct_paths(self, class_paths: Iterable[List[WordClass]]) -> Iterator[Tuple[int, List[str]]]:
+        """(depth, path) for each word choice along class_paths that uses no word twice."""
+        for class_path in class_paths:
+            for path in product(*(self.classes[key] for key in class_path)):
+                if len(set(path)) == len(path):
+                    yield len(path), list(path)
+
+    def iter_solutions(
+        self,
+        max_words: int = 3,
+        word_cost: Optional[Callable[[str], float]] = None
+    ) -> Iterator[List[str]]:
+        """
+        Lazily yield every solution of 1 to max_words words, fewest words first.
+
+        Without word_cost, solutions stream in enumeration order and memory
+        stays proportional to the search depth. With word_cost, each word
+        count is yielded by ascending total cost (ties by path) from one
+        best-first frontier, so drawing n solutions does work proportional to
+        the solutions and prefixes no costlier than the n-th, and memory grows
+        with what has been drawn rather than with every solution that exists.
+        """
+        for depth in range(1, max_words + 1):
+            yield from self.iter_solutions_of_length(depth, word_cost)
+
+    def iter_solutions_of_length(
+        self,
+        depth: int,
+        word_cost: Optional[Callable[[str], float]] = None
+    ) -> Iterator[List[str]]:
+        """Lazily yield every depth-word solution, ranked as in iter_solutions."""
+        if word_cost is None:
+            class_paths = self.iter_class_paths(depth)
+            while True:
+                with self._unbounded():
+                    class_path = next(class_paths, None)
+                if class_path is None:
+                    return
+                for path in product(*(self.classes[key] for key in class_path)):
+                    if len(set(path)) == depth:
+                        yield list(path)
+
+        ranked = self._iter_ranked(depth, word_cost)
+        while True:
+            with self._unbounded():
+                path = next(ranked, None)
+            if path is None:
+                return
+            yield path
+
+    @contextmanager
+    def _unbounded(self) -> Iterator[None]:
+        """
+        Lift the time budget for the enclosed work only.
+
+        Enumeration runs while its consumer waits, so only the memory budget
+        applies; the deadline is restored before control returns to the
+        consumer, so searches started meanwhile keep their budget.
+        """
+        deadline, self._deadline = self._deadline, float('inf')
+        try:
+            yield
+        finally:
+            self._deadline = deadline
+
+    def _iter_ranked(self, depth: int, word_cost: Callable[[str], float]) -> Iterator[List[str]]:
+        """
+        Best-first enumeration of depth-word solutions by (total cost, path).
+
+        A chain of classes is ranked by its cost plus the exact cheapest cost
+        of finishing it (memoized per (last letter, missing letters, words
+        left)), so only chains on the way to the next solution are expanded.
+        Each expanded chain hands out its continuations in rank order through
+        one heap cursor, and a complete chain becomes a cursor over its word
+        choices (each class's words sorted by cost) whose successors advance
+        one position at or after the last one advanced. Every pop therefore
+        pushes at most a few entries, and nothing ranks before its parent.
+        """
+        ranked_words = {
+            key: sorted((word_cost(word), word) for word in words)
+            for key, words in self.classes.items()
+        }
+        class_cost = {key: words[0][0] for key, words in ranked_words.items()}
+        by_cost = {
+            first: sorted(keys, key=lambda key: (class_cost[key], key))
+            for first, keys in self._starting.items()
+        }
+        floor = min(class_cost.values(), default=0.0)
+        finish_memo: Dict[TableKey, float] = {}
+
+        def finish_cost(last: str, need: int, words: int) -> float:
+            """Cheapest cost of covering need with exactly `words` more words from last."""
+            if words == 0:
+                return 0.0 if need == 0 else float('inf')
+            state = (last, need, words)
+            if state not in finish_memo:
+                if words == 1:
+                    best = min((class_cost[key] for key in self.covering(last, need)), default=float('inf'))
+                else:
+                    best = float('inf')
+                    for key in by_cost.get(last, ()):
+                        cost = class_cost[key]
+                        if cost + (words - 1) * floor >= best:
+                            break
+                        best = min(best, cost + finish_cost(key[1], need & ~key[2], words - 1))
+                finish_memo[state] = best
+                self._check_budget(len(finish_memo))
+            return finish_memo[state]
+
+        all_by_cost = sorted(self.classes, key=lambda key: (class_cost[key], key))
+
+        def continuations(first: Optional[str], covered: int, cost: float,
+                          words: int) -> Iterator[Tuple[float, WordClass]]:
+            """
+            Next classes of a chain (any class if first is None), by cheapest finished cost.
+
+            Classes are scanned in order of their own cost, and one is yielded
+            once no class still unscanned can finish more cheaply, so exact
+            finishing costs are only computed as far as the consumer reads.
+            """
+            if words == 1:
+                # The last class must cover everything still missing
+                yield from sorted((cost + class_cost[key], key)
+                                  for key in self.covering(first, self.full_mask & ~covered))
+                return
+            pending: List[Tuple[float, WordClass]] = []
+            for key in (by_cost.get(first, ()) if first is not None else all_by_cost):
+                lower = cost + class_cost[key] + (words - 1) * floor
+                while pending and pending[0][0] <= lower:
+                    yield heapq.heappop(pending)
+                rank = cost + class_cost[key] + finish_cost(key[1], self.full_mask & ~(covered | key[2]), words - 1)
+                if rank != float('inf'):
+                    heapq.heappush(pending, (rank, key))
+            while pending:
+                yield heapq.heappop(pending)
+
+        counter = count()
+        # (rank, kind, tiebreak, payload): chain cursors (kind 0) are expanded
+        # before word choices (kind 1) of equal cost, which tie-break on path
+        heap: list = []
+
+        def push_cursor(class_path: Tuple[WordClass, ...], covered: int, cost: float, found) -> None:
+            following = next(found, None)
+            if following is not None:
+                heapq.heappush(heap, (following[0], 0, next(counter), (class_path, covered, cost, found, following[1])))
+
+        def push_chains(class_path: Tuple[WordClass, ...], covered: int, cost: float) -> None:
+            first = class_path[-1][1] if class_path else None
+            push_cursor(class_path, covered, cost, continuations(first, covered, cost, depth - len(class_path)))
+
+        def push_choice(class_path: Tuple[WordClass, ...], indices: Tuple[int, ...], pivot: int) -> None:
+            choice = [ranked_words[key][i] for key, i in zip(class_path, indices)]
+            heapq.heappush(heap, (sum(cost for cost, _ in choice), 1,
+                                  tuple(word for _, word in choice), (class_path, indices, pivot)))
+
+        push_chains((), 0, 0.0)
+        while heap:
+            _, kind, path, payload = heapq.heappop(heap)
+            if kind == 0:
+                class_path, covered, cost, found, key = payload
+                push_cursor(class_path, covered, cost, found)
+                if len(class_path) + 1 == depth:
+                    push_choice(class_path + (key,), (0,) * depth, 0)
+                else:
+                    push_chains(class_path + (key,), covered | key[2], cost + class_cost[key])
+                self._check_budget(len(heap))
+                continue
+
+            class_path, indices, pivot = payload
+            for i in range(pivot, depth):
+                if indices[i] + 1 < len(ranked_words[class_path[i]]):
+                    push_choice(class_path, indices[:i] + (indices[i] + 1,) + indices[i + 1:], i)
+            if len(set(path)) == depth:
+                yield list(path)
+
+    def iter_class_paths(
+        self,
+        depth: int,
+        class_cost: Optional[Dict[WordClass, float]] = None,
+        bound: Optional[Callable[[], float]] = None
+    ) -> Iterator[List[WordClass]]:
+        """
+        Yield every chained sequence of depth word classes covering all letters.
+
+        With class_cost (the cheapest word of each class) and bound, prefixes
+        whose cheapest completion already costs more than bound() are skipped.
+        """
+        if class_cost is None:
+            starting = self._starting
+            first_keys = sorted(self.classes)
+            cost_of = lambda key: 0.0
+            floor = 0.0
+            bound = lambda: float('inf')
+        else:
+            starting = {
+                first: sorted(keys, key=class_cost.__getitem__)
+                for first, keys in self._starting.items()
+            }
+            first_keys = sorted(self.classes, key=class_cost.__getitem__)
+            cost_of = class_cost.__getitem__
+            floor = min(class_cost.values(), default=0.0)
+
+        if depth == 1:
+            for key in first_keys:
+                if key[2] == self.full_mask and cost_of(key) <= bound():
+                    yield [key]
+            return
+
+        def can_finish(last: str, covered: int, remaining: int) -> bool:
+            return self._can_finish(last, self.full_mask & ~covered, remaining)
+
+        def extend(last: str, covered: int, remaining: int, cost: float) -> Iterator[List[WordClass]]:
+            if remaining == 1:
+                for key in self.covering(last, self.full_mask & ~covered):
+                    if cost + cost_of(key) <= bound():
+                        yield [key]
+                return
+            for key in starting.get(last, ()):
+                next_cost = cost + cost_of(key)
+                if next_cost + (remaining - 1) * floor > bound():
+                    break
+                next_covered = covered | key[2]
+                if can_finish(key[1], next_covered, remaining - 1):
+                    for rest in extend(key[1], next_covered, remaining - 1, next_cost):
+                        yield [key] + rest
+
+        for key in first_keys:
+            if cost_of(key) + (depth - 1) * floor > bound():
+                break
+            if can_finish(key[1], key[2], depth - 1):
+                for rest in extend(key[1], key[2], depth - 1, cost_of(key)):
+                    yield [key] + rest
+
+    def covering(self, first: str, need: int) -> List[WordClass]:
+        """Classes starting with first whose letters include every bit of need."""
+        state = (first, need)
+        if state in self._covering_memo:
+            self.stats['memo_hits'] += 1
+        else:
+            by_mask = self._starting_by_mask.get(first, {})
+            free = self.full_mask & ~need
+            if (1 << bin(free).count('1')) < len(by_mask):
+                # Fewer supersets of need than distinct masks: enumerate them
+                found = []
+                sub = free
+                while True:
+                    found.extend(by_mask.get(sub | need, ()))
+                    if sub == 0:
+                        break
+                    sub = (sub - 1) & free
+            else:
+                found = [
+                    key for mask, keys in by_mask.items()
+                    if mask & need == need
+                    for key in keys
+                ]
+            found.sort()
+            self._covering_memo[state] = found
+        return self._covering_memo[state]
+
+    def _search(self) -> Tuple[int, List[WordClass]]:
+        if self._witness is None:
+            self._start_clock()
+            reachable = 0
+            for key in self.classes:
+                reachable |= key[2]
+            if reachable != self.full_mask:
+                # Some letter appears in no word
+                self._witness = (0, [])
+            elif self.workers and self.workers > 1:
+                self._witness = self._parallel_iddfs()
+            elif self.strategy == 'dfs':
+                self._witness = self._iddfs()
+            else:
+                try:
+                    self._witness = self._bfs()
+                except SolverBudgetError as e:
+                    if time.perf_counter() > self._deadline:
+                        raise
+                    # Out of state budget: retry depth-first in bounded memory
+                    logger.debug(f"{e}; falling back to depth-first search")
+                    self._witness = self._iddfs()
+        return self._witness
+
+    def _start_clock(self) -> None:
+        self._deadline = time.perf_counter() + self.time_budget
+
+    def _check_budget(self, stored: int) -> None:
+        if stored > self.max_states:
+            raise SolverBudgetError(f"Letter Boxed search exceeded {self.max_states} states")
+        self._check_time()
+
+    def _check_time(self) -> None:
+        if time.perf_counter() > self._deadline:
+            raise SolverBudgetError(f"Letter Boxed search exceeded {self.time_budget}s budget")
+
+    def _get_transitions(self) -> Dict[str, List[WordClass]]:
+        """Non-dominated classes by first letter."""
+        if self._transitions is None:
+            self._transitions = {
+                first: self._maximal(keys) for first, keys in self._starting.items()
+            }
+        return self._transitions
+
+    def _can_finish(self, last: str, need: int, words: int) -> bool:
+        """Whether exactly `words` more words from `last` can cover every bit of need."""
+        if words == 0:
+            return need == 0
+        if words == 1:
+            return bool(self.covering(last, need))
+
+        key = (last, need, words)
+        found = self._table.get(key)
+        if found is None:
+            self._check_time()
+            self.stats['expansions'] += 1
+            if self._cancelled is not None and self.stats['expansions'] & 255 == 0 and self._cancelled():
+                raise _SearchCancelled()
+            # Dominated classes end at the same letter with less coverage, so
+            # checking the maximal ones is exact
+            found = any(
+                self._can_finish(cls[1], need & ~cls[2], words - 1)
+                for cls in self._get_transitions().get(last, ())
+            )
+            self._table.put(key, found)
+        return found
+
+    def _finish_path(self, last: str, need: int, words: int) -> List[WordClass]:
+        """Classes completing a finishable (last, need, words) sub-problem."""
+        path = []
+        while words > 1:
+            for cls in self._get_transitions().get(last, ()):
+                if self._can_finish(cls[1], need & ~cls[2], words - 1):
+                    path.append(cls)
+                    last, need, words = cls[1], need & ~cls[2], words - 1
+                    break
+            else:
+                return []
+        if words == 1:
+            path.append(self.covering(last, need)[0])
+        return path
+
+    def _iddfs(
+        self,
+        starts: Optional[List[WordClass]] = None,
+        first_depth: int = 1,
+        last_depth: Optional[int] = None
+    ) -> Tuple[int, List[WordClass]]:
+        """
+        Iterative-deepening DFS for the minimum word count and one witness path.
+
+        Each level asks whether any start class can be finished in exactly
+        depth - 1 more words; sub-problem answers persist in the transposition
+        table across start classes and levels.
+        """
+        if starts is None:
+            starts = self._maximal(list(self.classes))
+        for depth in range(first_depth, (last_depth or self.max_words) + 1):
+            for key in starts:
+                need = self.full_mask & ~key[2]
+                if self._can_finish(key[1], need, depth - 1):
+                    return depth, [key] + self._finish_path(key[1], need, depth - 1)
+        return 0, []
+
+    def _bfs(self) -> Tuple[int, List[WordClass]]:
+        """
+        Level-by-level BFS for the minimum word count and one witness path.
+
+        A class is dropped if another class with the same end letters covers a
+        superset of its letters, and a state is dropped if a state with the
+        same last letter and a superset of its coverage was already reached.
+        Neither can shorten a solution, so the level count stays exact.
+        """
+        transitions = self._get_transitions()
+
+        parents: Dict[State, Tuple[Optional[State], WordClass]] = {}
+        reached: Dict[str, List[int]] = {}
+        frontier: List[State] = []
+        for key in self._maximal(list(self.classes)):
+            state = (key[1], key[2])
+            if self._admit(state, reached):
+                parents[state] = (None, key)
+                frontier.append(state)
+
+        depth = 1
+        while frontier:
+            self.stats['states'] = len(parents)
+            for state in frontier:
+                if state[1] == self.full_mask:
+                    return depth, self._unwind(state, parents)
+            if depth == self.max_words:
+                break
+
+            # One more word finishes from any state whose missing letters
+            # are all covered by a single class starting at its last letter
+            for state in frontier:
+                finishing = self.covering(state[0], self.full_mask & ~state[1])
+                if finishing:
+                    return depth + 1, self._unwind(state, parents) + [finishing[0]]
+            if depth + 1 == self.max_words:
+                break
+
+            next_frontier: List[State] = []
+            for state in frontier:
+                self.stats['expansions'] += 1
+                covered = state[1]
+                for key in transitions.get(state[0], ()):
+                    next_state = (key[1], covered | key[2])
+                    if next_state not in parents and self._admit(next_state, reached):
+                        parents[next_state] = (state, key)
+                        next_frontier.append(next_state)
+                self._check_budget(len(parents) + len(self._covering_memo))
+
+            frontier = next_frontier
+            depth += 1
+
+        return 0, []
+
+    def _parallel_iddfs(self) -> Tuple[int, List[WordClass]]:
+        """
+        _iddfs with the start classes split by first letter across processes.
+
+        One and two words are checked serially, as they cost less than
+        starting the pool. Partitions are contiguous in start-class order, so
+        ranking results by (depth, partition) picks the path the serial search
+        finds first. The best rank so far is shared, and workers stop as soon
+        as they can no longer beat it.
+        """
+        found = self._iddfs(last_depth=min(2, self.max_words))
+        if found[0] or self.max_words <= 2:
+            return found
+
+        starts = self._maximal(list(self.classes))
+        partitions = sorted({key[0] for key in starts})
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context('fork' if 'fork' in methods else 'spawn')
+        count = len(partitions)
+        best = context.Value('q', (self.max_words + 1) * count)
+
+        with ProcessPoolExecutor(
+            max_workers=min(self.workers, count),
+            mp_context=context,
+            initializer=_init_partition_worker,
+            initargs=(self, best, count)
+        ) as pool:
+            futures = [pool.submit(_solve_partition, i, first) for i, first in enumerate(partitions)]
+            results = [future.result() for future in futures]
+
+        for name in ('expansions', 'table_hits', 'table_evictions'):
+            self.stats[name] += sum(stats[name] for _, _, stats in results)
+        solved = [(rank, path) for rank, path, _ in results if path]
+        if not solved:
+            return 0, []
+        rank, path = min(solved)
+        return rank // count, path
+
+    @staticmethod
+    def _maximal(keys: List[WordClass]) -> List[WordClass]:
+        """Keep classes whose mask is not contained in another with the same ends."""
+        groups: Dict[Tuple[str, str], List[WordClass]] = {}
+        for key in keys:
+            groups.setdefault((key[0], key[1]), []).append(key)
+
+        kept = []
+        for group in groups.values():
+            group.sort(key=lambda key: (-bin(key[2]).count('1'), key))
+            masks: List[int] = []
+            for key in group:
+                if not any(key[2] | mask == mask for mask in masks):
+                    masks.append(key[2])
+                    kept.append(key)
+        return sorted(kept)
+
+    @staticmethod
+    def _admit(state: State, reached: Dict[str, List[int]]) -> bool:
+        """Record a state unless one with the same last letter covers a superset."""
+        last, covered = state
+        masks = reached.setdefault(last, [])
+        if any(covered | mask == mask for mask in masks):
+            return False
+        masks.append(covered)
+        return True
+
+    @staticmethod
+    def _unwind(state: State, parents: Dict) -> List[WordClass]:
+        path = []
+        while state is not None:
+            state, key = parents[state]
+            path.append(key)
+        return path[::-1]
+
+
+def _init_partition_worker(solver: LetterBoxedSolver, best, count: int) -> None:
+    _partition_state['solver'] = solver
+    _partition_state['best'] = best
+    _partition_state['count'] = count
+
+
+def _solve_partition(index: int, first: str) -> Tuple[int, List[WordClass], Dict[str, int]]:
+    """
+    Search the start classes beginning with `first` from three words up.
+
+    Returns (depth * partitions + index, class path, stats); the path is
+    empty if the partition has no solution that could still be the best.
+    """
+    solver: LetterBoxedSolver = _partition_state['solver']
+    best = _partition_state['best']
+    count = _partition_state['count']
+    for name in ('expansions', 'table_hits', 'table_evictions'):
+        solver.stats[name] = 0
+
+    starts = [key for key in solver._maximal(list(solver.classes)) if key[0] == first]
+    solver._start_clock()
+    for depth in range(3, solver.max_words + 1):
+        rank = depth * count + index
+        if rank > best.value:
+            break
+        solver._cancelled = lambda: best.value < rank
+        try:
+            found_depth, path = solver._iddfs(starts, depth, depth)
+        except _SearchCancelled:
+            break
+        if found_depth:
+            with best.get_lock():
+                best.value = min(best.value, rank)
+            return rank, path, solver.stats
+    return 0, [], solver.stats
+
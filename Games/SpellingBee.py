@@ -1,6 +1,8 @@
-from typing import Set
+from typing import Dict
 from Games.Game import Game
 from config import config
+from utils.letter_index import letters_to_mask
+from utils.bee_scoring import score_words
 
 class SpellingBee(Game):
     """
@@ -17,6 +19,11 @@ class SpellingBee(Game):
     def InitializeGame(self, mandatory_char, optional_chars):
         self.mandatory_char = mandatory_char.lower()
         self.allowed_chars = set(optional_chars.lower() + self.mandatory_char)
+        self.mandatory_mask = letters_to_mask(self.mandatory_char)
+        self.allowed_mask = letters_to_mask(self.allowed_chars)
+
+    def PuzzleKey(self) -> str:
+        return f"{self.mandatory_char}:{''.join(sorted(self.allowed_chars - {self.mandatory_char}))}"
 
     def GetValidationParams(self):
         return {
@@ -30,4 +37,12 @@ class SpellingBee(Game):
 
     def validate_game_specific(self, word: str) -> bool:
         return (self.mandatory_char in word and 
-                all(c in self.allowed_chars for c in word))
\ No newline at end of file
+                all(c in self.allowed_chars for c in word))
+
+    def filter_kernel(self, table):
+        # Look candidates up by letter set in the table's mask index instead of scanning every word
+        return table.rows_with_letters(self.mandatory_mask, self.allowed_mask)
+
+    def Score(self) -> Dict:
+        """NYT-style maximum score, pangrams, rank thresholds and hint grids for the valid words."""
+        return score_words(self.mandatory_char, self.allowed_chars, self.FindValidWords())
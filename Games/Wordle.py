@@ -0,0 +1,95 @@
+from typing import Dict, List
+from Games.Game import Game
+from utils.errors import GameConfigError
+from utils.instrumentation import metrics
+from utils.wordle_feedback import WORD_LENGTH, feedback, pattern_code, pattern_string
+import numpy as np
+
+class Wordle(Game):
+    """
+    Wordle candidate filtering and guess suggestions.
+
+    The puzzle is the guesses played so far and the feedback shown for
+    each ('G' green, 'Y' yellow, 'B' gray). The valid words are the
+    remaining possible answers; BestGuesses ranks next guesses by how much
+    they are expected to narrow those down, using the shared, memory-mapped
+    feedback matrix (WordManager.GetFeedbackMatrix).
+
+    Attributes:
+        guesses (list[str]): Words played so far, in order
+        patterns (list[int]): Base-3 feedback code of each guess
+    """
+
+    # Guesses suggested by BestGuesses
+    suggestions: int = 5
+    # The valid words are possible answers, not ones the game has accepted
+    records_actual_words = False
+
+    def InitializeGame(self, guesses=(), feedback=()):
+        if len(guesses) != len(feedback):
+            raise GameConfigError("Every Wordle guess needs its feedback")
+        self.guesses = [guess.lower() for guess in guesses]
+        self.patterns = [pattern_code(pattern) for pattern in feedback]
+        if any(len(guess) != WORD_LENGTH or not guess.isalpha() for guess in self.guesses):
+            raise GameConfigError(f"Wordle guesses must be {WORD_LENGTH}-letter words")
+
+    def PuzzleKey(self) -> str:
+        # The remaining answers do not depend on the order guesses were played in
+        return '|'.join(sorted(f"{guess}:{pattern_string(pattern)}"
+                               for guess, pattern in zip(self.guesses, self.patterns)))
+
+    def GetValidationParams(self):
+        return {
+            'guesses': self.guesses,
+            'patterns': self.patterns
+        }
+
+    def GetGameRules(self):
+        played = ', '.join(f"{guess.upper()} {pattern_string(pattern)}"
+                           for guess, pattern in zip(self.guesses, self.patterns))
+        return (f"Wordle: {WORD_LENGTH}-letter answer consistent with every guess so far"
+                f"{': ' + played if played else ''}")
+
+    def validate_game_specific(self, word: str) -> bool:
+        return len(word) == WORD_LENGTH and all(
+            feedback(guess, word) == pattern for guess, pattern in zip(self.guesses, self.patterns)
+        )
+
+    def filter_kernel(self, table):
+        # One vectorized feedback row per guess against every five-letter word;
+        # the feedback matrix itself is only read for guess ranking
+        matrix = self.word_manager.GetFeedbackMatrix()
+        keep = np.ones(len(matrix), dtype=bool)
+        for guess, pattern in zip(self.guesses, self.patterns):
+            keep &= matrix.patterns(guess) == pattern
+        return matrix.rows[keep]
+
+    def BestGuesses(self) -> List[Dict]:
+        """The suggestions guesses expected to leave the fewest candidates (highest entropy, in bits)."""
+        if not hasattr(self, '_best_guesses'):
+            candidates = self.FindValidWords()
+            with metrics.stage('best_guesses', game=self.game_type):
+                matrix = self.word_manager.GetFeedbackMatrix()
+                table = self.word_manager.GetFeatureTable(self.game_type)
+                columns = matrix.indices([table.row(word) for word in sorted(candidates)])
+                guesses = np.flatnonzero(table.active(self.game_type)[matrix.rows])
+                metrics.count('wd_candidates', len(columns))
+                self._best_guesses = [
+                    {'word': table.word(int(matrix.rows[guess])), 'entropy': round(bits, 4)}
+                    for guess, bits in matrix.best_guesses(columns, guesses, self.suggestions)
+                ]
+        return self._best_guesses
+
+    def GetResult(self) -> dict:
+        return {**super().GetResult(), 'best_guesses': self.BestGuesses()}
+
+    def RestoreResult(self, result: dict) -> None:
+        super().RestoreResult(result)
+        if 'best_guesses' in result:
+            self._best_guesses = result['best_guesses']
+
+    def on_invalid_words(self, words) -> None:
+        super().on_invalid_words(words)
+        # Rankings may suggest (or count) a word that is no longer allowed
+        if hasattr(self, '_best_guesses'):
+            del self._best_guesses
@@ -0,0 +1,153 @@
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Type
+import importlib
+import re
+
+# Checks one field of a game's daily data
+Rule = Callable[[Any], bool]
+
+
+def letter_string(min_count: int, max_count: int) -> Rule:
+    """Rule for a string of min_count to max_count letters."""
+    def check(value) -> bool:
+        return isinstance(value, str) and min_count <= len(value) <= max_count and value.isalpha()
+    return check
+
+
+def upper_letter_list(count: int) -> Rule:
+    """Rule for a list of exactly count upper-case letters."""
+    def check(value) -> bool:
+        return (isinstance(value, list) and len(value) == count and
+                all(isinstance(l, str) and l.isalpha() and l.isupper() for l in value))
+    return check
+
+
+def string_list(pattern: str, max_count: int) -> Rule:
+    """Rule for a list of at most max_count strings, each fully matching pattern."""
+    compiled = re.compile(pattern)
+    def check(value) -> bool:
+        return (isinstance(value, list) and len(value) <= max_count and
+                all(isinstance(item, str) and compiled.fullmatch(item) for item in value))
+    return check
+
+
+@dataclass(frozen=True)
+class GameSpec:
+    """
+    Everything known about a game without importing it.
+
+    module and class_name locate the Game subclass, imported on first use;
+    schema maps each required daily-data field to the rule its value must
+    pass, so daily data can be checked before (or without) loading the game.
+    """
+    code: str
+    name: str
+    module: str
+    class_name: str
+    schema: Dict[str, Rule] = field(default_factory=dict)
+    min_length: int = 3
+    max_length: int = 15
+
+    def validate(self, data: dict) -> bool:
+        """Whether data has every schema field with an acceptable value."""
+        return isinstance(data, dict) and all(
+            key in data and rule(data[key]) for key, rule in self.schema.items()
+        )
+
+
+class GameRegistry(Mapping):
+    """
+    Game codes mapped to their Game subclasses, imported lazily.
+
+    Looking a code up imports its module the first time; membership,
+    iteration and spec() never do, so a run only pays for (and indexes the
+    dictionary for) the games it actually plays. Games are identified by
+    their class's module and name, so an instance finds its code with one
+    dict lookup whether or not other games were ever loaded.
+    """
+
+    def __init__(self):
+        self._specs: Dict[str, GameSpec] = {}
+        self._classes: Dict[str, Type] = {}
+        self._codes: Dict[Tuple[str, str], str] = {}
+
+    def register(self, spec: GameSpec) -> GameSpec:
+        """Add a game, replacing any earlier one with the same code."""
+        self._specs[spec.code] = spec
+        self._classes.pop(spec.code, None)
+        self._codes[(spec.module, spec.class_name)] = spec.code
+        return spec
+
+    def spec(self, code: str) -> GameSpec:
+        return self._specs[code]
+
+    def code_of(self, cls: Type) -> Optional[str]:
+        """Code of the registered game cls is, or derives from."""
+        for klass in cls.__mro__:
+            code = self._codes.get((klass.__module__, klass.__name__))
+            if code is not None:
+                return code
+        return None
+
+    @property
+    def loaded(self) -> List[str]:
+        """Codes of the games imported so far."""
+        return list(self._classes)
+
+    def __getitem__(self, code: str) -> Type:
+        cls = self._classes.get(code)
+        if cls is None:
+            spec = self._specs[code]
+            cls = getattr(importlib.import_module(spec.module), spec.class_name)
+            self._classes[code] = cls
+        return cls
+
+    def __contains__(self, code: object) -> bool:
+        return code in self._specs
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._specs)
+
+    def __len__(self) -> int:
+        return len(self._specs)
+
+    def __reduce__(self):
+        # Pickled by name: spawned workers use their own module-level registry
+        return 'registry'
+
+
+registry = GameRegistry()
+
+registry.register(GameSpec(
+    code='SB',
+    name='Spelling Bee',
+    module='Games.SpellingBee',
+    class_name='SpellingBee',
+    schema={
+        'mandatory_char': letter_string(1, 1),
+        'optional_chars': letter_string(1, 25)
+    },
+    min_length=4
+))
+
+registry.register(GameSpec(
+    code='LB',
+    name='Letter Boxed',
+    module='Games.LetterBoxed',
+    class_name='LetterBoxed',
+    schema={side: upper_letter_list(3) for side in ('TOP', 'LEFT', 'BOTTOM', 'RIGHT')}
+))
+
+registry.register(GameSpec(
+    code='WD',
+    name='Wordle',
+    module='Games.Wordle',
+    class_name='Wordle',
+    schema={
+        'guesses': string_list(r'[A-Za-z]{5}', 6),
+        'feedback': string_list(r'[GYBgyb012.\-_xX]{5}', 6)
+    },
+    min_length=5,
+    max_length=5
+))
@@ -0,0 +1,305 @@
+"""
+Offline benchmarks for dictionary loading and the game solvers.
+
+Replays the archived puzzles in Data/GameData/{SB,LB}/Daily/raw plus
+seeded synthetic Letter Boxed boards and Wordle games against a fixture
+dictionary, timing dictionary load, word filtering, path search and
+Wordle guess ranking separately. Results are
+written as JSON with sorted keys so two runs can be diffed directly:
+
+    python -m benchmarks.bench --output before.json
+    python -m benchmarks.bench --output after.json --compare before.json
+"""
+from typing import Callable, Dict, List, Optional
+from pathlib import Path
+import argparse
+import copy
+import json
+import logging
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from config import config
+from utils.dictionary_cache import DictionaryCache
+from utils.WordManager import WordManager
+from Games.Game import Game
+from Games.SpellingBee import SpellingBee
+from Games.LetterBoxed import LetterBoxed
+from Games.Wordle import Wordle
+from utils.wordle_feedback import FeedbackMatrix, feedback, pattern_string, vocabulary
+
+# Every 16th word of words_alpha.txt; see fixtures/README for how it is generated
+FIXTURE_DICTIONARY = Path(__file__).parent / "fixtures" / "words.txt"
+# Letters drawn for synthetic boards, most common first
+COMMON_LETTERS = "etaoinsrlcdupmhgbfywkv"
+# Rare letters leave no covering path, so the search must exhaust every state
+UNSOLVABLE_BOARD = {'TOP': ['J', 'Q', 'X'], 'LEFT': ['Z', 'V', 'K'],
+                    'BOTTOM': ['E', 'A', 'O'], 'RIGHT': ['W', 'Y', 'B']}
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of values."""
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered) + 0.5) - 1))
+    return ordered[rank]
+
+
+def summarize(samples: List[float], peak_bytes: Optional[int] = None) -> Dict:
+    """Reduce per-run seconds to millisecond statistics."""
+    ms = [s * 1000 for s in samples]
+    summary = {
+        'runs': len(ms),
+        'p50_ms': round(percentile(ms, 50), 3),
+        'p95_ms': round(percentile(ms, 95), 3),
+        'mean_ms': round(statistics.fmean(ms), 3),
+        'max_ms': round(max(ms), 3)
+    }
+    if peak_bytes is not None:
+        summary['peak_kb'] = round(peak_bytes / 1024, 1)
+    return summary
+
+
+def timed(fn: Callable):
+    """Run fn once, returning (result, seconds)."""
+    started = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - started
+
+
+def peak_memory(fn: Callable) -> int:
+    """Peak bytes allocated by Python during one run of fn."""
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def synthetic_boards(count: int, seed: int = 0) -> List[Dict]:
+    """Seeded Letter Boxed boards built from common letters (dense word graphs)."""
+    rng = random.Random(seed)
+    boards = []
+    for _ in range(count):
+        letters = [c.upper() for c in rng.sample(COMMON_LETTERS, 12)]
+        boards.append({
+            'TOP': letters[0:3], 'LEFT': letters[3:6],
+            'BOTTOM': letters[6:9], 'RIGHT': letters[9:12]
+        })
+    boards.append(UNSOLVABLE_BOARD)
+    return boards
+
+
+def archived_puzzles(game_type: str) -> List[Dict]:
+    """Every raw daily data file for a game, in file-name order."""
+    puzzles = []
+    for file in sorted(config.CONFIGS[game_type].raw_dir.glob(f"{game_type}_*.json")):
+        with open(file, 'r') as f:
+            puzzles.append(json.load(f))
+    return puzzles
+
+
+def bench_config(work_dir: Path, dictionary: Path):
+    """The global config with every data and dictionary path redirected into work_dir."""
+    dictionary_dir = work_dir / "Dictionary"
+    (dictionary_dir / "invalid").mkdir(parents=True, exist_ok=True)
+    bench = copy.copy(config)
+    # Game configs are rebuilt from the rebased paths; archived_puzzles still reads the real tree
+    bench._configs = None
+    bench.BASE_DATA_DIR = work_dir
+    bench.GAME_DATA_DIR = work_dir / "GameData"
+    bench.METRICS_DIR = work_dir / "metrics"
+    bench.RESULT_CACHE_DB = work_dir / "cache" / "results.sqlite3"
+    bench.DICTIONARY_DIR = dictionary_dir
+    bench.INVALID_WORDS_DIR = dictionary_dir / "invalid"
+    bench.WORD_LIST_FILE = Path(dictionary)
+    bench.COMPILED_DICTIONARY_FILE = dictionary_dir / "words_alpha.bin"
+    bench.ACTUAL_WORDS_DB = dictionary_dir / "actual_words.sqlite3"
+    bench.WORDLE_MATRIX_FILE = dictionary_dir / "wordle_feedback.npy"
+    return bench
+
+
+def bench_dictionary(cfg, repeat: int) -> Dict:
+    """Time compiling, memory-mapping, and a fresh WordManager's feature table."""
+    cache = DictionaryCache(cfg)
+    results = {}
+
+    compile_times = [timed(cache.compile)[1] for _ in range(max(1, repeat // 2))]
+    results['dictionary_compile'] = summarize(compile_times, peak_memory(cache.compile))
+
+    def load():
+        compiled = cache.load()
+        compiled.row('test')
+        return compiled
+    results['dictionary_load'] = summarize([timed(load)[1] for _ in range(repeat)], peak_memory(load))
+
+    def feature_table():
+        WordManager(cfg).GetFeatureTable('LB')
+    results['feature_table'] = summarize([timed(feature_table)[1] for _ in range(repeat)],
+                                         peak_memory(feature_table))
+    return results
+
+
+def bench_puzzles(word_manager: WordManager, puzzles: Dict[str, List[Dict]], repeat: int) -> Dict:
+    """Time filtering and Letter Boxed path search per puzzle."""
+    samples: Dict[str, List[float]] = {'sb_filter': [], 'lb_filter': [], 'lb_search': []}
+    peaks: Dict[str, int] = {name: 0 for name in samples}
+    expansions: List[int] = []
+    states: List[int] = []
+    unsolved = 0
+
+    for game_type, game_class in (('SB', SpellingBee), ('LB', LetterBoxed)):
+        for data in puzzles.get(game_type, []):
+            for run in range(repeat + 1):
+                game = game_class(word_manager, **data)
+                # Game.FindValidWords is the filter alone; LetterBoxed's override also searches
+                filter_fn = lambda: Game.FindValidWords(game) if game_type == 'LB' else game.FindValidWords()
+                if run == repeat:
+                    peaks[f"{game_type.lower()}_filter"] = max(peaks[f"{game_type.lower()}_filter"],
+                                                               peak_memory(filter_fn))
+                    if game_type == 'LB':
+                        words = set(game._word_cache)
+                        peaks['lb_search'] = max(peaks['lb_search'],
+                                                 peak_memory(lambda: game.find_solution_path(words)))
+                    continue
+
+                words, seconds = timed(filter_fn)
+                samples[f"{game_type.lower()}_filter"].append(seconds)
+                if game_type != 'LB':
+                    continue
+                path, seconds = timed(lambda: game.find_solution_path(words))
+                samples['lb_search'].append(seconds)
+                if run == 0:
+                    expansions.append(game.solver.stats['expansions'])
+                    states.append(game.solver.stats['states'])
+                    unsolved += not path
+
+    results = {name: summarize(values, peaks[name]) for name, values in samples.items() if values}
+    if expansions:
+        results['lb_search']['expansions'] = {
+            'p50': percentile(expansions, 50), 'p95': percentile(expansions, 95),
+            'max': max(expansions), 'total': sum(expansions)
+        }
+        results['lb_search']['states_max'] = max(states)
+        results['lb_search']['unsolved'] = unsolved
+    return results
+
+
+def bench_wordle(word_manager: WordManager, repeat: int, games: int, seed: int = 0) -> Dict:
+    """Time building and loading the feedback matrix, and ranking guesses in seeded games."""
+    compiled = word_manager._compiled
+    matrix_file = word_manager.config.WORDLE_MATRIX_FILE
+    results = {}
+
+    _, letters = vocabulary(compiled)
+    build = lambda: FeedbackMatrix.build(matrix_file, letters, compiled.checksum)
+    results['wd_matrix_build'] = summarize([timed(build)[1] for _ in range(max(1, repeat // 2))])
+    load = lambda: FeedbackMatrix.load(matrix_file, compiled, compiled.checksum)
+    results['wd_matrix_load'] = summarize([timed(load)[1] for _ in range(repeat)])
+
+    # Each game plays the best opening against a seeded answer, then ranks again
+    rng = random.Random(seed)
+    matrix = word_manager.GetFeedbackMatrix()
+    answers = [compiled[int(row)] for row in rng.sample(list(matrix.rows), min(games, len(matrix)))]
+    samples: Dict[str, List[float]] = {'wd_opening': [], 'wd_second': []}
+    candidates: List[int] = []
+    for answer in answers:
+        opening, seconds = timed(lambda: Wordle(word_manager, guesses=[], feedback=[]).BestGuesses())
+        samples['wd_opening'].append(seconds)
+        guess = opening[0]['word']
+        data = {'guesses': [guess], 'feedback': [pattern_string(feedback(guess, answer))]}
+        for _ in range(repeat):
+            game = Wordle(word_manager, **data)
+            samples['wd_second'].append(timed(game.BestGuesses)[1])
+        candidates.append(len(game.FindValidWords()))
+
+    results.update({name: summarize(values) for name, values in samples.items() if values})
+    if candidates:
+        results['wd_second']['candidates'] = {'p50': percentile(candidates, 50), 'max': max(candidates)}
+    return results
+
+
+def run(dictionary: Path = FIXTURE_DICTIONARY, repeat: int = 5, synthetic: int = 20, seed: int = 0,
+        wordle_games: int = 20) -> Dict:
+    """Run every benchmark and return the report."""
+    with tempfile.TemporaryDirectory(prefix="nyt-bench-") as work_dir:
+        cfg = bench_config(Path(work_dir), dictionary)
+        report = {'dictionary': bench_dictionary(cfg, repeat)}
+
+        word_manager = WordManager(cfg)
+        for game_type in ('SB', 'LB', 'WD'):
+            word_manager.GetWordList(game_type)
+            word_manager.GetFeatureTable(game_type)
+
+        archived = {game_type: archived_puzzles(game_type) for game_type in ('SB', 'LB')}
+        report['archived'] = bench_puzzles(word_manager, archived, repeat)
+        report['synthetic'] = bench_puzzles(word_manager, {'LB': synthetic_boards(synthetic, seed)}, repeat)
+        report['wordle'] = bench_wordle(word_manager, repeat, wordle_games, seed)
+
+        compiled = word_manager._compiled
+        report['meta'] = {
+            'dictionary': str(dictionary),
+            'dictionary_checksum': compiled.checksum,
+            'word_count': len(compiled),
+            'puzzles': {game_type: len(items) for game_type, items in archived.items()},
+            'synthetic_boards': synthetic + 1,
+            'wordle_games': wordle_games,
+            'wordle_words': len(word_manager.GetFeedbackMatrix()),
+            'repeat': repeat,
+            'seed': seed,
+            'python': platform.python_version(),
+            'platform': platform.platform()
+        }
+        compiled.close()
+    return report
+
+
+def compare(old: Dict, new: Dict) -> List[str]:
+    """Lines describing the p50/p95 change of every stage present in both reports."""
+    lines = []
+    for group in ('dictionary', 'archived', 'synthetic', 'wordle'):
+        for stage, stats in sorted(new.get(group, {}).items()):
+            before = old.get(group, {}).get(stage)
+            if not before:
+                continue
+            changes = []
+            for key in ('p50_ms', 'p95_ms'):
+                ratio = stats[key] / before[key] if before[key] else float('inf')
+                changes.append(f"{key} {before[key]:.3f} -> {stats[key]:.3f} ({ratio:.2f}x)")
+            lines.append(f"{group}.{stage}: {', '.join(changes)}")
+    return lines
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark dictionary loading and the game solvers.")
+    parser.add_argument('--dictionary', type=Path, default=FIXTURE_DICTIONARY,
+                        help="word list to compile (default: bundled fixture)")
+    parser.add_argument('--repeat', type=int, default=5, help="timed runs per stage and puzzle")
+    parser.add_argument('--synthetic', type=int, default=20, help="number of synthetic Letter Boxed boards")
+    parser.add_argument('--wordle', type=int, default=20, help="number of seeded Wordle games")
+    parser.add_argument('--seed', type=int, default=0, help="seed for the synthetic boards and Wordle answers")
+    parser.add_argument('--output', type=Path, help="write the JSON report here instead of stdout")
+    parser.add_argument('--compare', type=Path, help="earlier JSON report to compare against")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.ERROR)
+    report = run(args.dictionary, args.repeat, args.synthetic, args.seed, args.wordle)
+    text = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        args.output.write_text(text + "\n")
+    else:
+        print(text)
+
+    if args.compare:
+        with open(args.compare, 'r') as f:
+            for line in compare(json.load(f), report):
+                print(line, file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
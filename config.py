@@ -1,9 +1,10 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Dict, Any, Callable, Type, List, get_type_hints, Optional, Union
 from pathlib import Path
 from datetime import date
 import json
 from utils.errors import GameConfigError
+from Games.registry import registry
 
 @dataclass
 class GameConfig:
@@ -14,52 +15,72 @@ class GameConfig:
     raw_dir: Path
     solutions_dir: Path
     actual_dir: Path
+    archive_dir: Path
     validation_rules: Dict[str, Union[Type, Callable]]
     game_name: str
+    _dirs_ready: bool = field(default=False, init=False, repr=False, compare=False)
+
+    def ensure_dirs(self) -> None:
+        """Create the game's data directories, once, when the game is first used."""
+        if self._dirs_ready:
+            return
+        for dir in [self.data_dir, self.daily_dir, self.raw_dir, self.solutions_dir, self.actual_dir]:
+            dir.mkdir(parents=True, exist_ok=True)
+        self._dirs_ready = True
 
 class ConfigManager:
     WORD_LIST_URL = "https://raw.githubusercontent.com/dwyl/english-words/master/words_alpha.txt"
-    GAMES = {
-        'SB': ('Spelling Bee', 'SpellingBee'),
-        'LB': ('Letter Boxed', 'LetterBoxed')
-    }
     BASE_DATA_DIR = Path("Data")
     GAME_DATA_DIR = BASE_DATA_DIR / "GameData"
     DICTIONARY_DIR = BASE_DATA_DIR / "Dictionary"
     INVALID_WORDS_DIR = DICTIONARY_DIR / "invalid"
+    WORD_LIST_FILE = DICTIONARY_DIR / "words_alpha.txt"
+    COMPILED_DICTIONARY_FILE = DICTIONARY_DIR / "words_alpha.bin"
+    # Wordle feedback patterns of every five-letter word against every other, memory-mapped
+    WORDLE_MATRIX_FILE = DICTIONARY_DIR / "wordle_feedback.npy"
+    ACTUAL_WORDS_DB = DICTIONARY_DIR / "actual_words.sqlite3"
+    METRICS_DIR = BASE_DATA_DIR / "metrics"
+    RESULT_CACHE_DB = BASE_DATA_DIR / "cache" / "results.sqlite3"
+    DICTIONARY_MAX_AGE_DAYS = 30
+    # Optional per-game URL templates for --ingest, formatted with game and date (YYYYMMDD)
+    PUZZLE_SOURCES: Dict[str, str] = {}
 
     def __init__(self):
+        # Nothing is built or touched on disk here; game configs are created on
+        # first access and each game's directories when that game is first used
         self._today = date.today()
         self._override_date = None
-        self._configs = {}
-        self.load_configs()
-        self.INVALID_WORDS_DIR.mkdir(parents=True, exist_ok=True)
+        self._configs: Optional[Dict[str, GameConfig]] = None
 
     def load_configs(self):
-        """Load configurations from JSON files for each game type."""
-        for game_code, (game_name, _) in self.GAMES.items():
+        """Build the configuration for each registered game type."""
+        # Built aside and published in one assignment, so a thread reading
+        # CONFIGS while another loads it never sees a partial dict
+        configs = {}
+        for game_code in registry:
+            spec = registry.spec(game_code)
             game_dir = self.GAME_DATA_DIR / game_code
             daily_dir = game_dir / "Daily"
             raw_dir = daily_dir / "raw"
             solutions_dir = daily_dir / "solutions"
             actual_dir = daily_dir / "actual"
-            
-            # Ensure directories exist
-            for dir in [game_dir, daily_dir, raw_dir, solutions_dir, actual_dir, self.DICTIONARY_DIR]:
-                dir.mkdir(parents=True, exist_ok=True)
+            # Month-sharded solution archive; solutions_dir only holds optional per-day exports
+            archive_dir = daily_dir / "archive"
 
             # Default configs
-            self._configs[game_code] = GameConfig(
-                min_length=3,
-                max_length=15,
+            configs[game_code] = GameConfig(
+                min_length=spec.min_length,
+                max_length=spec.max_length,
                 data_dir=game_dir,
                 daily_dir=daily_dir,
                 raw_dir=raw_dir,
                 solutions_dir=solutions_dir,
                 actual_dir=actual_dir,
-                validation_rules={'validator': validate_lb if game_code == 'LB' else None},
-                game_name=game_name
+                archive_dir=archive_dir,
+                validation_rules={'validator': spec.validate},
+                game_name=spec.name
             )
+        self._configs = configs
 
     @property
     def current_date_str(self) -> str:
@@ -79,7 +100,7 @@ class ConfigManager:
     @property
     def available_games(self) -> List[str]:
         """Returns list of available game types."""
-        return list(self._configs.keys())
+        return list(registry)
 
     def set_override_date(self, new_date: date | None) -> None:
         """Sets an override date for testing purposes."""
@@ -88,22 +109,10 @@ class ConfigManager:
     @property
     def CONFIGS(self) -> Dict[str, GameConfig]:
         """Access to game configurations."""
+        if self._configs is None:
+            self.load_configs()
         return self._configs
 
-def validate_lb(data: dict) -> bool:
-    """Validates Letter Boxed data format."""
-    required_sides = {'TOP', 'LEFT', 'BOTTOM', 'RIGHT'}
-    if not all(side in data for side in required_sides):
-        return False
-    
-    return all(
-        isinstance(data[side], list) and
-        len(data[side]) == 3 and
-        all(isinstance(l, str) and l.isalpha() and l.isupper() 
-            for l in data[side])
-        for side in required_sides
-    )
-
 # Initialize the global instance
 config = ConfigManager()
 
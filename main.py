@@ -1,15 +1,22 @@
-from typing import Dict, Type, Set
+from typing import TYPE_CHECKING, Dict, List, Optional, Type, Set
 import logging
 from datetime import datetime
 import json
+import os
 import sys
 
-from Data.Dictionary.WordManager import WordManager
-from Games.SpellingBee import SpellingBee
-from Games.LetterBoxed import LetterBoxed
 from Games.Game import Game, GameConfigError, GameError, GameInitializationError, GameExecutionError, WordValidationError
 from config import config
+from Games.registry import registry
 from utils.visualization import GameVisualizer
+from utils.instrumentation import metrics
+
+# The dictionary, HTTP and asyncio modules are imported by the code paths that
+# use them, and each game (with its numpy solver) by the registry when first
+# played, so importing main stays cheap
+if TYPE_CHECKING:
+    from utils.WordManager import WordManager
+    from utils.result_cache import ResultCache
 
 # Configure logging
 logging.basicConfig(
@@ -35,58 +42,182 @@ class GameErrorContext:
             logger.error(f"Unexpected error: {str(exc_val)}")
         return True
 
-def RunGame(game_type: str, word_manager: WordManager, game_classes: Dict[str, Type[Game]]) -> None:
-    """Run a specific game with error handling."""
-    logger.debug(f"Loading daily data for {game_type}")
-    daily_data = word_manager.LoadDailyData(game_type)
+def RunGame(game_type: str, word_manager: 'WordManager', game_classes: Dict[str, Type[Game]],
+            daily_data: Optional[Dict] = None, result_cache: Optional['ResultCache'] = None) -> None:
+    """
+    Run a specific game with error handling, loading its daily data unless given.
+
+    With a result cache, an unchanged puzzle whose solution is already
+    archived is skipped, and a cached result is reused instead of solving again.
+    """
+    from utils.solution_archive import archive_for
+
+    if daily_data is None:
+        logger.debug(f"Loading daily data for {game_type}")
+        with metrics.stage('load_daily_data', game=game_type):
+            daily_data = word_manager.LoadDailyData(game_type)
     
     if daily_data is None:
         logger.warning(f"No daily data found for {game_type}")
         return
             
-    logger.info(f"\n=== {config.GAMES[game_type][0]} ===")
+    logger.info(f"\n=== {registry.spec(game_type).name} ===")
     
     with GameErrorContext():
         logger.debug(f"Initializing {game_type} game")
-        game = game_classes[game_type](word_manager)
-        game.InitializeGame(**daily_data)
-        valid_words = game.FindValidWords()
-        visualizer.output_game_results(game_type, valid_words, config, game)
+        with metrics.stage('initialize', game=game_type):
+            game = game_classes[game_type](word_manager, **daily_data)
+
+        fingerprint = cached = None
+        if result_cache is not None:
+            with metrics.stage('result_cache', game=game_type):
+                fingerprint = result_cache.fingerprint(game)
+                cached = result_cache.lookup(game)
+            archive = archive_for(config.CONFIGS[game_type])
+            if cached is not None and fingerprint == archive.fingerprint(config.current_date_str):
+                logger.info(f"Puzzle unchanged since its solution was archived in {archive.archive_dir}; skipping")
+                return
+            if cached is not None:
+                game.RestoreResult(cached)
+
+        with metrics.stage('find_valid_words', game=game_type):
+            valid_words = game.FindValidWords()
+        if result_cache is not None and cached is None:
+            result_cache.store(game)
+        with metrics.stage('output_game_results', game=game_type):
+            visualizer.output_game_results(game_type, valid_words, config, game, fingerprint)
+
+async def RunIngested(word_manager: 'WordManager', game_classes: Dict[str, Type[Game]], game_codes: List[str],
+                      result_cache: Optional['ResultCache'] = None) -> None:
+    """Gather every game's data concurrently and solve each puzzle as it arrives."""
+    from utils.ingest import DailyIngest
+
+    async for game_type, daily_data in DailyIngest(word_manager, game_codes).puzzles():
+        if daily_data is None:
+            logger.warning(f"No daily data found for {game_type}")
+            continue
+        RunGame(game_type, word_manager, game_classes, daily_data, result_cache)
 
 def Main() -> None:
     """Main entry point for the NYT Word Games Solver."""
+    from utils.WordManager import WordManager
+    from utils.result_cache import ResultCache
+
     logger.info(f"\n=== Running NYT Games for {config.display_date} ===")
     
+    # --no-render skips the picture entirely; --render-async draws it after solving;
+    # --svg writes a per-date SVG next to the solutions instead of the matplotlib PNG
+    visualizer.render = '--no-render' not in sys.argv
+    visualizer.background = '--render-async' in sys.argv
+    visualizer.renderer = 'svg' if '--svg' in sys.argv else 'matplotlib'
+    # --export-daily also writes each solution as its own per-day JSON file
+    visualizer.export_daily = '--export-daily' in sys.argv
+    # --parallel-search splits hard Letter Boxed searches across every core
+    if '--parallel-search' in sys.argv:
+        registry['LB'].solver_workers = os.cpu_count()
+    # --metrics writes stage timings, counters and memory deltas to Data/metrics;
+    # --trace-memory adds exact (but slow) tracemalloc allocation deltas
+    if '--metrics' in sys.argv or '--trace-memory' in sys.argv:
+        metrics.enable(track_memory='--trace-memory' in sys.argv)
+    # --no-cache solves and rewrites every puzzle even if its cached result still holds
+    result_cache = None if '--no-cache' in sys.argv else ResultCache(config.RESULT_CACHE_DB)
+    sys.argv = [arg for arg in sys.argv
+                if arg not in ('--no-render', '--render-async', '--svg', '--metrics', '--trace-memory',
+                               '--parallel-search', '--no-cache', '--export-daily')]
+
     try:
         word_manager = WordManager(config)
         
-        game_classes: Dict[str, Type[Game]] = {
-            'SB': SpellingBee,
-            'LB': LetterBoxed
-        }
-        
+        # Games are imported on first lookup, so only the ones played are loaded
+        game_classes = registry
+
         # Add command-line argument handling for invalid words
         if len(sys.argv) > 1 and sys.argv[1] == '--add-invalid':
-            game_type = input("Enter game type (SB/LB): ").upper()
+            game_type = input(f"Enter game type ({'/'.join(game_classes)}): ").upper()
             if game_type not in game_classes:
                 logger.error(f"Invalid game type: {game_type}")
                 return
                 
             print("Enter invalid words (one per line, empty line to finish):")
+            words = []
             while True:
                 word = input().strip()
                 if not word:
                     break
-                word_manager.add_invalid_word(game_type, word)
+                words.append(word)
+            word_manager.add_invalid_words(game_type, words)
             return
 
-        # Normal game execution
-        for game_type in config.available_games:
-            if game_type not in config.CONFIGS:
-                logger.error(f"Unsupported game type: {game_type}")
-                continue
-            
-            RunGame(game_type, word_manager, game_classes)
+        # Re-solve archived puzzles: --batch START END [GAMES] [WORKERS]
+        if len(sys.argv) > 1 and sys.argv[1] == '--batch':
+            from utils.batch import SolveDateRange, parse_date
+            usage = "Usage: main.py --batch YYYYMMDD YYYYMMDD [SB,LB,WD] [WORKERS]"
+            if not 4 <= len(sys.argv) <= 6:
+                logger.error(usage)
+                return
+            try:
+                start, end = parse_date(sys.argv[2]), parse_date(sys.argv[3])
+            except GameConfigError as e:
+                logger.error(f"{e}\n{usage}")
+                return
+            game_codes = sys.argv[4].upper().split(',') if len(sys.argv) > 4 else config.available_games
+            unknown = [code for code in game_codes if code not in config.CONFIGS]
+            if unknown:
+                logger.error(f"Invalid game type: {', '.join(unknown)}\n{usage}")
+                return
+            workers = None
+            if len(sys.argv) > 5:
+                if not sys.argv[5].isdigit() or int(sys.argv[5]) < 1:
+                    logger.error(f"Invalid WORKERS (expected a positive number): {sys.argv[5]}\n{usage}")
+                    return
+                workers = int(sys.argv[5])
+            SolveDateRange(start, end, game_codes, word_manager, game_classes, visualizer, workers, result_cache)
+            return
+
+        # Add scores to saved Spelling Bee solutions in bulk: --score START END
+        if len(sys.argv) > 1 and sys.argv[1] == '--score':
+            from utils.batch import ScoreArchive, parse_date
+            if len(sys.argv) < 4:
+                logger.error("Usage: main.py --score YYYYMMDD YYYYMMDD")
+                return
+            ScoreArchive(parse_date(sys.argv[2]), parse_date(sys.argv[3]), word_manager)
+            return
+
+        # Write archived solutions as per-day JSON files: --export START END [GAMES]
+        if len(sys.argv) > 1 and sys.argv[1] == '--export':
+            from utils.batch import ExportSolutions, parse_date
+            if len(sys.argv) < 4:
+                logger.error("Usage: main.py --export YYYYMMDD YYYYMMDD [SB,LB,WD]")
+                return
+            game_codes = sys.argv[4].upper().split(',') if len(sys.argv) > 4 else config.available_games
+            ExportSolutions(parse_date(sys.argv[2]), parse_date(sys.argv[3]), game_codes, config)
+            return
+
+        # Keep the solver warm and answer puzzles over HTTP: --serve [HOST:]PORT
+        if len(sys.argv) > 1 and sys.argv[1] == '--serve':
+            from utils.service import Serve
+            address = sys.argv[2] if len(sys.argv) > 2 else '8080'
+            host, _, port = address.rpartition(':')
+            Serve(word_manager, game_classes, host or '127.0.0.1', int(port))
+            return
+
+        # Fetch every game's data and the word list concurrently: --ingest
+        if len(sys.argv) > 1 and sys.argv[1] == '--ingest':
+            import asyncio
+            asyncio.run(RunIngested(word_manager, game_classes, config.available_games, result_cache))
+        else:
+            # Normal game execution
+            for game_type in config.available_games:
+                if game_type not in config.CONFIGS:
+                    logger.error(f"Unsupported game type: {game_type}")
+                    continue
+
+                RunGame(game_type, word_manager, game_classes, result_cache=result_cache)
+
+        visualizer.wait()
+        if metrics.enabled:
+            run_id = datetime.now().strftime('%H%M%S')
+            metrics.write(config.METRICS_DIR / f"{config.current_date_str}_{run_id}.json")
             
     except Exception as e:
         logger.error(f"Fatal error in Main: {str(e)}")
@@ -0,0 +1,36 @@
+import pytest
+
+from config import ConfigManager
+
+# Enough words for a Spelling Bee on 'abcdelt', a Letter Boxed board and a Wordle game
+WORDS = ['able', 'bale', 'blade', 'table', 'tablet', 'dealt', 'late', 'tale', 'teal', 'bead',
+         'abet', 'beat', 'belt', 'lad', 'crane', 'slate', 'trace', 'crate', 'react', 'cater',
+         'stone', 'notes', 'onset', 'steno', 'tones', 'kayak', 'quiz', 'zebra']
+
+
+@pytest.fixture
+def game_config(tmp_path):
+    """A fresh ConfigManager whose data tree and dictionary live under tmp_path."""
+    config = ConfigManager()
+    config.BASE_DATA_DIR = tmp_path / "Data"
+    config.GAME_DATA_DIR = config.BASE_DATA_DIR / "GameData"
+    config.DICTIONARY_DIR = config.BASE_DATA_DIR / "Dictionary"
+    config.INVALID_WORDS_DIR = config.DICTIONARY_DIR / "invalid"
+    config.WORD_LIST_FILE = config.DICTIONARY_DIR / "words_alpha.txt"
+    config.COMPILED_DICTIONARY_FILE = config.DICTIONARY_DIR / "words_alpha.bin"
+    config.WORDLE_MATRIX_FILE = config.DICTIONARY_DIR / "wordle_feedback.npy"
+    config.ACTUAL_WORDS_DB = config.DICTIONARY_DIR / "actual_words.sqlite3"
+    config.METRICS_DIR = config.BASE_DATA_DIR / "metrics"
+    config.RESULT_CACHE_DB = config.BASE_DATA_DIR / "cache" / "results.sqlite3"
+    config.WORD_LIST_URL = None
+    config.PUZZLE_SOURCES = {}
+    config.DICTIONARY_DIR.mkdir(parents=True)
+    config.WORD_LIST_FILE.write_text('\n'.join(WORDS) + '\n')
+    return config
+
+
+@pytest.fixture
+def word_manager(game_config):
+    """A WordManager over game_config; games built on it use the same data tree."""
+    from utils.WordManager import WordManager
+    return WordManager(game_config)
@@ -0,0 +1,60 @@
+import json
+
+from utils.actual_words_store import ActualWordStore
+from utils.WordManager import WordManager
+
+
+def test_load_since_returns_only_newer_rows(tmp_path):
+    store = ActualWordStore(tmp_path / 'actual.sqlite3')
+    store.add('SB', ['able', 'bale'], '20240101')
+    store.add('LB', ['crane'], '20240101')
+    words, seq = store.load_since('SB')
+    assert words == {'able', 'bale'}
+
+    store.add('SB', ['table', 'able'], '20240102')
+    assert store.load_since('SB', seq) == ({'table'}, seq + 2)
+    # Nothing newer leaves the sequence where it was
+    assert store.load_since('SB', seq + 2) == (set(), seq + 2)
+    assert store.load_since('LB')[0] == {'crane'}
+    store.close()
+
+
+def test_legacy_files_are_imported_once(tmp_path):
+    actual_dir = tmp_path / 'actual'
+    actual_dir.mkdir()
+    (actual_dir / 'SB_01012024.json').write_text(json.dumps({'date': '20240101', 'valid_words': ['able', 'bale']}))
+    (actual_dir / 'SB_02012024.json').write_text('{"date": "2024')
+    store = ActualWordStore(tmp_path / 'actual.sqlite3')
+    store.import_legacy_files('SB', actual_dir)
+    assert store.load_since('SB')[0] == {'able', 'bale'}
+
+    # A file appearing later is not imported, in this or another connection
+    (actual_dir / 'SB_03012024.json').write_text(json.dumps({'date': '20240103', 'valid_words': ['table']}))
+    store.import_legacy_files('SB', actual_dir)
+    store.close()
+    reopened = ActualWordStore(tmp_path / 'actual.sqlite3')
+    reopened.import_legacy_files('SB', actual_dir)
+    assert reopened.load_since('SB')[0] == {'able', 'bale'}
+    reopened.close()
+
+
+def test_word_manager_picks_up_words_saved_elsewhere(game_config, word_manager):
+    word_manager.save_actual_words('SB', ['bleat'], '20240101')
+    other = WordManager(game_config)
+    word_list = other.GetWordList('SB')
+    assert 'bleat' in word_list
+
+    loads = []
+    load_since = other._actual_store.load_since
+
+    def recording_load_since(game_type, after_seq=0):
+        result = load_since(game_type, after_seq)
+        loads.append((after_seq, result[0]))
+        return result
+
+    other._actual_store.load_since = recording_load_since
+    word_manager.save_actual_words('SB', ['tabled'], '20240102')
+    assert other.GetWordList('SB') is word_list
+    assert 'tabled' in word_list
+    # Only the row saved since its last read is loaded
+    assert loads == [(1, {'tabled'})]
@@ -0,0 +1,64 @@
+from datetime import date
+
+from Games.SpellingBee import SpellingBee
+from utils.batch import ScoreArchive
+from utils.bee_scoring import RANKS, rank_thresholds, score_puzzles, score_words
+from utils.solution_archive import archive_for
+
+# 'lad' is too short to count; 'tabled' uses each letter once, 'battled' repeats some
+WORDS = ['able', 'bale', 'lad', 'table', 'tabled', 'battled', 'dealt']
+
+
+def test_score_words():
+    score = score_words('a', 'bdelt', WORDS)
+    # 1 + 1 for the four-letter words, 5 + 5, then 6 + 7 and 7 + 7 for the pangrams
+    assert score['max_score'] == 39
+    assert score['pangrams'] == ['battled', 'tabled']
+    assert score['perfect_pangrams'] == ['tabled']
+    assert score['grid'] == {'a': {'4': 1}, 'b': {'4': 1, '7': 1}, 'd': {'5': 1}, 't': {'5': 1, '6': 1}}
+    assert score['grid_totals'] == {'4': 2, '5': 2, '6': 1, '7': 1}
+    assert score['two_letter'] == {'ab': 1, 'ba': 2, 'de': 1, 'ta': 2}
+    assert score['ranks'] == {
+        'Beginner': 0, 'Good Start': 1, 'Moving Up': 2, 'Good': 3, 'Solid': 6,
+        'Nice': 10, 'Great': 16, 'Amazing': 20, 'Genius': 27, 'Queen Bee': 39
+    }
+
+
+def test_rank_thresholds_follow_published_percentages():
+    assert rank_thresholds(100) == dict(RANKS)
+    assert rank_thresholds(200) == {name: 2 * percent for name, percent in RANKS}
+
+
+def test_four_letter_words_score_one_point():
+    assert score_words('a', 'bdelt', ['able'])['max_score'] == 1
+    assert score_words('a', 'bdelt', ['table'])['max_score'] == 5
+    assert score_words('a', 'bdelt', ['lad', 'tab'])['max_score'] == 0
+
+
+def test_batch_matches_one_puzzle_at_a_time():
+    puzzles = [('a', 'bdelt', WORDS), ('e', 'abdlt', ['dealt', 'tabled']), ('a', 'bdelt', [])]
+    assert score_puzzles(puzzles) == [score_words(*puzzle) for puzzle in puzzles]
+
+
+def test_spelling_bee_skips_three_letter_words(word_manager):
+    game = SpellingBee(word_manager, mandatory_char='a', optional_chars='bcdelt')
+    words = game.FindValidWords()
+    assert 'lad' in word_manager.GetWordList('SB')
+    assert 'lad' not in words
+    assert {'able', 'tablet', 'dealt'} <= words
+
+
+def test_score_archive(word_manager):
+    word_manager.SaveDailyData('SB', {'mandatory_char': 'a', 'optional_chars': 'bdelt'}, '20240101')
+    game_config = word_manager.config.CONFIGS['SB']
+    archive = archive_for(game_config)
+    archive.append({'date': '20240101', 'words': WORDS})
+    # No raw data for this day, so it is left alone
+    archive.append({'date': '20240102', 'words': ['able']})
+    solution_file = game_config.solutions_dir / '20240101.json'
+    archive.export(archive.get('20240101'), solution_file)
+
+    assert ScoreArchive(date(2024, 1, 1), date(2024, 1, 31), word_manager) == 1
+    assert archive.get('20240101')['score'] == score_words('a', 'bdelt', WORDS)
+    assert 'score' not in archive.get('20240102')
+    assert '"max_score": 39' in solution_file.read_text()
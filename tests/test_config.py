@@ -0,0 +1,33 @@
+import sys
+import threading
+
+from config import ConfigManager
+from Games.registry import registry
+
+
+def test_concurrent_first_access_sees_every_game():
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        for _ in range(50):
+            manager = ConfigManager()
+            start = threading.Barrier(8)
+            failures = []
+
+            def read():
+                start.wait()
+                try:
+                    for code in registry:
+                        manager.CONFIGS[code]
+                except KeyError as e:
+                    failures.append(e)
+
+            threads = [threading.Thread(target=read) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            assert not failures
+            assert set(manager.CONFIGS) == set(registry)
+    finally:
+        sys.setswitchinterval(interval)
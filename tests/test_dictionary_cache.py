@@ -0,0 +1,51 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from utils.dictionary_cache import CompiledDictionary, DictionaryCache
+from utils.errors import GameExecutionError
+from utils.word_features import compute_features
+
+WORDS = ['apple', 'bee', 'letter', 'boxed', 'zebra', 'queue', 'wordle']
+
+
+@pytest.fixture
+def compiled_file(tmp_path):
+    source = tmp_path / 'words.txt'
+    source.write_text('\n'.join(WORDS) + '\n')
+    config = SimpleNamespace(WORD_LIST_FILE=source, COMPILED_DICTIONARY_FILE=tmp_path / 'words.bin',
+                             DICTIONARY_MAX_AGE_DAYS=30, WORD_LIST_URL=None)
+    cache = DictionaryCache(config)
+    cache.compile()
+    return cache.compiled_file
+
+
+def _open(path):
+    return CompiledDictionary(path, {})
+
+
+def test_round_trip(compiled_file):
+    compiled = _open(compiled_file)
+    assert list(compiled) == sorted(WORDS)
+    expected = compute_features(sorted(WORDS))
+    for name, column in compiled.features().items():
+        assert np.array_equal(column, expected[name])
+
+
+@pytest.mark.parametrize('position', ['offsets', 'blob', 'mask', 'pairs'])
+def test_corruption_is_detected(compiled_file, position):
+    compiled = _open(compiled_file)
+    if position == 'offsets':
+        at = compiled._offsets_start + 4
+    elif position == 'blob':
+        at = compiled._blob_start + 1
+    else:
+        at = compiled._layout[position][0]
+    compiled.close()
+
+    data = bytearray(compiled_file.read_bytes())
+    data[at] ^= 1
+    compiled_file.write_bytes(bytes(data))
+    with pytest.raises(GameExecutionError):
+        _open(compiled_file)
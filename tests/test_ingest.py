@@ -0,0 +1,158 @@
+from datetime import date
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import asyncio
+import json
+import threading
+import time
+
+import pytest
+
+import main
+from utils.ingest import DailyIngest
+from utils.WordManager import WordManager
+
+from conftest import WORDS
+
+DATE = '20240101'
+PUZZLES = {
+    'SB': {'mandatory_char': 'a', 'optional_chars': 'bcdelt'},
+    'LB': {'TOP': ['A', 'B', 'C'], 'LEFT': ['D', 'E', 'L'], 'BOTTOM': ['T', 'R', 'N'], 'RIGHT': ['S', 'O', 'K']},
+    'WD': {'guesses': ['crane'], 'feedback': ['BBGBY']}
+}
+LOCAL_WD = {'guesses': ['slate'], 'feedback': ['BBGYG']}
+
+
+class StubSource(ThreadingHTTPServer):
+    """
+    Serves the word list and each game's puzzle, with scripted failures.
+
+    routes maps a path to a list of (delay seconds, status) replies, used in
+    turn (the last one repeats). It counts the most requests in flight at
+    once, and logs when each reply was sent.
+    """
+    daemon_threads = True
+
+    def __init__(self, routes):
+        super().__init__(('127.0.0.1', 0), _StubHandler)
+        self.routes = routes
+        self.calls = {}
+        self.log = []
+        self.in_flight = self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            call = server.calls.get(self.path, 0)
+            server.calls[self.path] = call + 1
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+        replies = server.routes.get(self.path, [(0, 404)])
+        delay, status = replies[min(call, len(replies) - 1)]
+        time.sleep(delay)
+
+        if self.path == '/words.txt':
+            body, content_type = '\n'.join(WORDS).encode(), 'text/plain'
+        else:
+            game_type = self.path.split('/')[1]
+            body, content_type = json.dumps(PUZZLES[game_type]).encode(), 'application/json'
+        if status != 200:
+            body = b'{}'
+        try:
+            self.send_response(status)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        except OSError:
+            pass  # The client gave up (timed out) first
+        with server.lock:
+            server.in_flight -= 1
+            server.log.append((self.path, time.monotonic()))
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def stub_source(request):
+    server = StubSource(request.param)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def word_manager(game_config, stub_source):
+    # The word list is downloaded from the stub, along with the puzzles
+    game_config.WORD_LIST_FILE.unlink()
+    game_config.WORD_LIST_URL = f"{stub_source.url}/words.txt"
+    game_config.PUZZLE_SOURCES = {code: f"{stub_source.url}/{{game}}/{{date}}" for code in PUZZLES}
+    game_config.set_override_date(date(2024, 1, 1))
+    return WordManager(game_config)
+
+
+FLAKY_SOURCE = {
+    '/words.txt': [(0.2, 200)],
+    f'/SB/{DATE}': [(0.1, 200)],
+    f'/LB/{DATE}': [(0.4, 503), (0, 200)],
+    f'/WD/{DATE}': [(2.0, 200)]
+}
+
+
+@pytest.mark.parametrize('stub_source', [FLAKY_SOURCE], indirect=True)
+def test_ingest_fetches_concurrently_retries_and_falls_back(word_manager, stub_source):
+    # Wordle's source hangs, so its previously saved raw file is used
+    word_manager.SaveDailyData('WD', LOCAL_WD, DATE)
+    word_manager._daily_data.clear()
+
+    async def gather():
+        ingest = DailyIngest(word_manager, ['WD', 'LB', 'SB'], DATE, timeout=0.5, retries=1, backoff=0)
+        return [item async for item in ingest.puzzles()]
+
+    arrived = asyncio.run(gather())
+
+    assert arrived == [('SB', PUZZLES['SB']), ('LB', PUZZLES['LB']), ('WD', LOCAL_WD)]
+    # Every puzzle and the word list were requested at once
+    assert stub_source.max_in_flight == 4
+    assert stub_source.calls[f'/LB/{DATE}'] == 2
+    assert stub_source.calls[f'/WD/{DATE}'] == 2
+
+    assert word_manager.config.WORD_LIST_FILE.read_text().split() == WORDS
+    assert 'tablet' in word_manager.GetWordList('SB')
+    for game_type, data in (('SB', PUZZLES['SB']), ('LB', PUZZLES['LB']), ('WD', LOCAL_WD)):
+        with open(word_manager.DailyDataPath(game_type, DATE)) as f:
+            assert json.load(f) == data
+
+
+SLOW_LB_SOURCE = {
+    '/words.txt': [(0, 200)],
+    f'/SB/{DATE}': [(0, 200)],
+    f'/LB/{DATE}': [(1.0, 200)],
+    f'/WD/{DATE}': [(0, 200)]
+}
+
+
+@pytest.mark.parametrize('stub_source', [SLOW_LB_SOURCE], indirect=True)
+def test_each_puzzle_is_solved_as_it_arrives(word_manager, stub_source, monkeypatch):
+    solved = []
+
+    def run_game(game_type, word_manager, game_classes, daily_data=None, result_cache=None):
+        solved.append((game_type, daily_data, time.monotonic()))
+
+    monkeypatch.setattr(main, 'RunGame', run_game)
+    asyncio.run(main.RunIngested(word_manager, main.registry, ['LB', 'SB', 'WD']))
+
+    # Spelling Bee and Wordle are solved while Letter Boxed is still in flight
+    assert {game_type: data for game_type, data, _ in solved} == PUZZLES
+    assert solved[-1][0] == 'LB'
+    lb_served = next(at for path, at in stub_source.log if path == f'/LB/{DATE}')
+    assert all(at < lb_served for game_type, _, at in solved if game_type != 'LB')
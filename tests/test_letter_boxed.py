@@ -0,0 +1,18 @@
+from Games.LetterBoxed import LetterBoxed
+
+BOARD = {'TOP': list('ABC'), 'LEFT': list('DEF'), 'BOTTOM': list('GHI'), 'RIGHT': list('JKL')}
+# Playable words, then ones that repeat a side ('ab', 'hi', 'll') or leave the board ('p')
+WORDS = ['adgjbekc', 'cfhli', 'bead', 'lad', 'abed', 'chid', 'kelp', 'jell', 'gale', 'bell']
+
+
+def test_word_check_matches_filter_kernel(game_config, word_manager):
+    with open(game_config.WORD_LIST_FILE, 'a') as f:
+        f.write(''.join(f"{word}\n" for word in WORDS))
+    game = LetterBoxed(word_manager, **BOARD)
+    table = word_manager.GetFeatureTable('LB')
+
+    kernel = set(table.select_rows(game.filter_kernel(table)))
+    checked = {word for word in word_manager.GetWordList('LB') if game.validate_game_specific(word)}
+    assert kernel == checked
+    assert {'adgjbekc', 'cfhli', 'bead', 'lad', 'gale'} <= checked
+    assert not checked & {'abed', 'chid', 'kelp', 'jell', 'bell'}
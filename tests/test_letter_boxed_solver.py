@@ -0,0 +1,57 @@
+from itertools import islice
+import random
+
+from Games.LetterBoxedSolver import LetterBoxedSolver
+
+LETTERS = 'abcdefghijkl'
+# Seeded words of 3-7 distinct board letters: one 2-word and hundreds of 3-word solutions
+_rng = random.Random(3)
+WORDS = sorted({''.join(_rng.sample(LETTERS, _rng.randint(3, 7))) for _ in range(120)})
+
+
+def _brute_force(depth, word_cost):
+    """Every depth-word solution without repeats, by (total cost, path)."""
+    full = set(LETTERS)
+    paths = [(word,) for word in WORDS]
+    for _ in range(depth - 1):
+        paths = [path + (word,) for path in paths for word in WORDS if word[0] == path[-1][-1]]
+    found = [(sum(word_cost(word) for word in path), path) for path in paths
+             if len(set(path)) == depth and set(''.join(path)) == full]
+    return [list(path) for _, path in sorted(found)]
+
+
+def test_ranked_solutions_match_brute_force():
+    assert len(_brute_force(3, len)) > 100
+    for word_cost in (len, lambda word: -len(set(word)) / len(word)):
+        for depth in (2, 3):
+            solver = LetterBoxedSolver(WORDS, LETTERS)
+            assert list(solver.iter_solutions_of_length(depth, word_cost)) == _brute_force(depth, word_cost)
+
+
+def test_ranked_prefix_is_lazy_and_stable():
+    expected = _brute_force(3, len)
+    solver = LetterBoxedSolver(WORDS, LETTERS)
+    assert list(islice(solver.iter_solutions_of_length(3, len), 5)) == expected[:5]
+
+
+def test_enumeration_keeps_the_time_budget():
+    solver = LetterBoxedSolver(WORDS, LETTERS, time_budget=10.0)
+    solver.solve()
+    deadline = solver._deadline
+    solutions = solver.iter_solutions(3, len)
+    next(solutions)
+    assert solver._deadline == deadline
+    list(solutions)
+    assert solver._deadline == deadline
+
+
+def test_solve_deepens_past_paths_that_reuse_a_word():
+    # Five words cover the board only by playing one word twice; six are needed otherwise
+    words = ['ache', 'bfdc', 'bgef', 'ced', 'dc', 'dghc', 'dica', 'edh', 'hcg']
+    solver = LetterBoxedSolver(words, 'abcdefghi')
+    path = solver.solve()
+    assert len(path) == 6 and len(set(path)) == 6
+    assert set(''.join(path)) == set('abcdefghi')
+    assert all(a[-1] == b[0] for a, b in zip(path, path[1:]))
+    assert solver.minimum_word_count() == 6
+    assert all(len(found) == 6 for found in solver.solve_all(20))
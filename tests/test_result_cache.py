@@ -0,0 +1,73 @@
+import pytest
+
+from Games.SpellingBee import SpellingBee
+from utils.result_cache import ResultCache
+from utils.WordManager import WordManager
+
+PUZZLE = {'mandatory_char': 'a', 'optional_chars': 'bcdelt'}
+
+
+@pytest.fixture
+def cache(game_config):
+    cache = ResultCache(game_config.RESULT_CACHE_DB)
+    yield cache
+    cache.close()
+
+
+def _solve(word_manager, cache):
+    game = SpellingBee(word_manager, **PUZZLE)
+    game.FindValidWords()
+    cache.store(game)
+    return game.GetResult()
+
+
+def _lookup(word_manager, cache):
+    return cache.lookup(SpellingBee(word_manager, **PUZZLE))
+
+
+def test_unchanged_puzzle_hits(word_manager, cache):
+    result = _solve(word_manager, cache)
+    assert 'tablet' in result['words']
+    assert _lookup(word_manager, cache) == result
+    assert _lookup(WordManager(word_manager.config), cache) == result
+
+
+def test_unrelated_overlay_changes_reuse_the_result(word_manager, cache):
+    result = _solve(word_manager, cache)
+    word_manager.add_invalid_words('SB', ['kayak', 'zebra'])
+    word_manager.save_actual_words('SB', ['quiz'], '20240101')
+
+    assert _lookup(word_manager, cache) == result
+    # The entry is restamped, so the next lookup is a plain hit
+    key = cache.fingerprint(SpellingBee(word_manager, **PUZZLE))
+    assert cache.get(key)[0] == word_manager.OverlayVersions('SB')
+
+
+def test_newly_invalid_solution_word_misses(word_manager, cache):
+    _solve(word_manager, cache)
+    word_manager.add_invalid_words('SB', ['tablet'])
+    assert _lookup(word_manager, cache) is None
+
+
+def test_newly_accepted_actual_word_misses(word_manager, cache):
+    _solve(word_manager, cache)
+    word_manager.save_actual_words('SB', ['bleat'], '20240101')
+    assert _lookup(word_manager, cache) is None
+
+
+def test_hand_edited_invalid_list_misses(game_config, word_manager, cache):
+    invalid_file = game_config.INVALID_WORDS_DIR / 'SB_invalid.txt'
+    invalid_file.parent.mkdir(parents=True, exist_ok=True)
+    invalid_file.write_text('kayak\n')
+    _solve(word_manager, cache)
+
+    # Same number of lines, but now one of them removes a cached word
+    invalid_file.write_text('tablet\n')
+    assert _lookup(WordManager(game_config), cache) is None
+
+
+def test_dictionary_change_misses(game_config, word_manager, cache):
+    _solve(word_manager, cache)
+    with open(game_config.WORD_LIST_FILE, 'a') as f:
+        f.write('cabled\n')
+    assert _lookup(WordManager(game_config), cache) is None
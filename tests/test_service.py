@@ -0,0 +1,98 @@
+from concurrent.futures import ThreadPoolExecutor
+import http.client
+import json
+import threading
+
+import pytest
+
+from Games.registry import registry
+from utils.service import SolverService, make_server
+
+PUZZLES = {
+    'SB': {'mandatory_char': 'a', 'optional_chars': 'bcdelt'},
+    'LB': {'TOP': ['A', 'B', 'C'], 'LEFT': ['D', 'E', 'F'], 'BOTTOM': ['G', 'H', 'I'], 'RIGHT': ['J', 'K', 'L']},
+    # Only 'blade' and 'slate' fit this feedback
+    'WD': {'guesses': ['crane'], 'feedback': ['BBGBG']}
+}
+
+
+# Made-up words that solve the Letter Boxed board together
+LB_PATH = ['adgjbekc', 'cfhli']
+
+
+@pytest.fixture
+def server(game_config, word_manager):
+    with open(game_config.WORD_LIST_FILE, 'a') as f:
+        f.write(''.join(f"{word}\n" for word in LB_PATH))
+    service = SolverService(word_manager, registry)
+    service.warm()
+    server = make_server(service, port=0)
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _request(server, method, path, body=None, headers=None):
+    conn = http.client.HTTPConnection(*server.server_address, timeout=30)
+    try:
+        conn.request(method, path, body, headers or {})
+        response = conn.getresponse()
+        assert response.getheader('Content-Type') == 'application/json'
+        return response.status, json.loads(response.read())
+    finally:
+        conn.close()
+
+
+def _solve(server, game_type, data):
+    return _request(server, 'POST', f'/solve/{game_type}', json.dumps(data))
+
+
+def test_health(server):
+    assert _request(server, 'GET', '/health') == (200, {'status': 'ok', 'games': ['LB', 'SB', 'WD']})
+    assert _request(server, 'GET', '/nowhere')[0] == 404
+
+
+def test_solves_each_game(server):
+    status, result = _solve(server, 'SB', PUZZLES['SB'])
+    assert status == 200
+    assert {'able', 'tablet', 'dealt'} <= set(result['words']) and 'lad' not in result['words']
+    assert result['score']['pangrams'] == []
+
+    status, result = _solve(server, 'lb', PUZZLES['LB'])
+    assert status == 200
+    assert result['solution_path'] == LB_PATH
+    assert {'bead', 'lad'} <= set(result['words'])
+
+    status, result = _solve(server, 'WD', PUZZLES['WD'])
+    assert status == 200
+    assert result['words'] == ['blade', 'slate']
+    assert result['best_guesses']
+
+
+def test_concurrent_requests_match_sequential_ones(server):
+    expected = {game_type: _solve(server, game_type, data)[1] for game_type, data in PUZZLES.items()}
+    jobs = list(PUZZLES.items()) * 10
+    with ThreadPoolExecutor(max_workers=len(jobs)) as pool:
+        responses = list(pool.map(lambda job: _solve(server, *job), jobs))
+
+    for (game_type, _), (status, result) in zip(jobs, responses):
+        assert status == 200
+        for key in ('words', 'solution_path', 'score', 'best_guesses'):
+            assert result.get(key) == expected[game_type].get(key)
+
+
+@pytest.mark.parametrize('path, body, headers', [
+    ('/solve/SB', '{"mandatory_char": "a",', {}),
+    ('/solve/SB', b'\xff\xfe', {}),
+    ('/solve/SB', '[]', {}),
+    ('/solve/SB', '{"mandatory_char": "ab", "optional_chars": "cdefgh"}', {}),
+    ('/solve/XX', json.dumps(PUZZLES['SB']), {}),
+    ('/solve/SB', None, {'Content-Length': 'ten'}),
+    ('/solve/SB', None, {'Content-Length': '-1'})
+])
+def test_bad_requests_get_json_400(server, path, body, headers):
+    status, result = _request(server, 'POST', path, body, headers)
+    assert status == 400
+    assert result['error']
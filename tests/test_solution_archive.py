@@ -0,0 +1,98 @@
+from utils.solution_archive import ENTRY, SolutionArchive, daily_format, from_daily_format
+
+
+def _record(date_str, *words, **extra):
+    return {'date': date_str, 'words': list(words), **extra}
+
+
+def _archive(path):
+    archive = SolutionArchive(path)
+    archive.append(_record('20240101', 'able', 'bale'))
+    archive.append(_record('20240102', 'cable'))
+    archive.append(_record('20240215', 'dale', fingerprint='f1'))
+    archive.close()
+    return path
+
+
+def _dates(archive, start=None, end=None):
+    return [record['date'] for record in archive.records(start, end)]
+
+
+def test_get_records_and_fingerprints(tmp_path):
+    archive = SolutionArchive(_archive(tmp_path))
+    assert archive.get('20240101') == _record('20240101', 'able', 'bale')
+    assert archive.get('20240103') is None
+    assert archive.fingerprint('20240215') == 'f1'
+    assert archive.months() == ['202401', '202402']
+    assert archive.dates() == ['20240101', '20240102', '20240215']
+    assert _dates(archive, '20240102', '20240215') == ['20240102', '20240215']
+
+
+def test_reappend_supersedes_earlier_record(tmp_path):
+    archive = SolutionArchive(_archive(tmp_path))
+    archive.append(_record('20240101', 'ladle'))
+    assert archive.get('20240101') == _record('20240101', 'ladle')
+    archive.close()
+
+    reopened = SolutionArchive(tmp_path)
+    assert reopened.get('20240101') == _record('20240101', 'ladle')
+    assert _dates(reopened) == ['20240101', '20240102', '20240215']
+
+
+def test_missing_index_is_rebuilt(tmp_path):
+    _archive(tmp_path)
+    SolutionArchive(tmp_path).append(_record('20240101', 'ladle'))
+    (tmp_path / '202401.idx').unlink()
+
+    archive = SolutionArchive(tmp_path)
+    assert archive.get('20240101') == _record('20240101', 'ladle')
+    assert archive.get('20240102') == _record('20240102', 'cable')
+    assert (tmp_path / '202401.idx').stat().st_size == 2 * ENTRY.size
+
+
+def test_index_behind_shard_is_caught_up(tmp_path):
+    _archive(tmp_path)
+    index = tmp_path / '202401.idx'
+    # Lose the last entry and half of the one before it
+    index.write_bytes(index.read_bytes()[:ENTRY.size // 2])
+
+    archive = SolutionArchive(tmp_path)
+    assert _dates(archive, '20240101', '20240131') == ['20240101', '20240102']
+    assert archive.get('20240102') == _record('20240102', 'cable')
+
+
+def test_torn_last_line_is_cut_off(tmp_path):
+    _archive(tmp_path)
+    shard = tmp_path / '202401.jsonl'
+    intact = shard.read_bytes()
+    with open(shard, 'ab') as f:
+        f.write(b'{"date":"20240103","wo')
+
+    archive = SolutionArchive(tmp_path)
+    assert archive.get('20240103') is None
+    assert archive.get('20240102') == _record('20240102', 'cable')
+    assert shard.read_bytes() == intact
+
+    # Appending after the repair starts on a clean line
+    archive.append(_record('20240103', 'bald'))
+    archive.close()
+    assert SolutionArchive(tmp_path).get('20240103') == _record('20240103', 'bald')
+
+
+def test_index_ahead_of_shard_is_discarded(tmp_path):
+    _archive(tmp_path)
+    shard = tmp_path / '202401.jsonl'
+    first_line = shard.read_bytes().split(b'\n')[0] + b'\n'
+    shard.write_bytes(first_line)
+
+    archive = SolutionArchive(tmp_path)
+    assert archive.get('20240101') == _record('20240101', 'able', 'bale')
+    assert archive.get('20240102') is None
+
+
+def test_daily_format_round_trip():
+    record = _record('20240101', 'able', 'bale', 'cable', score={'max_score': 9})
+    daily = daily_format(record)
+    assert daily['total_words'] == 3
+    assert daily['words_by_length'] == {'4': ['able', 'bale'], '5': ['cable']}
+    assert from_daily_format(daily, '20240101') == record
@@ -0,0 +1,31 @@
+import numpy as np
+
+from utils.LEGACY_validators import GameValidator
+from utils.word_features import WordFeatureTable
+
+WORDS = ['able', 'bale', 'lad', 'table', 'tablet', 'crane', 'slate', 'kayak', 'deal']
+SIDES = {'a': 0, 'b': 0, 'c': 0, 'd': 1, 'e': 1, 'f': 1, 'l': 2, 'n': 2, 'r': 2, 't': 3, 's': 3, 'k': 3}
+PARAMS = {
+    'SB': {'min_length': 4, 'max_length': 15, 'mandatory_char': 'a', 'allowed_chars': set('abcdelt')},
+    'LB': {'min_length': 3, 'max_length': 15, 'allowed_chars': set(SIDES), 'char_to_side': SIDES},
+    # Wordle registers no checks, and its validation params carry no allowed letters
+    'WD': {'min_length': 5, 'max_length': 5}
+}
+
+
+def test_filter_features_matches_validate_word():
+    validator = GameValidator()
+    table = WordFeatureTable(WORDS)
+    for game_type, params in PARAMS.items():
+        mask = validator.FilterFeatures(table, game_type, **params)
+        assert mask.dtype == bool
+        expected = [validator.ValidateWord(word, game_type, **params) for word in WORDS]
+        assert mask.tolist() == expected, game_type
+    assert not validator.FilterFeatures(table, 'WD', **PARAMS['WD']).any()
+
+
+def test_registered_feature_checks_return_masks():
+    table = WordFeatureTable(WORDS)
+    for game_type, check in GameValidator.FEATURE_CHECKS.items():
+        mask = np.asarray(check(table, **PARAMS[game_type]))
+        assert mask.dtype == bool and mask.shape == (len(WORDS),)
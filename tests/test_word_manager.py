@@ -0,0 +1,99 @@
+import random
+
+import pytest
+
+from Games.LetterBoxed import LetterBoxed
+
+SIDES = ['abc', 'def', 'ghi', 'jkl']
+BOARD = {'TOP': list('ABC'), 'LEFT': list('DEF'), 'BOTTOM': list('GHI'), 'RIGHT': list('JKL')}
+
+
+def _board_words(count, seed=1):
+    """Seeded words that never repeat a side, so every one is playable on BOARD."""
+    side_of = {letter: i for i, side in enumerate(SIDES) for letter in side}
+    rng = random.Random(seed)
+    words = set()
+    while len(words) < count:
+        word = rng.choice('abcdefghijkl')
+        for _ in range(rng.randint(2, 6)):
+            word += rng.choice([c for c in 'abcdefghijkl' if side_of[c] != side_of[word[-1]]])
+        words.add(word)
+    return sorted(words)
+
+
+@pytest.fixture
+def appends(monkeypatch):
+    """Paths opened for appending by WordManager."""
+    import utils.WordManager
+    opened = []
+
+    def counting_open(file, mode='r', *args, **kwargs):
+        if 'a' in mode:
+            opened.append(file)
+        return open(file, mode, *args, **kwargs)
+
+    monkeypatch.setattr(utils.WordManager, 'open', counting_open, raising=False)
+    return opened
+
+
+def test_add_invalid_words_writes_once(word_manager, appends):
+    invalid_file = word_manager.config.INVALID_WORDS_DIR / 'SB_invalid.txt'
+    word_manager.add_invalid_words('SB', ['Tablet', 'dealt', 'tablet', ''])
+    assert appends == [invalid_file]
+    assert invalid_file.read_text() == 'tablet\ndealt\n'
+
+    # Words already listed are not written again
+    word_manager.add_invalid_words('SB', ['dealt'])
+    assert appends == [invalid_file]
+
+
+def test_add_invalid_words_updates_cached_lists(word_manager):
+    word_list = word_manager.GetWordList('SB')
+    table = word_manager.GetFeatureTable('SB')
+    assert 'tablet' in word_list and table.active('SB')[table.row('tablet')]
+
+    word_manager.add_invalid_words('SB', ['tablet', 'dealt'])
+    assert word_manager.GetWordList('SB') is word_list
+    assert 'tablet' not in word_list and 'dealt' not in word_list
+    assert not table.active('SB')[table.row('tablet')]
+    assert not table.active('SB')[table.row('dealt')]
+    # Other games keep the word
+    assert 'tablet' in word_manager.GetWordList('LB')
+    assert word_manager.GetFeatureTable('LB').active('LB')[table.row('tablet')]
+
+
+def test_actual_words_outrank_invalid_words(word_manager):
+    word_list = word_manager.GetWordList('SB')
+    table = word_manager.GetFeatureTable('SB')
+    word_manager.save_actual_words('SB', ['tablet'], '20240101')
+    word_manager.add_invalid_words('SB', ['tablet'])
+    assert 'tablet' in word_list
+    assert table.active('SB')[table.row('tablet')]
+
+
+def test_letter_boxed_resolves_only_when_its_path_loses_a_word(game_config, word_manager, monkeypatch):
+    words = _board_words(100)
+    game_config.WORD_LIST_FILE.write_text('\n'.join(words) + '\n')
+    game = LetterBoxed(word_manager, **BOARD)
+    game.FindValidWords()
+    path = game.solution_path
+    assert path
+
+    searches = []
+    find_solution_path = game.find_solution_path
+    monkeypatch.setattr(game, 'find_solution_path', lambda words: searches.append(1) or find_solution_path(words))
+
+    spare = next(word for word in words if word not in path)
+    word_manager.add_invalid_words('LB', [spare])
+    assert spare not in game.FindValidWords()
+    assert searches == [] and game.solution_path == path
+    assert all(spare not in solution for solution in game.iter_solutions(3, limit=50))
+
+    # Another game's invalid words do not concern it
+    word_manager.add_invalid_words('SB', [path[0]])
+    assert searches == []
+
+    word_manager.add_invalid_words('LB', [path[0]])
+    assert searches == [1]
+    assert path[0] not in game.FindValidWords()
+    assert path[0] not in game.solution_path
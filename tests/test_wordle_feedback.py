@@ -0,0 +1,35 @@
+import random
+
+import numpy as np
+
+from utils.wordle_feedback import _signature_groups, encode, feedback, feedback_codes, pattern_code
+
+# Words repeating letters in every arrangement the grouped kernel distinguishes
+REPEATED = ['speed', 'eerie', 'geese', 'llama', 'abbey', 'sassy', 'array', 'mamma', 'erase',
+            'lever', 'eeeee', 'allee', 'added', 'robot', 'kayak', 'crane', 'theme', 'belle']
+
+
+def _scalar(guesses, answers):
+    return np.array([[feedback(g, a) for a in answers] for g in guesses], dtype=np.uint8)
+
+
+def test_feedback_reference_cases():
+    assert feedback('speed', 'abide') == pattern_code('BBYBY')
+    assert feedback('speed', 'erase') == pattern_code('YBYYB')
+    assert feedback('eerie', 'lever') == pattern_code('YGYBB')
+    assert feedback('crane', 'crane') == pattern_code('GGGGG')
+
+
+def test_feedback_codes_match_scalar_on_repeated_letters():
+    letters = encode(REPEATED)
+    expected = _scalar(REPEATED, REPEATED)
+    assert np.array_equal(feedback_codes(letters, letters), expected)
+    assert np.array_equal(feedback_codes(letters, letters, _signature_groups(letters)), expected)
+
+
+def test_feedback_codes_match_scalar_on_small_alphabet():
+    # Three letters force repeats in almost every guess and answer
+    rng = random.Random(0)
+    words = sorted({''.join(rng.choice('abe') for _ in range(5)) for _ in range(200)})
+    letters = encode(words)
+    assert np.array_equal(feedback_codes(letters, letters), _scalar(words, words))
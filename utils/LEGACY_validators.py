@@ -1,7 +1,23 @@
+from typing import Callable, Dict
+import numpy as np
+from utils.letter_index import letters_to_mask
+from utils.word_features import pair_mask
+
+
 class GameValidator:
+    # Per-game word checks and vectorized filters by game code; see register()
+    WORD_CHECKS: Dict[str, Callable] = {}
+    FEATURE_CHECKS: Dict[str, Callable] = {}
+
     def __init__(self, config=None):
         self.config = config
 
+    @classmethod
+    def register(cls, game_type: str, word_check: Callable, feature_check: Callable) -> None:
+        """Add a game: word_check(word, **params) -> bool, feature_check(table, **params) -> boolean row mask."""
+        cls.WORD_CHECKS[game_type] = word_check
+        cls.FEATURE_CHECKS[game_type] = feature_check
+
     @staticmethod
     def ValidateWordLength(word: str, min_length: int, max_length: int) -> bool:
         return min_length <= len(word) <= max_length
@@ -10,27 +26,52 @@ class GameValidator:
         """Generic word validator that handles all game types."""
         if not word or not isinstance(word, str):
             return False
-            
+
         word = word.lower()
-        
+
         # First check length for all games
         if not self.ValidateWordLength(word, params.get('min_length'), params.get('max_length')):
             return False
 
         # Dispatch to specific game validator
-        if game_type == 'SB':
-            return self.ValidateSpellingBee(word, params['mandatory_char'], params['allowed_chars'])
-        elif game_type == 'LB':
-            return self.ValidateLetterBoxed(word, params['allowed_chars'], params['char_to_side'])
-        return False
+        check = self.WORD_CHECKS.get(game_type)
+        return check is not None and check(word, **params)
 
     @staticmethod
-    def ValidateSpellingBee(word: str, mandatory_char: str, allowed_chars: set) -> bool:
-        return (mandatory_char in word and 
+    def ValidateSpellingBee(word: str, mandatory_char: str, allowed_chars: set, **_) -> bool:
+        return (mandatory_char in word and
                 all(c in allowed_chars for c in word))
 
     @staticmethod
-    def ValidateLetterBoxed(word: str, allowed_chars: set, char_to_side: dict) -> bool:
+    def ValidateLetterBoxed(word: str, allowed_chars: set, char_to_side: dict, **_) -> bool:
         return (all(c in allowed_chars for c in word) and
-                all(char_to_side[word[i]] != char_to_side[word[i + 1]] 
-                    for i in range(len(word) - 1)))
\ No newline at end of file
+                all(char_to_side[word[i]] != char_to_side[word[i + 1]]
+                    for i in range(len(word) - 1)))
+
+    @staticmethod
+    def FilterSpellingBee(table, mandatory_char: str, **_):
+        return table.letters_include(letters_to_mask(mandatory_char))
+
+    @staticmethod
+    def FilterLetterBoxed(table, char_to_side: dict, **_):
+        forbidden = pair_mask(
+            (a, b) for a in char_to_side for b in char_to_side
+            if char_to_side[a] == char_to_side[b]
+        )
+        return table.avoids_pairs(forbidden)
+
+    def FilterFeatures(self, table, game_type: str, **params):
+        """Vectorized ValidateWord over a WordFeatureTable; returns a boolean row mask."""
+        check = self.FEATURE_CHECKS.get(game_type)
+        if check is None:
+            # Like ValidateWord, a game without registered checks accepts no words
+            return np.zeros(len(table.length), dtype=bool)
+
+        rows = ((table.length >= params.get('min_length')) &
+                (table.length <= params.get('max_length')) &
+                table.letters_within(letters_to_mask(params['allowed_chars'])))
+        return rows & check(table, **params)
+
+
+GameValidator.register('SB', GameValidator.ValidateSpellingBee, GameValidator.FilterSpellingBee)
+GameValidator.register('LB', GameValidator.ValidateLetterBoxed, GameValidator.FilterLetterBoxed)
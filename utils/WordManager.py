@@ -1,9 +1,15 @@
 from pathlib import Path
-import requests
-from typing import Set, Dict, Optional, Type, Callable
+from typing import Set, Dict, Iterable, List, Optional, Tuple, Type, Callable
+import hashlib
 import json
+import os
+import weakref
 from config import config
-from Games.Game import GameConfigError, GameExecutionError
+from Games.Game import GameConfigError
+from utils.dictionary_cache import CompiledDictionary, DictionaryCache
+from utils.actual_words_store import ActualWordStore
+from utils.word_features import WordFeatureTable
+from utils.word_store import WordListView
 import logging
 from datetime import datetime
 
@@ -13,104 +19,217 @@ class WordManager:
     """Manages word lists and daily game data persistence."""
     
     def __init__(self, config):
-        """Initialize WordManager with empty word cache and ensure data directories exist."""
+        """Initialize WordManager with empty caches; files are only read when a game needs them."""
         self.config = config
-        self._word_cache: Dict[str, Set[str]] = {}  # Separate cache for each game
-        self._invalid_words: Dict[str, Set[str]] = {}  # Invalid words by game type
+        self._word_cache: Dict[str, WordListView] = {}  # Shared base plus overlays, per game
+        self._invalid_words: Dict[str, Set[str]] = {}  # Invalid words by game type, loaded on first use
+        self._invalid_log: Dict[str, List[str]] = {}  # The same, in file order (append-only)
+        self._invalid_digest: Dict[str, 'hashlib._Hash'] = {}  # Running hash of each invalid log
+        self._daily_data: Dict[Tuple[str, str], Optional[Dict]] = {}  # Validated daily data by (game, date)
         self._actual_words: Dict[str, Set[str]] = {}  # Actual valid words by game type
-        
-        # Initialize directories
-        for game_config in config.CONFIGS.values():
-            game_config.data_dir.mkdir(parents=True, exist_ok=True)
-            game_config.daily_dir.mkdir(parents=True, exist_ok=True)
-            
-        # Initialize invalid words files
-        self._init_invalid_words()
+        self._actual_seq: Dict[str, int] = {}  # Last actual-word store row applied per game
+        self._actual_store = ActualWordStore(config.ACTUAL_WORDS_DB)
+        self._compiled: Optional[CompiledDictionary] = None  # Memory-mapped, shared by every game type
+        self._features: Optional[WordFeatureTable] = None  # Shared by every game type
+        self._feedback = None  # Wordle feedback matrix, memory-mapped on first use
+        self._dictionary = DictionaryCache(config)
+        self._subscribers: weakref.WeakSet = weakref.WeakSet()  # Games holding derived word caches
 
-    def _init_invalid_words(self):
-        """Initialize invalid words lists for each game."""
-        invalid_words_dir = self.config.DICTIONARY_DIR / "invalid"
-        invalid_words_dir.mkdir(exist_ok=True)
-        
-        for game_type in self.config.CONFIGS:
-            invalid_file = invalid_words_dir / f"{game_type}_invalid.txt"
-            if invalid_file.exists():
-                with open(invalid_file, 'r') as f:
-                    self._invalid_words[game_type] = set(word.strip().lower() for word in f)
-            else:
-                self._invalid_words[game_type] = set()
-                invalid_file.touch()
-
-    def GetWordList(self, game_type: str) -> Set[str]:
-        """Get game-specific filtered word list."""
-        if game_type not in self._word_cache:
+    def _invalid_file(self, game_type: str) -> Path:
+        return self.config.INVALID_WORDS_DIR / f"{game_type}_invalid.txt"
+
+    def _get_invalid_words(self, game_type: str) -> Set[str]:
+        """Load a game's invalid words list on first use; a missing file is an empty list."""
+        if game_type not in self._invalid_words:
+            try:
+                with open(self._invalid_file(game_type), 'r') as f:
+                    words = list(dict.fromkeys(word.strip().lower() for word in f))
+            except FileNotFoundError:
+                words = []
+            self._invalid_words[game_type] = set(words)
+            self._invalid_log[game_type] = words
+            self._invalid_digest[game_type] = hashlib.sha256(self._log_bytes(words))
+        return self._invalid_words[game_type]
+
+    @staticmethod
+    def _log_bytes(words: List[str]) -> bytes:
+        return ''.join(f"{word}\n" for word in words).encode('utf-8')
+
+    def GetWordList(self, game_type: str) -> WordListView:
+        """
+        Get game-specific filtered word list.
+
+        The result is a read-only set view over the shared compiled dictionary
+        with this game's invalid and actual words as small overlays.
+        """
+        if game_type in self._word_cache:
+            # Pick up words other runs have recorded since the cache was built
+            self._sync_actual_words(game_type)
+        else:
             base_words = self._get_base_words()
             actual_words = self._get_actual_words(game_type)
-            invalid_words = self._invalid_words.get(game_type, set())
+            invalid_words = self._get_invalid_words(game_type)
             
             # Combine sources with priority: actual > base - invalid
-            self._word_cache[game_type] = actual_words | (base_words - invalid_words)
+            self._word_cache[game_type] = WordListView(base_words, invalid_words - actual_words, actual_words)
             
         return self._word_cache[game_type]
 
-    def _get_base_words(self) -> Set[str]:
-        """Get base dictionary words."""
+    def GetFeatureTable(self, game_type: str) -> WordFeatureTable:
+        """Get the shared per-word feature table with this game's rows marked active."""
+        if self._features is None:
+            # Rows follow the compiled dictionary's sorted order, so its stored
+            # feature columns (when present) are used without recomputation
+            compiled = self._get_base_words()
+            self._features = WordFeatureTable(compiled, compiled.features())
+
+        table = self._features
+        if not table.has_game(game_type):
+            word_list = self.GetWordList(game_type)
+            table.active(game_type)
+            table.set_active(game_type, self._get_invalid_words(game_type) - word_list, False)
+            table.set_active(game_type, self._get_actual_words(game_type), True)
+        return table
+
+    def GetFeedbackMatrix(self):
+        """
+        Get the Wordle feedback matrix over the base dictionary's five-letter words.
+
+        It is memory-mapped from WORDLE_MATRIX_FILE, and only built (once per
+        dictionary checksum) when missing or stale.
+        """
+        if self._feedback is None:
+            from utils.wordle_feedback import FeedbackMatrix
+            compiled = self._get_base_words()
+            self._feedback = FeedbackMatrix.load(self.config.WORDLE_MATRIX_FILE, compiled, compiled.checksum)
+        return self._feedback
+
+    def LoadDictionary(self, session=None) -> None:
+        """Load the base dictionary now, downloading through session if a download is needed."""
+        self._dictionary.session = session
         try:
-            response = requests.get(config.WORD_LIST_URL)
-            response.raise_for_status()
-            return set(word.strip().lower() for word in response.text.split() if word.strip().isalpha())
-        except requests.RequestException as e:
-            raise GameExecutionError(f"Failed to download word list: {str(e)}")
+            self._get_base_words()
+        finally:
+            self._dictionary.session = None
+
+    def _get_base_words(self) -> CompiledDictionary:
+        """Get the memory-mapped base dictionary, a sorted read-only set of words."""
+        if self._compiled is None:
+            self._compiled = self._dictionary.load()
+            logger.debug(f"Loaded {len(self._compiled)} base words from {self._compiled.path}")
+        return self._compiled
 
     def _get_actual_words(self, game_type: str) -> Set[str]:
         """Load actual valid words from previous games."""
         if game_type not in self._actual_words:
-            self._actual_words[game_type] = set()
             actual_dir = self.config.CONFIGS[game_type].actual_dir
-            
-            for file in actual_dir.glob("*.json"):
-                try:
-                    with open(file, 'r') as f:
-                        data = json.load(f)
-                        if 'valid_words' in data:
-                            self._actual_words[game_type].update(data['valid_words'])
-                except (json.JSONDecodeError, IOError) as e:
-                    logger.warning(f"Error loading actual words from {file}: {e}")
-                    
+            self._actual_store.import_legacy_files(game_type, actual_dir)
+            words, self._actual_seq[game_type] = self._actual_store.load_since(game_type)
+            self._actual_words[game_type] = words
         return self._actual_words[game_type]
 
+    def _sync_actual_words(self, game_type: str) -> None:
+        """Apply actual words added since the last load, in O(new entries)."""
+        words, self._actual_seq[game_type] = self._actual_store.load_since(
+            game_type, self._actual_seq.get(game_type, 0)
+        )
+        if not words:
+            return
+
+        self._actual_words.setdefault(game_type, set()).update(words)
+        cache = self._word_cache.get(game_type)
+        if cache is None:
+            return
+        for word in words:
+            cache.add(word)
+        if self._features is not None and self._features.has_game(game_type):
+            self._features.set_active(game_type, words, True)
+
     def add_invalid_word(self, game_type: str, word: str) -> None:
         """Add a word to the invalid words list."""
-        word = word.strip().lower()
-        if not word:
+        self.add_invalid_words(game_type, [word])
+
+    def add_invalid_words(self, game_type: str, words: Iterable[str]) -> None:
+        """Add words to the invalid words list with a single buffered write."""
+        invalid_words = self._get_invalid_words(game_type)
+        new_words = []
+        for word in words:
+            word = word.strip().lower()
+            if word and word not in invalid_words:
+                invalid_words.add(word)
+                new_words.append(word)
+        self._invalid_log[game_type].extend(new_words)
+        if not new_words:
             return
-            
-        self._invalid_words[game_type].add(word)
-        invalid_file = self.config.DICTIONARY_DIR / "invalid" / f"{game_type}_invalid.txt"
-        
+        self._invalid_digest[game_type].update(self._log_bytes(new_words))
+
+        invalid_file = self._invalid_file(game_type)
+        invalid_file.parent.mkdir(parents=True, exist_ok=True)
         with open(invalid_file, 'a') as f:
-            f.write(f"{word}\n")
-        
-        # Clear cache to force reload
-        if game_type in self._word_cache:
-            del self._word_cache[game_type]
+            f.write(''.join(f"{word}\n" for word in new_words))
 
-    def save_actual_words(self, game_type: str, words: Set[str], date_str: str) -> None:
-        """Save actual valid words from a game."""
-        actual_file = self.config.CONFIGS[game_type].actual_dir / f"{game_type}_{date_str}.json"
-        
-        data = {
-            'date': date_str,
-            'valid_words': sorted(list(words))
-        }
-        
-        with open(actual_file, 'w') as f:
-            json.dump(data, f, indent=2)
-            
-        # Update cache
-        self._actual_words.setdefault(game_type, set()).update(words)
-        if game_type in self._word_cache:
-            del self._word_cache[game_type]
+        self._apply_invalid_delta(game_type, new_words)
+
+    def _apply_invalid_delta(self, game_type: str, words: List[str]) -> None:
+        """Remove newly invalid words from cached lists, indexes and subscribed games."""
+        cache = self._word_cache.get(game_type)
+        if cache is not None:
+            actual_words = self._actual_words.get(game_type, set())
+            for word in words:
+                # Actual words take priority over the invalid list
+                if word in cache and word not in actual_words:
+                    cache.discard(word)
+                    if self._features is not None and self._features.has_game(game_type):
+                        self._features.set_active(game_type, [word], False)
+
+        for game in list(self._subscribers):
+            if game.game_type == game_type:
+                game.on_invalid_words(words)
+
+    def DictionaryChecksum(self) -> str:
+        """Checksum of the base dictionary's words."""
+        return self._get_base_words().checksum
+
+    def OverlayVersions(self, game_type: str) -> Tuple[int, str, int]:
+        """
+        (invalid-word count, invalid-list hash, actual-word) versions.
+
+        The counts only grow as words are added; the hash covers the whole
+        invalid list, so an edit that keeps its length still changes it.
+        """
+        self._get_actual_words(game_type)
+        self._sync_actual_words(game_type)
+        self._get_invalid_words(game_type)
+        return (len(self._invalid_log[game_type]), self._invalid_digest[game_type].hexdigest(),
+                self._actual_seq.get(game_type, 0))
+
+    def OverlayDelta(self, game_type: str, versions: Tuple[int, str, int]) -> Optional[Tuple[List[str], Set[str]]]:
+        """
+        Invalid and actual words added since OverlayVersions returned versions.
+
+        None if the overlays no longer extend that state (e.g. the invalid
+        list was edited by hand), so the change cannot be described as a delta.
+        """
+        invalid_version, invalid_digest, actual_version = versions
+        current_invalid, _, current_actual = self.OverlayVersions(game_type)
+        if invalid_version > current_invalid or actual_version > current_actual:
+            return None
+        log = self._invalid_log[game_type]
+        if hashlib.sha256(self._log_bytes(log[:invalid_version])).hexdigest() != invalid_digest:
+            return None
+        invalid_added = log[invalid_version:]
+        actual_added, _ = self._actual_store.load_since(game_type, actual_version)
+        return invalid_added, actual_added
+
+    def subscribe(self, game) -> None:
+        """Notify a game of invalid-word updates for as long as it is alive."""
+        self._subscribers.add(game)
+
+    def save_actual_words(self, game_type: str, words: Iterable[str], date_str: str) -> None:
+        """Save actual valid words from a game, in the order given (callers pass them sorted)."""
+        self._get_actual_words(game_type)
+        self._actual_store.add(game_type, words, date_str)
+        self._sync_actual_words(game_type)
 
     def _get_game_path(self, game_type: str) -> Path:
         """Get the path for a game's daily data file."""
@@ -118,38 +237,61 @@ class WordManager:
             raise GameConfigError(f"Invalid game type: {game_type}")
         return config.CONFIGS[game_type].daily_dir / f"{game_type}_{config.current_date}.json"
 
-    def _validate_data(self, data: dict, game_type: str) -> bool:
+    def ValidateDailyData(self, game_type: str, data: dict) -> bool:
         """Validate game data against configuration rules."""
-        validator = config.CONFIGS[game_type].validation_rules.get('validator')
+        if not isinstance(data, dict):
+            return False
+        validator = self.config.CONFIGS[game_type].validation_rules.get('validator')
         if validator:
             return validator(data)
         return True  # No validation rules means accept all data
 
-    def SaveDailyData(self, game_type: str, data: Dict) -> None:
-        """Save daily game data to raw directory."""
-        data_file = config.CONFIGS[game_type].raw_dir / f"{game_type}_{config.current_date_str}.json"
-        with open(data_file, 'w') as f:
+    def SaveDailyData(self, game_type: str, data: Dict, date_str: Optional[str] = None) -> None:
+        """Save daily game data to the raw directory, where LoadDailyData reads it."""
+        self.config.CONFIGS[game_type].ensure_dirs()
+        data_file = self.DailyDataPath(game_type, date_str)
+        tmp_file = data_file.with_name(data_file.name + '.tmp')
+        with open(tmp_file, 'w') as f:
             json.dump(data, f, indent=2)
+        os.replace(tmp_file, data_file)
+        self._daily_data[(game_type, date_str or self.config.current_date_str)] = data
 
-    def LoadDailyData(self, game_type: str) -> Optional[Dict]:
-        """Load daily game data from file."""
+    def DailyDataPath(self, game_type: str, date_str: Optional[str] = None) -> Path:
+        """Path of the raw daily data file for a YYYYMMDD date (default: current date)."""
         config = self.config.CONFIGS[game_type]
         # Parse the YYYYMMDD string into a date object, then format as DDMMYYYY
-        current_date = datetime.strptime(self.config.current_date_str, "%Y%m%d")
-        date_str = current_date.strftime("%d%m%Y")
-        daily_file = config.raw_dir / f"{game_type}_{date_str}.json"
+        current_date = datetime.strptime(date_str or self.config.current_date_str, "%Y%m%d")
+        return config.raw_dir / f"{game_type}_{current_date.strftime('%d%m%Y')}.json"
+
+    def LoadDailyData(self, game_type: str, date_str: Optional[str] = None) -> Optional[Dict]:
+        """
+        Load daily game data from file for a YYYYMMDD date (default: current date).
+
+        Each file is read and validated once; later calls return the same result.
+        """
+        key = (game_type, date_str or self.config.current_date_str)
+        if key in self._daily_data:
+            return self._daily_data[key]
+
+        daily_file = self.DailyDataPath(game_type, date_str)
         logging.debug(f"Looking for daily data at: {daily_file}")
         
         try:
             with open(daily_file, 'r') as f:
-                return json.load(f)
+                data = json.load(f)
         except FileNotFoundError:
             logging.warning(f"Daily data file not found: {daily_file}")
             return None
         except json.JSONDecodeError as e:
             logging.error(f"Error decoding daily data file: {e}")
-            return None
+            data = None
+
+        if data is not None and not self.ValidateDailyData(game_type, data):
+            logging.error(f"Daily data in {daily_file} does not match the {game_type} format")
+            data = None
+        self._daily_data[key] = data
+        return data
 
     def is_invalid_word(self, game_type: str, word: str) -> bool:
         """Check if a word is in the invalid words list."""
-        return word.lower() in self._invalid_words.get(game_type, set())
\ No newline at end of file
+        return word.lower() in self._get_invalid_words(game_type)
\ No newline at end of file
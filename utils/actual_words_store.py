@@ -0,0 +1,88 @@
+from pathlib import Path
+from typing import Iterable, Set, Tuple
+import json
+import logging
+import os
+import sqlite3
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS actual_words (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    game_type TEXT NOT NULL,
+    word TEXT NOT NULL,
+    date TEXT,
+    UNIQUE (game_type, word)
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+class ActualWordStore:
+    """
+    Append-only SQLite log of words confirmed valid by past games.
+
+    Every new word gets an increasing sequence number, so a reader that
+    remembers the last sequence it saw only loads the rows added since.
+    """
+
+    def __init__(self, db_file: Path):
+        self.db_file = Path(db_file)
+        self._conn = None
+        self._pid = None
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        # SQLite connections must not be shared with forked children
+        if self._conn is None or self._pid != os.getpid():
+            self.db_file.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.db_file, check_same_thread=False)
+            self._conn.executescript(SCHEMA)
+            self._pid = os.getpid()
+        return self._conn
+
+    def load_since(self, game_type: str, after_seq: int = 0) -> Tuple[Set[str], int]:
+        """Return words added after after_seq and the latest sequence number."""
+        rows = self.conn.execute(
+            "SELECT seq, word FROM actual_words WHERE game_type = ? AND seq > ? ORDER BY seq",
+            (game_type, after_seq)
+        ).fetchall()
+        if not rows:
+            return set(), after_seq
+        return {word for _, word in rows}, rows[-1][0]
+
+    def add(self, game_type: str, words: Iterable[str], date_str: str) -> None:
+        """Record words; ones already stored for the game are ignored."""
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO actual_words (game_type, word, date) VALUES (?, ?, ?)",
+                ((game_type, word, date_str) for word in words)
+            )
+
+    def import_legacy_files(self, game_type: str, actual_dir: Path) -> None:
+        """One-time import of the per-day JSON files written by older versions."""
+        key = f"legacy_imported:{game_type}"
+        if self.conn.execute("SELECT 1 FROM meta WHERE key = ?", (key,)).fetchone():
+            return
+
+        for file in sorted(actual_dir.glob("*.json")):
+            try:
+                with open(file, 'r') as f:
+                    data = json.load(f)
+            except (json.JSONDecodeError, IOError) as e:
+                logger.warning(f"Error loading actual words from {file}: {e}")
+                continue
+            if 'valid_words' in data:
+                self.add(game_type, data['valid_words'], data.get('date'))
+
+        with self.conn:
+            self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, '1')", (key,))
+
+    def close(self) -> None:
+        if self._conn is not None and self._pid == os.getpid():
+            self._conn.close()
+        self._conn = None
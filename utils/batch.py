@@ -0,0 +1,287 @@
+from typing import Dict, Iterable, List, Optional, Tuple, Type
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import date, datetime, timedelta
+import gc
+import logging
+import multiprocessing
+import time
+
+from utils.errors import GameConfigError, GameError
+
+logger = logging.getLogger(__name__)
+
+# Solver state inherited by forked workers (copy-on-write) or built by _init_worker
+_worker_state: Dict = {}
+
+
+def parse_date(date_str: str) -> date:
+    """Parse a YYYYMMDD date string."""
+    try:
+        return datetime.strptime(date_str, "%Y%m%d").date()
+    except ValueError:
+        raise GameConfigError(f"Invalid date (expected YYYYMMDD): {date_str}")
+
+
+def iter_dates(start: date, end: date) -> Iterable[str]:
+    """Yield YYYYMMDD strings from start to end inclusive."""
+    day = start
+    while day <= end:
+        yield day.strftime("%Y%m%d")
+        day += timedelta(days=1)
+
+
+def _init_worker(config, game_classes: Dict[str, Type], game_codes: List[str], cache_file=None) -> None:
+    """Build solver state in a worker that did not inherit it from the parent."""
+    if _worker_state:
+        return
+    from utils.WordManager import WordManager
+    from utils.result_cache import ResultCache
+    result_cache = ResultCache(cache_file) if cache_file else None
+    _warm_state(WordManager(config), game_classes, game_codes, result_cache)
+
+
+def _warm_state(word_manager, game_classes: Dict[str, Type], game_codes: List[str], result_cache=None) -> None:
+    """Load word lists and the feature table once so every puzzle reuses them."""
+    for game_type in game_codes:
+        word_manager.GetWordList(game_type)
+        word_manager.GetFeatureTable(game_type)
+    if 'WD' in game_codes:
+        # Built (or mapped) once here rather than by every worker at once
+        word_manager.GetFeedbackMatrix()
+    _worker_state['word_manager'] = word_manager
+    _worker_state['game_classes'] = game_classes
+    _worker_state['result_cache'] = result_cache
+
+
+def _solve_puzzle(game_type: str, date_str: str) -> Dict:
+    """Solve one archived puzzle inside a worker."""
+    word_manager = _worker_state['word_manager']
+    daily_data = word_manager.LoadDailyData(game_type, date_str)
+    if daily_data is None:
+        return {'game_type': game_type, 'date': date_str, 'error': 'missing daily data'}
+
+    try:
+        game = _worker_state['game_classes'][game_type](word_manager, **daily_data)
+        game.FindValidWords()
+    except (GameError, KeyError, TypeError) as e:
+        return {'game_type': game_type, 'date': date_str, 'error': str(e)}
+
+    # Workers never write the cache: the parent stores the entry with the solution
+    result_cache = _worker_state.get('result_cache')
+    cache_entry = result_cache.entry(game) if result_cache is not None else None
+    result = _game_result(game, date_str, cache_entry[0] if cache_entry else None)
+    result['cache_entry'] = cache_entry
+    return result
+
+
+def _game_result(game, date_str: str, fingerprint: Optional[str] = None) -> Dict:
+    """A solved game as the picklable record _write_solution expects."""
+    return {
+        'game_type': game.game_type,
+        'date': date_str,
+        'words': sorted(game.FindValidWords()),
+        'solution_path': getattr(game, 'solution_path', None),
+        'sides': getattr(game, 'sides', None),
+        'score': game.Score() if hasattr(game, 'Score') else None,
+        'best_guesses': game.BestGuesses() if hasattr(game, 'BestGuesses') else None,
+        'fingerprint': fingerprint
+    }
+
+
+def _reuse_cached(game_type: str, date_str: str, word_manager, game_classes: Dict[str, Type],
+                  result_cache, visualizer) -> bool:
+    """
+    Settle a puzzle from the result cache if it still holds.
+
+    An unchanged puzzle whose saved solution carries the same fingerprint is
+    left alone; otherwise the cached result is written without solving.
+    Returns False if the puzzle has to be solved.
+    """
+    from utils.solution_archive import archive_for
+
+    daily_data = word_manager.LoadDailyData(game_type, date_str)
+    try:
+        game = game_classes[game_type](word_manager, **daily_data)
+        fingerprint = result_cache.fingerprint(game)
+        cached = result_cache.lookup(game)
+    except (GameError, KeyError, TypeError):
+        return False
+    if cached is None:
+        return False
+
+    if archive_for(word_manager.config.CONFIGS[game_type]).fingerprint(date_str) != fingerprint:
+        game.RestoreResult(cached)
+        _write_solution(_game_result(game, date_str, fingerprint), word_manager.config, visualizer)
+    return True
+
+
+def SolveDateRange(
+    start: date,
+    end: date,
+    game_codes: List[str],
+    word_manager,
+    game_classes: Dict[str, Type],
+    visualizer,
+    workers: Optional[int] = None,
+    result_cache=None
+) -> Dict:
+    """
+    Re-solve archived puzzles for a date range across a process pool.
+
+    The dictionary and indexes are loaded once in the parent; on platforms
+    with fork the workers inherit them copy-on-write, otherwise each worker
+    builds them once in its initializer. Solutions are written as soon as
+    each puzzle finishes. With a result cache, puzzles whose cached result
+    still holds are settled in the parent and never reach the pool, and new
+    results are stored by the parent too, so the cache has one writer.
+    Returns throughput statistics.
+    """
+    config = word_manager.config
+    for game_type in game_codes:
+        if game_type not in game_classes:
+            raise GameConfigError(f"Invalid game type: {game_type}")
+
+    tasks: List[Tuple[str, str]] = [
+        (game_type, date_str)
+        for date_str in iter_dates(start, end)
+        for game_type in game_codes
+        if word_manager.DailyDataPath(game_type, date_str).exists()
+    ]
+    reused = 0
+    if result_cache is not None:
+        remaining = [
+            task for task in tasks
+            if not _reuse_cached(*task, word_manager, game_classes, result_cache, visualizer)
+        ]
+        reused, tasks = len(tasks) - len(remaining), remaining
+    logger.info(f"Batch solving {len(tasks)} puzzles from {start} to {end} ({reused} reused from cache)")
+    if not tasks:
+        return {'puzzles': 0, 'failed': 0, 'cached': reused, 'seconds': 0.0, 'puzzles_per_second': 0.0}
+
+    started = time.perf_counter()
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context('fork' if 'fork' in methods else 'spawn')
+    if context.get_start_method() == 'fork':
+        _warm_state(word_manager, game_classes, game_codes, result_cache)
+        # Keep refcount updates from dirtying the shared word-list pages
+        gc.freeze()
+    elif 'WD' in game_codes:
+        # Write the feedback matrix once; spawned workers only map it
+        word_manager.GetFeedbackMatrix()
+
+    solved = failed = 0
+    try:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(config, game_classes, game_codes, result_cache.db_file if result_cache else None)
+        ) as pool:
+            futures = [pool.submit(_solve_puzzle, *task) for task in tasks]
+            for future in as_completed(futures):
+                result = future.result()
+                if 'error' in result:
+                    failed += 1
+                    logger.warning(f"{result['game_type']} {result['date']}: {result['error']}")
+                    continue
+
+                if result_cache is not None and result.get('cache_entry'):
+                    result_cache.put(*result['cache_entry'])
+                _write_solution(result, config, visualizer)
+                solved += 1
+                if solved % 100 == 0:
+                    rate = solved / (time.perf_counter() - started)
+                    logger.info(f"Solved {solved}/{len(tasks)} puzzles ({rate:.1f} puzzles/s)")
+    finally:
+        if context.get_start_method() == 'fork':
+            gc.unfreeze()
+
+    elapsed = time.perf_counter() - started
+    stats = {
+        'puzzles': solved,
+        'failed': failed,
+        'cached': reused,
+        'seconds': round(elapsed, 3),
+        'puzzles_per_second': round(solved / elapsed, 2) if elapsed else 0.0
+    }
+    logger.info(f"Batch complete: {solved} solved, {failed} failed in {elapsed:.1f}s "
+                f"({stats['puzzles_per_second']} puzzles/s)")
+    return stats
+
+
+def _write_solution(result: Dict, config, visualizer) -> None:
+    """Append one batch result to its game's archive, as a daily run would."""
+    game_type = result['game_type']
+    game_config = config.CONFIGS[game_type]
+    record = visualizer.solution_record(result['words'], result['date'])
+    if result.get('fingerprint'):
+        record['fingerprint'] = result['fingerprint']
+    if result.get('solution_path'):
+        record['solution_path'] = result['solution_path']
+    elif result.get('score'):
+        record['score'] = result['score']
+    elif result.get('best_guesses') is not None:
+        record['best_guesses'] = result['best_guesses']
+    visualizer.save_results(game_config, record)
+
+    # The SVG renderer is cheap enough to draw every archived day
+    if result.get('solution_path') and visualizer.render and visualizer.renderer == 'svg':
+        game_config.solutions_dir.mkdir(parents=True, exist_ok=True)
+        visualizer.render_solution(result['solution_path'], result['sides'],
+                                   game_config.solutions_dir / f"{result['date']}.svg", result['date'])
+
+
+def ScoreArchive(start: date, end: date, word_manager) -> int:
+    """
+    Add Spelling Bee scores to already-archived solutions in a date range.
+
+    Every solution is scored in one vectorized pass and appended again with
+    a 'score' entry (a per-day export of it, if present, is rewritten too);
+    puzzles without both raw data and a solution are skipped. Returns the
+    number of solutions updated.
+    """
+    from utils.bee_scoring import score_puzzles
+    from utils.solution_archive import archive_for
+
+    game_config = word_manager.config.CONFIGS['SB']
+    archive = archive_for(game_config)
+    records, puzzles = [], []
+    for record in archive.records(start.strftime("%Y%m%d"), end.strftime("%Y%m%d")):
+        daily_data = word_manager.LoadDailyData('SB', record['date'])
+        if daily_data is None:
+            continue
+        records.append(record)
+        puzzles.append((daily_data['mandatory_char'], daily_data['optional_chars'], record['words']))
+
+    for record, score in zip(records, score_puzzles(puzzles)):
+        record['score'] = score
+        archive.append(record)
+        solution_file = game_config.solutions_dir / f"{record['date']}.json"
+        if solution_file.exists():
+            archive.export(record, solution_file)
+    logger.info(f"Scored {len(records)} Spelling Bee solutions from {start} to {end}")
+    return len(records)
+
+
+def ExportSolutions(start: date, end: date, game_codes: List[str], config) -> int:
+    """
+    Write archived solutions in a date range as per-day JSON files.
+
+    The files match what daily runs wrote before the archive existed, in
+    each game's solutions directory. Returns the number of files written.
+    """
+    from utils.solution_archive import archive_for
+
+    for game_type in game_codes:
+        if game_type not in config.CONFIGS:
+            raise GameConfigError(f"Invalid game type: {game_type}")
+
+    exported = 0
+    for game_type in game_codes:
+        game_config = config.CONFIGS[game_type]
+        archive = archive_for(game_config)
+        for record in archive.records(start.strftime("%Y%m%d"), end.strftime("%Y%m%d")):
+            archive.export(record, game_config.solutions_dir / f"{record['date']}.json")
+            exported += 1
+    logger.info(f"Exported {exported} solutions from {start} to {end}")
+    return exported
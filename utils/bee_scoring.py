@@ -0,0 +1,98 @@
+from typing import Dict, Iterable, List, Sequence, Tuple
+import numpy as np
+
+from utils.letter_index import letters_to_mask
+from utils.word_features import compute_features
+
+# Words of four letters or fewer score one point, longer words one per letter
+SHORT_WORD_LENGTH = 4
+# Shorter words are not accepted (older archived solutions may still list them)
+MIN_WORD_LENGTH = 4
+PANGRAM_BONUS = 7
+# NYT ranks and the percentage of the maximum score each one needs
+RANKS = (
+    ('Beginner', 0), ('Good Start', 2), ('Moving Up', 5), ('Good', 8), ('Solid', 15),
+    ('Nice', 25), ('Great', 40), ('Amazing', 50), ('Genius', 70), ('Queen Bee', 100)
+)
+LETTERS = 'abcdefghijklmnopqrstuvwxyz'
+
+
+def rank_thresholds(max_score: int) -> Dict[str, int]:
+    """Points needed for each rank, rounded like the NYT hints page."""
+    return {name: int(round(max_score * percent / 100)) for name, percent in RANKS}
+
+
+def score_words(mandatory_char: str, allowed_chars: Iterable[str], words: Iterable[str]) -> Dict:
+    """Score one puzzle's word list; see score_puzzles."""
+    return score_puzzles([(mandatory_char, allowed_chars, words)])[0]
+
+
+def score_puzzles(puzzles: Sequence[Tuple[str, Iterable[str], Iterable[str]]]) -> List[Dict]:
+    """
+    Score many Spelling Bee puzzles in one vectorized pass.
+
+    Each puzzle is (mandatory_char, allowed_chars, words); words shorter
+    than MIN_WORD_LENGTH are not counted. The words of every
+    puzzle share one set of feature columns tagged with their puzzle, so
+    pangrams are a letter-mask comparison against the puzzle's mask and
+    points, the letter/length hint grid and the two-letter list are
+    per-puzzle bincounts rather than loops over each word list.
+
+    Returns one dict per puzzle: max_score, ranks, pangrams,
+    perfect_pangrams (each letter used once), grid ({letter: {length: n}}),
+    grid_totals ({length: n}) and two_letter ({prefix: n}).
+    """
+    word_lists = [sorted({word for word in words if len(word) >= MIN_WORD_LENGTH}) for _, _, words in puzzles]
+    counts = np.array([len(words) for words in word_lists], dtype=np.int64)
+    starts = np.concatenate([[0], np.cumsum(counts)])
+    all_words = [word for words in word_lists for word in words]
+    owner = np.repeat(np.arange(len(puzzles)), counts)
+
+    features = compute_features(all_words)
+    length = features['length'].astype(np.int64)
+    first = features['first'].astype(np.int64)
+    prefixes = np.zeros((len(all_words), 2), dtype=np.uint8)
+    if all_words:
+        prefixes = np.array([word[:2] for word in all_words], dtype='S2').view(np.uint8).reshape(-1, 2)
+    second = prefixes[:, 1].astype(np.int64) - 97
+
+    # Daily data lists the mandatory letter apart from the others
+    letter_sets = [sorted(set(''.join(allowed).lower()) | {mandatory.lower()}) for mandatory, allowed, _ in puzzles]
+    puzzle_masks = np.array([letters_to_mask(letters) for letters in letter_sets], dtype=np.uint32)
+    letter_counts = np.array([len(letters) for letters in letter_sets], dtype=np.int64)
+    pangram = features['mask'] == puzzle_masks[owner]
+    perfect = pangram & (length == letter_counts[owner])
+    points = np.where(length <= SHORT_WORD_LENGTH, 1, length) + PANGRAM_BONUS * pangram
+    totals = np.bincount(owner, weights=points, minlength=len(puzzles)).astype(np.int64)
+
+    lettered = first < 26
+    max_length = int(length.max()) if len(length) else 0
+    grid = np.zeros((len(puzzles), 26, max_length + 1), dtype=np.int64)
+    np.add.at(grid, (owner[lettered], first[lettered], length[lettered]), 1)
+    paired = lettered & (second >= 0) & (second < 26)
+    two_letter = np.zeros((len(puzzles), 26 * 26), dtype=np.int64)
+    np.add.at(two_letter, (owner[paired], first[paired] * 26 + second[paired]), 1)
+
+    results = []
+    for i, letters in enumerate(letter_sets):
+        words = word_lists[i]
+        local = slice(starts[i], starts[i + 1])
+        puzzle_grid = grid[i]
+        lengths = np.flatnonzero(puzzle_grid.sum(axis=0))
+        rows = {letter: puzzle_grid[ord(letter) - 97] for letter in letters}
+        results.append({
+            'max_score': int(totals[i]),
+            'ranks': rank_thresholds(int(totals[i])),
+            'pangrams': [words[j] for j in np.flatnonzero(pangram[local])],
+            'perfect_pangrams': [words[j] for j in np.flatnonzero(perfect[local])],
+            'grid': {
+                letter: {str(n): int(row[n]) for n in lengths if row[n]}
+                for letter, row in rows.items() if row.any()
+            },
+            'grid_totals': {str(n): int(puzzle_grid[:, n].sum()) for n in lengths},
+            'two_letter': {
+                LETTERS[code // 26] + LETTERS[code % 26]: int(two_letter[i, code])
+                for code in np.flatnonzero(two_letter[i])
+            }
+        })
+    return results
@@ -0,0 +1,370 @@
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+from array import array
+from datetime import datetime, timedelta
+import hashlib
+import json
+import logging
+import mmap
+import os
+import struct
+import sys
+
+from utils.errors import GameExecutionError
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"NYTD"
+FORMAT_VERSION = 3
+# Version 1 (no feature columns) and 2 (unverified columns) artifacts are still readable
+READABLE_VERSIONS = (1, 2, 3)
+
+# magic, format version, reserved, word count, blob length, sha256 of blob
+HEADER = struct.Struct("<4sHHII32s")
+# Format 3 follows HEADER with the sha256 of the offsets table and feature columns
+COLUMNS_DIGEST = struct.Struct("<32s")
+
+# Per-word feature columns stored after the blob (format 2), in file order
+FEATURE_COLUMNS = (
+    ('length', 'uint8', 1),
+    ('first', 'uint8', 1),
+    ('last', 'uint8', 1),
+    ('mask', 'uint32', 4),
+    ('pairs', 'uint64', 8),
+)
+
+
+def _align(offset: int, size: int) -> int:
+    return (offset + size - 1) // size * size
+
+
+def _feature_layout(blob_end: int, count: int) -> Tuple[Dict[str, Tuple[int, str, Tuple]], int]:
+    """Offsets, dtypes and shapes of the feature columns, and the end of the file."""
+    from utils.word_features import PAIR_WORDS
+
+    layout = {}
+    offset = blob_end
+    for name, dtype, size in FEATURE_COLUMNS:
+        shape = (count, PAIR_WORDS) if name == 'pairs' else (count,)
+        offset = _align(offset, size)
+        layout[name] = (offset, dtype, shape)
+        items = count * PAIR_WORDS if name == 'pairs' else count
+        offset += items * size
+    return layout, offset
+
+
+class CompiledDictionary:
+    """
+    Read-only, memory-mapped view of a compiled dictionary artifact.
+
+    Layout (little endian):
+        header   -- see HEADER (and COLUMNS_DIGEST, format 3)
+        offsets  -- uint32[word_count + 1], start of each word in blob
+        blob     -- sorted words, each terminated by a newline
+        features -- (format 2) FEATURE_COLUMNS, each aligned to its item size
+
+    Attributes:
+        path (Path): Location of the artifact on disk
+        meta (dict): Sidecar metadata (source checksum, build time, ...)
+        checksum (str): Hex sha256 of the word blob; identifies the word list
+
+    verify checks the blob against its digest and, from format 3, the
+    offsets table and feature columns the filters read against theirs.
+    """
+
+    def __init__(self, path: Path, meta: Dict, verify: bool = True):
+        self.path = path
+        self.meta = meta
+        with open(path, 'rb') as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            magic, version, _, count, blob_len, digest = HEADER.unpack_from(self._mm, 0)
+            if magic != MAGIC:
+                raise GameExecutionError(f"Not a compiled dictionary: {path}")
+            if version not in READABLE_VERSIONS:
+                raise GameExecutionError(f"Unsupported dictionary format {version} in {path}")
+
+            offsets_start = HEADER.size
+            columns_digest = None
+            if version >= 3:
+                columns_digest, = COLUMNS_DIGEST.unpack_from(self._mm, HEADER.size)
+                offsets_start += COLUMNS_DIGEST.size
+            self._offsets_start = offsets_start
+            self._blob_start = offsets_start + 4 * (count + 1)
+            self._blob_end = self._blob_start + blob_len
+            self._layout = None
+            expected_size = self._blob_end
+            if version >= 2:
+                self._layout, expected_size = _feature_layout(self._blob_end, count)
+            if len(self._mm) != expected_size:
+                raise GameExecutionError(f"Truncated dictionary artifact: {path}")
+
+            if sys.byteorder == 'little':
+                # Zero-copy view, shared with forked workers like the blob itself
+                self._offsets = memoryview(self._mm)[offsets_start:self._blob_start].cast('I')
+            else:
+                self._offsets = array('I')
+                self._offsets.frombytes(self._mm[offsets_start:self._blob_start])
+                self._offsets.byteswap()
+
+            self._count = count
+            self.checksum = digest.hex()
+            self.version = version
+            if verify and hashlib.sha256(self._mm[self._blob_start:self._blob_end]).digest() != digest:
+                raise GameExecutionError(f"Checksum mismatch in dictionary artifact: {path}")
+            if verify and columns_digest is not None and self._columns_digest() != columns_digest:
+                raise GameExecutionError(f"Feature checksum mismatch in dictionary artifact: {path}")
+        except (struct.error, GameExecutionError):
+            if isinstance(getattr(self, '_offsets', None), memoryview):
+                self._offsets.release()
+            self._mm.close()
+            raise
+
+    def _columns_digest(self) -> bytes:
+        """sha256 of the offsets table and everything after the blob (feature columns)."""
+        digest = hashlib.sha256(self._mm[self._offsets_start:self._blob_start])
+        for start in range(self._blob_end, len(self._mm), 1 << 24):
+            digest.update(self._mm[start:min(start + (1 << 24), len(self._mm))])
+        return digest.digest()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> str:
+        """Return the word at a sorted position without decoding the whole blob."""
+        if not 0 <= index < self._count:
+            raise IndexError(index)
+        start = self._blob_start + self._offsets[index]
+        end = self._blob_start + self._offsets[index + 1] - 1
+        return self._mm[start:end].decode('ascii')
+
+    def __iter__(self) -> Iterator[str]:
+        """Decode words in sorted order, a chunk of the blob at a time."""
+        start, end = self._blob_start, self._blob_end
+        rest = ''
+        while start < end:
+            stop = min(start + (1 << 20), end)
+            lines = (rest + self._mm[start:stop].decode('ascii')).split('\n')
+            rest = lines.pop()
+            yield from lines
+            start = stop
+
+    def __contains__(self, word: object) -> bool:
+        return isinstance(word, str) and self.row(word) >= 0
+
+    def row(self, word: str) -> int:
+        """Sorted position of word, or -1 if absent, by binary search over the mapping."""
+        try:
+            key = word.encode('ascii')
+        except UnicodeEncodeError:
+            return -1
+        mm, base, offsets = self._mm, self._blob_start, self._offsets
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if mm[base + offsets[mid]:base + offsets[mid + 1] - 1] < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self._count and mm[base + offsets[lo]:base + offsets[lo + 1] - 1] == key:
+            return lo
+        return -1
+
+    def word_list(self) -> List[str]:
+        """Decode every word, in sorted (row) order."""
+        return self._mm[self._blob_start:self._blob_end].decode('ascii').split('\n')[:-1]
+
+    def words(self) -> Set[str]:
+        """Decode every word into a set."""
+        return set(self.word_list())
+
+    def packed(self) -> Tuple:
+        """Zero-copy numpy views of the offsets table and the word blob."""
+        import numpy as np
+
+        offsets = np.frombuffer(self._mm, dtype='<u4', count=self._count + 1, offset=self._offsets_start)
+        blob = np.frombuffer(self._mm, dtype=np.uint8, count=self._blob_end - self._blob_start,
+                             offset=self._blob_start)
+        return offsets, blob
+
+    def features(self) -> Optional[Dict]:
+        """Zero-copy, read-only views of the stored feature columns, if any."""
+        if self._layout is None:
+            return None
+        import numpy as np
+
+        return {
+            name: np.frombuffer(self._mm, dtype=np.dtype(dtype).newbyteorder('<'),
+                                count=int(np.prod(shape)), offset=offset).reshape(shape)
+            for name, (offset, dtype, shape) in self._layout.items()
+        }
+
+    def close(self) -> None:
+        try:
+            if isinstance(self._offsets, memoryview):
+                self._offsets.release()
+            self._mm.close()
+        except BufferError:
+            # Feature views still reference the mapping; it closes with them
+            pass
+
+
+class DictionaryCache:
+    """
+    Builds and loads the compiled base dictionary under DICTIONARY_DIR.
+
+    The plain-text word list (bundled or previously fetched) is compiled once
+    into a binary artifact that is memory-mapped on later runs. The network is
+    only used when no local copy exists or the compiled copy has aged out, and
+    a failed refresh falls back to whatever is on disk.
+    """
+
+    def __init__(self, config):
+        self.config = config
+        self.source_file: Path = config.WORD_LIST_FILE
+        self.compiled_file: Path = config.COMPILED_DICTIONARY_FILE
+        self.meta_file: Path = self.compiled_file.with_suffix('.json')
+        self.max_age = timedelta(days=config.DICTIONARY_MAX_AGE_DAYS)
+        # Optional requests session for downloads (connection reuse and retries)
+        self.session = None
+
+    def load(self) -> CompiledDictionary:
+        """Return the compiled dictionary, rebuilding or refreshing it if needed."""
+        compiled = self._open_compiled()
+        if compiled and not self._is_stale(compiled.meta):
+            return compiled
+
+        if not self.source_file.exists() or (compiled and self._is_expired(compiled.meta)):
+            try:
+                self._fetch_source()
+            except GameExecutionError as e:
+                if compiled:
+                    logger.warning(f"{e}; using existing compiled dictionary")
+                    return compiled
+                if not self.source_file.exists():
+                    raise
+                logger.warning(f"{e}; compiling previously fetched word list")
+
+        if compiled:
+            compiled.close()
+        self.compile()
+        return self._open_compiled(verify=False)
+
+    def compile(self) -> None:
+        """Compile the local word list into the binary artifact."""
+        with open(self.source_file, 'r', encoding='utf-8', errors='ignore') as f:
+            words = sorted({
+                word.strip().lower() for word in f.read().split()
+                if word.strip().isalpha() and word.isascii()
+            })
+
+        blob = ''.join(f"{word}\n" for word in words).encode('ascii')
+        offsets = array('I', [0])
+        for word in words:
+            offsets.append(offsets[-1] + len(word) + 1)
+        if sys.byteorder != 'little':
+            offsets.byteswap()
+
+        import numpy as np
+        from utils.word_features import compute_features
+        features = compute_features(words)
+        blob_end = HEADER.size + COLUMNS_DIGEST.size + 4 * (len(words) + 1) + len(blob)
+        layout, _ = _feature_layout(blob_end, len(words))
+        columns = []
+        position = blob_end
+        for name, (offset, dtype, _) in layout.items():
+            data = features[name].astype(np.dtype(dtype).newbyteorder('<')).tobytes()
+            columns += [b'\0' * (offset - position), data]
+            position = offset + len(data)
+
+        digest = hashlib.sha256(blob).digest()
+        columns_digest = hashlib.sha256(offsets.tobytes())
+        for chunk in columns:
+            columns_digest.update(chunk)
+        header = (HEADER.pack(MAGIC, FORMAT_VERSION, 0, len(words), len(blob), digest) +
+                  COLUMNS_DIGEST.pack(columns_digest.digest()))
+
+        self.compiled_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.compiled_file.with_name(self.compiled_file.name + '.tmp')
+        with open(tmp_file, 'wb') as f:
+            f.write(header)
+            f.write(offsets.tobytes())
+            f.write(blob)
+            for chunk in columns:
+                f.write(chunk)
+        os.replace(tmp_file, self.compiled_file)
+
+        stat = self.source_file.stat()
+        meta = {
+            'format_version': FORMAT_VERSION,
+            'source': str(self.source_file),
+            'source_size': stat.st_size,
+            'source_mtime': stat.st_mtime,
+            'source_sha256': self._hash_file(self.source_file),
+            'built_at': datetime.now().isoformat(),
+            'word_count': len(words),
+            'checksum': digest.hex()
+        }
+        with open(self.meta_file, 'w') as f:
+            json.dump(meta, f, indent=2)
+        logger.debug(f"Compiled {len(words)} words into {self.compiled_file}")
+
+    def _open_compiled(self, verify: bool = True) -> Optional[CompiledDictionary]:
+        if not (self.compiled_file.exists() and self.meta_file.exists()):
+            return None
+        try:
+            with open(self.meta_file, 'r') as f:
+                meta = json.load(f)
+            compiled = CompiledDictionary(self.compiled_file, meta, verify=verify)
+        except (json.JSONDecodeError, IOError, ValueError, struct.error, GameExecutionError) as e:
+            logger.warning(f"Ignoring unusable compiled dictionary: {e}")
+            return None
+        if meta.get('checksum') != compiled.checksum:
+            logger.warning("Compiled dictionary metadata does not match artifact")
+            compiled.close()
+            return None
+        return compiled
+
+    def _is_expired(self, meta: Dict) -> bool:
+        try:
+            built_at = datetime.fromisoformat(meta['built_at'])
+        except (KeyError, ValueError):
+            return True
+        return datetime.now() - built_at > self.max_age
+
+    def _is_stale(self, meta: Dict) -> bool:
+        """A compiled copy is stale once it is too old or its source has changed."""
+        if meta.get('format_version') != FORMAT_VERSION or self._is_expired(meta):
+            return True
+        if not self.source_file.exists():
+            return False
+
+        stat = self.source_file.stat()
+        if stat.st_size == meta.get('source_size') and stat.st_mtime == meta.get('source_mtime'):
+            return False
+        return self._hash_file(self.source_file) != meta.get('source_sha256')
+
+    def _fetch_source(self) -> None:
+        """Download the word list into the local source file."""
+        import requests
+
+        try:
+            response = (self.session or requests).get(self.config.WORD_LIST_URL, timeout=30)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            raise GameExecutionError(f"Failed to download word list: {str(e)}")
+
+        self.source_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.source_file.with_name(self.source_file.name + '.tmp')
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            f.write(response.text)
+        os.replace(tmp_file, self.source_file)
+
+    @staticmethod
+    def _hash_file(path: Path) -> str:
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
@@ -2,4 +2,5 @@ class GameError(Exception): pass
 class GameConfigError(GameError): pass
 class WordValidationError(GameError): pass
 class GameInitializationError(GameError): pass
-class GameExecutionError(GameError): pass
\ No newline at end of file
+class GameExecutionError(GameError): pass
+class SolverBudgetError(GameExecutionError): pass
@@ -0,0 +1,118 @@
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+import asyncio
+import json
+import logging
+
+from utils.errors import GameConfigError, GameError, GameExecutionError
+
+logger = logging.getLogger(__name__)
+
+# Responses worth retrying; anything else fails immediately
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+def make_session(retries: int = 3, backoff: float = 0.5, pool_size: int = 8):
+    """A requests session that reuses connections and retries transient failures."""
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    retry = Retry(total=retries, backoff_factor=backoff, status_forcelist=RETRY_STATUSES,
+                  allowed_methods=frozenset(['GET']))
+    adapter = HTTPAdapter(max_retries=retry, pool_connections=pool_size, pool_maxsize=pool_size)
+    session = requests.Session()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+class DailyIngest:
+    """
+    Concurrently gathers each game's daily data and the word list.
+
+    Games with a URL template in sources (formatted with game and date,
+    YYYYMMDD) are fetched over one shared session and saved to the raw
+    directory; the others are read from their local raw file. The dictionary
+    loads in a worker thread at the same time, so the first puzzle can be
+    solved as soon as both it and the word list are ready.
+    """
+
+    def __init__(
+        self,
+        word_manager,
+        game_codes: List[str],
+        date_str: Optional[str] = None,
+        sources: Optional[Dict[str, str]] = None,
+        timeout: float = 10.0,
+        retries: int = 3,
+        backoff: float = 0.5
+    ):
+        self.word_manager = word_manager
+        self.game_codes = game_codes
+        self.date_str = date_str or word_manager.config.current_date_str
+        self.sources = word_manager.config.PUZZLE_SOURCES if sources is None else sources
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self._session = None
+
+    @property
+    def session(self):
+        if self._session is None:
+            self._session = make_session(self.retries, self.backoff, max(len(self.game_codes) + 1, 2))
+        return self._session
+
+    async def puzzles(self) -> AsyncIterator[Tuple[str, Optional[Dict]]]:
+        """Yield (game_type, daily data or None) in arrival order, once the dictionary is loaded."""
+        self.session  # Created up front, before worker threads share it
+        dictionary = asyncio.create_task(self.load_dictionary())
+        pending = [asyncio.create_task(self.load_puzzle(game_type)) for game_type in self.game_codes]
+        try:
+            for next_done in asyncio.as_completed(pending):
+                game_type, data = await next_done
+                await dictionary
+                yield game_type, data
+            await dictionary
+        finally:
+            for task in pending + [dictionary]:
+                task.cancel()
+            if self._session is not None:
+                self._session.close()
+
+    async def load_dictionary(self) -> None:
+        """Load (and if needed download) the base dictionary and each game's word list."""
+        def load():
+            self.word_manager.LoadDictionary(self.session)
+            for game_type in self.game_codes:
+                self.word_manager.GetWordList(game_type)
+        await asyncio.to_thread(load)
+
+    async def load_puzzle(self, game_type: str) -> Tuple[str, Optional[Dict]]:
+        """Fetch a game's daily data from its source, or read the local raw file."""
+        url = self.sources.get(game_type)
+        if not url:
+            data = await asyncio.to_thread(self.word_manager.LoadDailyData, game_type, self.date_str)
+            return game_type, data
+
+        url = url.format(game=game_type, date=self.date_str)
+        try:
+            data = await asyncio.to_thread(self._get_json, url)
+            if not self.word_manager.ValidateDailyData(game_type, data):
+                raise GameConfigError(f"Data from {url} does not match the {game_type} format")
+        except GameError as e:
+            logger.warning(f"{e}; falling back to local data for {game_type}")
+            data = await asyncio.to_thread(self.word_manager.LoadDailyData, game_type, self.date_str)
+            return game_type, data
+
+        await asyncio.to_thread(self.word_manager.SaveDailyData, game_type, data, self.date_str)
+        return game_type, data
+
+    def _get_json(self, url: str) -> Dict:
+        import requests
+
+        try:
+            response = self.session.get(url, timeout=self.timeout)
+            response.raise_for_status()
+            return response.json()
+        except (requests.RequestException, json.JSONDecodeError, ValueError) as e:
+            raise GameExecutionError(f"Failed to fetch {url}: {e}")
@@ -0,0 +1,158 @@
+from typing import Any, Callable, Dict, List, Optional
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+from pathlib import Path
+import json
+import logging
+import sys
+import time
+import tracemalloc
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+# Returned by stage() while disabled, so instrumented code pays one attribute check
+_NULL_STAGE = nullcontext()
+# ru_maxrss is in bytes on macOS and kilobytes elsewhere
+_MAXRSS_SCALE = 1024 if sys.platform == 'darwin' else 1
+
+
+def _max_rss_kb() -> Optional[float]:
+    if resource is None:
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / _MAXRSS_SCALE
+
+
+class Instrumentation:
+    """
+    Per-run stage timings, counters and memory deltas for the solve pipeline.
+
+    Disabled by default: stage() returns a shared no-op context manager and
+    count() returns immediately, so instrumented hot paths cost one
+    attribute check. When enabled, every finished stage is kept as an event,
+    aggregated per name, and passed to any registered callbacks. Each stage
+    records how much it grew the peak RSS; track_memory adds exact Python
+    allocation deltas from tracemalloc, at several times the run time.
+
+    Attributes:
+        enabled (bool): Whether stages and counters are recorded
+        track_memory (bool): Also record tracemalloc deltas per stage
+        events (list[dict]): Finished stages in completion order
+        counters (dict): Counter name -> running total
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.track_memory = False
+        self.events: List[Dict[str, Any]] = []
+        self.counters: Dict[str, int] = {}
+        self._callbacks: List[Callable[[Dict[str, Any]], None]] = []
+        self._stack: List[str] = []
+        self._started_at: Optional[str] = None
+
+    def enable(self, track_memory: bool = False) -> None:
+        """Start recording; track_memory adds tracemalloc overhead to every stage."""
+        self.enabled = True
+        self.track_memory = track_memory
+        self._started_at = self._started_at or datetime.now().isoformat()
+        if track_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def disable(self) -> None:
+        self.enabled = False
+        if self.track_memory and tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self.track_memory = False
+
+    def reset(self) -> None:
+        """Drop recorded events and counters, keeping callbacks."""
+        self.events.clear()
+        self.counters.clear()
+        self._started_at = datetime.now().isoformat() if self.enabled else None
+
+    def add_callback(self, callback: Callable[[Dict[str, Any]], None]) -> None:
+        """Call callback(event) as each stage finishes."""
+        self._callbacks.append(callback)
+
+    def remove_callback(self, callback: Callable[[Dict[str, Any]], None]) -> None:
+        self._callbacks.remove(callback)
+
+    def stage(self, name: str, **labels):
+        """Context manager timing one pipeline stage; labels are stored with the event."""
+        if not self.enabled:
+            return _NULL_STAGE
+        return self._stage(name, labels)
+
+    @contextmanager
+    def _stage(self, name: str, labels: Dict[str, Any]):
+        self._stack.append(name)
+        memory_before = tracemalloc.get_traced_memory()[0] if self.track_memory else None
+        rss_before = _max_rss_kb()
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - started
+            path = '/'.join(self._stack)
+            self._stack.pop()
+            event = {'stage': name, 'path': path, 'seconds': round(seconds, 6), **labels}
+            if rss_before is not None:
+                event['max_rss_delta_kb'] = round(_max_rss_kb() - rss_before, 1)
+            if memory_before is not None and tracemalloc.is_tracing():
+                current, peak = tracemalloc.get_traced_memory()
+                event['memory_delta_kb'] = round((current - memory_before) / 1024, 1)
+                event['memory_peak_kb'] = round(peak / 1024, 1)
+            self.events.append(event)
+            for callback in self._callbacks:
+                try:
+                    callback(event)
+                except Exception as e:
+                    logger.warning(f"Instrumentation callback failed: {e}")
+
+    def count(self, name: str, value: int = 1) -> None:
+        """Add value to a named counter."""
+        if self.enabled:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def count_all(self, prefix: str, values: Dict[str, int]) -> None:
+        """Add every entry of a stats dict under prefix.name."""
+        if self.enabled:
+            for name, value in values.items():
+                self.count(f"{prefix}.{name}", value)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Per-stage-path totals: calls, total and max milliseconds."""
+        totals: Dict[str, Dict[str, float]] = {}
+        for event in self.events:
+            entry = totals.setdefault(event['path'], {'calls': 0, 'total_ms': 0.0, 'max_ms': 0.0})
+            ms = event['seconds'] * 1000
+            entry['calls'] += 1
+            entry['total_ms'] = round(entry['total_ms'] + ms, 3)
+            entry['max_ms'] = round(max(entry['max_ms'], ms), 3)
+        return totals
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'started_at': self._started_at,
+            'finished_at': datetime.now().isoformat(),
+            'stages': self.summary(),
+            'counters': dict(sorted(self.counters.items())),
+            'events': list(self.events)
+        }
+
+    def write(self, path: Path) -> Path:
+        """Write the run's metrics as JSON and return the path."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f, indent=2)
+        logger.debug(f"Wrote metrics to {path}")
+        return path
+
+
+# Process-wide instance used by the solve pipeline
+metrics = Instrumentation()
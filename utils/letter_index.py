@@ -0,0 +1,34 @@
+from typing import Iterable, Iterator
+
+# Bit set for any character outside a-z so such words never match a query
+FOREIGN_BIT = 1 << 26
+
+
+def letter_mask(word: str) -> int:
+    """Return the 26-bit set of letters used by a word."""
+    mask = 0
+    for c in word:
+        bit = ord(c) - 97
+        mask |= (1 << bit) if 0 <= bit < 26 else FOREIGN_BIT
+    return mask
+
+
+def letters_to_mask(letters: Iterable[str]) -> int:
+    """Return the 26-bit mask for a collection of letters."""
+    return letter_mask(''.join(letters).lower())
+
+
+def submasks(required_mask: int, allowed_mask: int) -> Iterator[int]:
+    """
+    Yield every subset of allowed_mask that includes required_mask.
+
+    A letter-set puzzle becomes a handful of exact-mask lookups this way, so
+    its cost depends on the number of letters rather than the dictionary size.
+    """
+    free = allowed_mask & ~required_mask
+    sub = free
+    while True:
+        yield sub | required_mask
+        if sub == 0:
+            return
+        sub = (sub - 1) & free
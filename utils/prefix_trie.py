@@ -0,0 +1,102 @@
+from typing import Callable, List, Optional, Sequence, Tuple, TypeVar
+import numpy as np
+
+LETTERS = 'abcdefghijklmnopqrstuvwxyz'
+# Letters are coded 1-26 and 0 marks the end of a shorter word, so codes sort like words
+RADIX = len(LETTERS) + 1
+
+State = TypeVar('State')
+
+
+def prefix_codes(words: Sequence[str], depth: int) -> np.ndarray:
+    """
+    Base-27 code of each word's first depth letters.
+
+    Packed word stores (the compiled dictionary) are coded straight from their
+    bytes. Characters outside a-z are clamped to the nearest letter code;
+    such words only ever land in extra candidate rows.
+    """
+    if hasattr(words, 'packed'):
+        offsets, blob = words.packed()
+        starts = offsets[:-1].astype(np.int64)
+        lengths = np.diff(offsets).astype(np.int64) - 1
+        codes = np.zeros(len(starts), dtype=np.int64)
+        if not len(blob):
+            return codes
+        for k in range(depth):
+            letter = blob[np.minimum(starts + k, len(blob) - 1)].astype(np.int64) - 96
+            codes = codes * RADIX + np.where(lengths > k, np.clip(letter, 0, RADIX - 1), 0)
+        return codes
+
+    def code(word: str) -> int:
+        value = 0
+        for k in range(depth):
+            letter = ord(word[k]) - 96 if k < len(word) else 0
+            value = value * RADIX + min(max(letter, 0), RADIX - 1)
+        return value
+    return np.fromiter((code(word) for word in words), dtype=np.int64, count=len(words))
+
+
+class PrefixTrie:
+    """
+    Shallow trie over a sorted word sequence, stored as row boundaries.
+
+    In sorted order every trie node is a contiguous range of rows. One
+    searchsorted over the words' prefix codes gives the boundaries of every
+    node `depth` letters deep, and a shallower node is the union of its
+    consecutive children, so the whole trie costs 4 bytes per possible
+    deepest node (about 77KB at depth 3) and no per-word objects.
+
+    walk() descends only through letters a caller accepts, skipping every
+    row under a rejected or empty prefix. The rows it returns match on their
+    first depth letters; callers still check the rest of each word.
+    """
+
+    def __init__(self, codes: np.ndarray, depth: int = 3):
+        self.depth = depth
+        self.bounds = np.searchsorted(codes, np.arange(RADIX ** depth + 1)).astype(np.int32)
+
+    @classmethod
+    def build(cls, words: Sequence[str], depth: int = 3) -> Optional['PrefixTrie']:
+        """Trie over words, or None if they are not in sorted order."""
+        codes = prefix_codes(words, depth)
+        if np.any(codes[1:] < codes[:-1]):
+            return None
+        return cls(codes, depth)
+
+    def walk(self, step: Callable[[State, str], Optional[State]], state: State) -> List[Tuple[int, int]]:
+        """
+        Row ranges of words whose leading letters step accepts, in row order.
+
+        step(state, letter) returns the state after appending letter to a
+        prefix, or None to prune every word under that prefix. Words shorter
+        than depth are included once all of their letters are accepted.
+        """
+        bounds, depth = self.bounds, self.depth
+        found = []
+        stack = [(0, 0, state)]
+        while stack:
+            code, level, state = stack.pop()
+            span = RADIX ** (depth - level)
+            lo, hi = int(bounds[code * span]), int(bounds[(code + 1) * span])
+            if lo == hi:
+                continue
+            if level == depth:
+                found.append((lo, hi))
+                continue
+            # The word equal to this prefix, if any, sorts before its extensions
+            end = int(bounds[code * span + span // RADIX])
+            if level and end > lo:
+                found.append((lo, end))
+            for index, letter in enumerate(LETTERS, 1):
+                next_state = step(state, letter)
+                if next_state is not None:
+                    stack.append((code * RADIX + index, level + 1, next_state))
+        return sorted(found)
+
+    def rows(self, step: Callable[[State, str], Optional[State]], state: State) -> np.ndarray:
+        """Row numbers covered by walk(step, state)."""
+        ranges = self.walk(step, state)
+        if not ranges:
+            return np.zeros(0, dtype=np.int64)
+        return np.concatenate([np.arange(lo, hi, dtype=np.int64) for lo, hi in ranges])
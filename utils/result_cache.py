@@ -0,0 +1,128 @@
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+
+logger = logging.getLogger(__name__)
+
+# Bumped when the table changes; older caches are dropped rather than migrated
+SCHEMA_VERSION = 2
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    key TEXT PRIMARY KEY,
+    game_type TEXT NOT NULL,
+    invalid_version INTEGER NOT NULL,
+    invalid_digest TEXT NOT NULL,
+    actual_version INTEGER NOT NULL,
+    result TEXT NOT NULL
+);
+"""
+
+
+class ResultCache:
+    """
+    Content-addressed SQLite store of solved puzzles.
+
+    An entry's key hashes the game type, the normalized puzzle
+    (Game.PuzzleKey) and the base dictionary checksum, so the same puzzle on
+    any date is one lookup. Each entry also records the invalid- and
+    actual-word overlay versions it was solved under. When those have moved
+    on, only the words added since are checked against the puzzle: the
+    entry is reused (and restamped) unless one of them is a newly invalid
+    cached word or a newly confirmed word the puzzle accepts.
+    """
+
+    def __init__(self, db_file: Path):
+        self.db_file = Path(db_file)
+        self._conn = None
+        self._pid = None
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        # SQLite connections must not be shared with forked children
+        if self._conn is None or self._pid != os.getpid():
+            self.db_file.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.db_file, check_same_thread=False)
+            if self._conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+                self._conn.executescript(f"DROP TABLE IF EXISTS results; PRAGMA user_version = {SCHEMA_VERSION};")
+            self._conn.executescript(SCHEMA)
+            self._pid = os.getpid()
+        return self._conn
+
+    @staticmethod
+    def key(game_type: str, puzzle_key: str, dictionary_checksum: str) -> str:
+        payload = json.dumps([game_type, puzzle_key, dictionary_checksum])
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[Tuple[Tuple[int, str, int], Dict]]:
+        """Stored (overlay versions, result) for key, if any."""
+        row = self.conn.execute(
+            "SELECT invalid_version, invalid_digest, actual_version, result FROM results WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        return (row[0], row[1], row[2]), json.loads(row[3])
+
+    def put(self, key: str, game_type: str, versions: Tuple[int, str, int], result: Dict) -> None:
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO results "
+                "(key, game_type, invalid_version, invalid_digest, actual_version, result) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, game_type, *versions, json.dumps(result))
+            )
+
+    def fingerprint(self, game) -> Optional[str]:
+        """Cache key of game's puzzle under the current dictionary, or None if it is not cacheable."""
+        puzzle_key = game.PuzzleKey()
+        if puzzle_key is None:
+            return None
+        return self.key(game.game_type, puzzle_key, game.word_manager.DictionaryChecksum())
+
+    def lookup(self, game) -> Optional[Dict]:
+        """The cached result for game's puzzle if no overlay change since affects it."""
+        key = self.fingerprint(game)
+        entry = self.get(key) if key else None
+        if entry is None:
+            return None
+
+        versions, result = entry
+        word_manager = game.word_manager
+        current = word_manager.OverlayVersions(game.game_type)
+        if versions == current:
+            return result
+
+        delta = word_manager.OverlayDelta(game.game_type, versions)
+        if delta is None:
+            return None
+        invalid_added, actual_added = delta
+        words = set(result['words'])
+        if any(word in words for word in invalid_added):
+            return None
+        if any(word not in words and game.ValidateWord(word) for word in actual_added):
+            return None
+
+        logger.debug(f"{game.game_type} overlay changes do not affect {game.PuzzleKey()}; reusing result")
+        self.put(key, game.game_type, current, result)
+        return result
+
+    def entry(self, game) -> Optional[Tuple[str, str, Tuple[int, str, int], Dict]]:
+        """The put() arguments recording game's solved result, without touching the database."""
+        key = self.fingerprint(game)
+        if not key:
+            return None
+        return key, game.game_type, game.word_manager.OverlayVersions(game.game_type), game.GetResult()
+
+    def store(self, game) -> None:
+        """Record game's solved result under the current dictionary and overlays."""
+        entry = self.entry(game)
+        if entry:
+            self.put(*entry)
+
+    def close(self) -> None:
+        if self._conn is not None and self._pid == os.getpid():
+            self._conn.close()
+        self._conn = None
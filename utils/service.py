@@ -0,0 +1,157 @@
+from typing import Dict, Type
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import logging
+import threading
+import time
+
+from utils.errors import GameConfigError, GameError
+
+logger = logging.getLogger(__name__)
+
+# Largest request body accepted, in bytes
+MAX_BODY = 64 * 1024
+
+
+class SolverService:
+    """
+    Solves puzzles against one warm WordManager.
+
+    The dictionary, word lists, feature table and its indexes (and the
+    Wordle feedback matrix) are loaded once by warm(); each request then
+    only pays for its own filter and search. Solves only read that shared
+    state, so they run concurrently on the server's threads; the lock
+    covers the WordManager's lazy builds and game registration.
+    """
+
+    def __init__(self, word_manager, game_classes: Dict[str, Type]):
+        self.word_manager = word_manager
+        self.game_classes = game_classes
+        self._lock = threading.Lock()
+        self._warmed = set()  # Game types whose shared structures are built
+
+    def _warm_game(self, game_type: str) -> None:
+        """Build the shared structures a solve of game_type reads; the caller holds the lock."""
+        if game_type in self._warmed:
+            return
+        self.word_manager.GetWordList(game_type)
+        self.word_manager.GetFeatureTable(game_type).build_indexes()
+        if game_type == 'WD':
+            self.word_manager.GetFeedbackMatrix()
+        self._warmed.add(game_type)
+
+    def warm(self) -> None:
+        """Load every per-game structure a solve touches."""
+        with self._lock:
+            for game_type in self.game_classes:
+                self._warm_game(game_type)
+
+    def solve(self, game_type: str, data: Dict) -> Dict:
+        """Solve one puzzle given in its daily data format."""
+        game_type = game_type.upper()
+        if game_type not in self.game_classes:
+            raise GameConfigError(f"Invalid game type: {game_type}")
+        if not isinstance(data, dict) or not data:
+            raise GameConfigError("Puzzle must be a non-empty JSON object")
+        validator = self.word_manager.config.CONFIGS[game_type].validation_rules.get('validator')
+        if validator and not validator(data):
+            raise GameConfigError(f"Puzzle does not match the {game_type} format")
+
+        started = time.perf_counter()
+        with self._lock:
+            self._warm_game(game_type)
+            # Constructing a game registers it with the WordManager
+            game = self.game_classes[game_type](self.word_manager, **data)
+        words = game.FindValidWords()
+        best_guesses = game.BestGuesses() if hasattr(game, 'BestGuesses') else None
+        result = {
+            'game_type': game_type,
+            'words': sorted(words),
+            'solution_path': getattr(game, 'solution_path', None),
+            'elapsed_ms': round((time.perf_counter() - started) * 1000, 3)
+        }
+        if hasattr(game, 'Score'):
+            result['score'] = game.Score()
+        if best_guesses is not None:
+            result['best_guesses'] = best_guesses
+        return result
+
+
+class _SolverRequestHandler(BaseHTTPRequestHandler):
+    """POST /solve/<SB|LB|WD> with the puzzle as JSON; GET /health."""
+
+    protocol_version = 'HTTP/1.1'
+    service: SolverService = None
+
+    def do_GET(self) -> None:
+        if self.path == '/health':
+            self._send(200, {'status': 'ok', 'games': sorted(self.service.game_classes)})
+        else:
+            self._send(404, {'error': f"Unknown path: {self.path}"})
+
+    def do_POST(self) -> None:
+        prefix = '/solve/'
+        if not self.path.startswith(prefix):
+            self._send(404, {'error': f"Unknown path: {self.path}"})
+            return
+
+        try:
+            length = int(self.headers.get('Content-Length') or 0)
+            if length < 0:
+                raise ValueError(length)
+        except ValueError:
+            self._send(400, {'error': 'Invalid Content-Length'})
+            return
+        if length > MAX_BODY:
+            self._send(413, {'error': 'Request body too large'})
+            return
+        try:
+            data = json.loads(self.rfile.read(length) or b'null')
+            self._send(200, self.service.solve(self.path[len(prefix):], data))
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            self._send(400, {'error': f"Invalid JSON: {e}"})
+        except (GameConfigError, TypeError) as e:
+            self._send(400, {'error': str(e)})
+        except GameError as e:
+            self._send(500, {'error': str(e)})
+        except Exception as e:
+            logger.exception(f"Unexpected error solving {self.path}")
+            self._send(500, {'error': f"Internal error: {type(e).__name__}"})
+
+    def _send(self, status: int, payload: Dict) -> None:
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        logger.debug(f"{self.address_string()} {format % args}")
+
+
+class _SolverServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # Listen backlog; the default of 5 resets clients when a burst connects at once
+    request_queue_size = 128
+
+
+def make_server(service: SolverService, host: str = '127.0.0.1', port: int = 8080) -> ThreadingHTTPServer:
+    """Bind a threaded HTTP server for the service; port 0 picks a free port."""
+    handler = type('SolverRequestHandler', (_SolverRequestHandler,), {'service': service})
+    return _SolverServer((host, port), handler)
+
+
+def Serve(word_manager, game_classes: Dict[str, Type], host: str = '127.0.0.1', port: int = 8080) -> None:
+    """Warm the solver state and serve requests until interrupted."""
+    service = SolverService(word_manager, game_classes)
+    started = time.perf_counter()
+    service.warm()
+    logger.info(f"Solver state warmed in {time.perf_counter() - started:.2f}s")
+
+    with make_server(service, host, port) as server:
+        logger.info(f"Serving on http://{server.server_address[0]}:{server.server_address[1]}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            logger.info("Shutting down solver service")
@@ -0,0 +1,240 @@
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple
+import json
+import logging
+import os
+import struct
+
+logger = logging.getLogger(__name__)
+
+# One index entry per appended record: date (YYYYMMDD), byte offset and length of its line
+ENTRY = struct.Struct("<IQI")
+LEGACY_MARKER = ".legacy_imported"
+# Keys of a per-day solution file that are derived from the record's words
+DERIVED_KEYS = ('total_words', 'words_by_length')
+
+
+def daily_format(record: Dict) -> Dict:
+    """A record in the per-day solution file layout (words grouped by length)."""
+    words_by_length: Dict[str, List[str]] = {}
+    for word in record['words']:
+        words_by_length.setdefault(len(word), []).append(word)
+    daily = {
+        'date': record['date'],
+        'total_words': len(record['words']),
+        'words_by_length': {str(length): group for length, group in sorted(words_by_length.items())}
+    }
+    daily.update((key, value) for key, value in record.items() if key not in ('date', 'words'))
+    return daily
+
+
+def from_daily_format(data: Dict, date_str: str) -> Dict:
+    """Inverse of daily_format, for files written before the archive existed."""
+    words = sorted(word for group in data.get('words_by_length', {}).values() for word in group)
+    record = {'date': data.get('date') or date_str, 'words': words}
+    record.update((key, value) for key, value in data.items()
+                  if key not in DERIVED_KEYS and key != 'date')
+    return record
+
+
+class SolutionArchive:
+    """
+    Append-only JSON Lines archive of one game's solutions, sharded by month.
+
+    Each month is a YYYYMM.jsonl shard with one compact record per line
+    ({'date', 'words', ...game-specific keys}) and a YYYYMM.idx file of
+    fixed-size (date, offset, length) entries, so a year of solutions is
+    24 files and reading one day is a seek into its shard. Re-solving a
+    date appends a new record; the index's latest entry for a date wins.
+
+    Shards are written through handles kept open for the archive's
+    lifetime and flushed per record. An index that is missing, or behind
+    its shard after a crash, is rebuilt from the shard on first read, and a
+    torn last line is cut off before anything is appended after it. One
+    process writes to an archive at a time (batch workers hand their
+    results to the parent).
+    """
+
+    def __init__(self, archive_dir: Path):
+        self.archive_dir = Path(archive_dir)
+        self._index: Dict[str, Dict[str, Tuple[int, int]]] = {}  # month -> date -> (offset, length)
+        self._writers: Dict[str, Tuple[BinaryIO, BinaryIO]] = {}  # month -> (shard, index) append handles
+        self._pid = None
+
+    def _shard_file(self, month: str) -> Path:
+        return self.archive_dir / f"{month}.jsonl"
+
+    def _index_file(self, month: str) -> Path:
+        return self.archive_dir / f"{month}.idx"
+
+    def months(self) -> List[str]:
+        """Months (YYYYMM) with a shard, in order."""
+        if not self.archive_dir.exists():
+            return []
+        return sorted(file.stem for file in self.archive_dir.glob("*.jsonl"))
+
+    def _load_index(self, month: str) -> Dict[str, Tuple[int, int]]:
+        """The month's date -> (offset, length) index, repairing it from the shard if needed."""
+        if month in self._index:
+            return self._index[month]
+
+        shard_file, index_file = self._shard_file(month), self._index_file(month)
+        try:
+            data = index_file.read_bytes()
+        except FileNotFoundError:
+            data = b''
+        entries: Dict[str, Tuple[int, int]] = {}
+        indexed_end = 0
+        whole = len(data) - len(data) % ENTRY.size
+        for day, offset, length in ENTRY.iter_unpack(data[:whole]):
+            entries[str(day)] = (offset, length)
+            indexed_end = max(indexed_end, offset + length + 1)
+
+        size = shard_file.stat().st_size if shard_file.exists() else 0
+        if indexed_end > size:
+            # The shard was replaced or cut short; nothing in the index can be trusted
+            entries, indexed_end = {}, 0
+        if indexed_end < size or whole != len(data):
+            self._scan(month, entries, indexed_end, size)
+        self._index[month] = entries
+        return entries
+
+    def _scan(self, month: str, entries: Dict[str, Tuple[int, int]], start: int, size: int) -> None:
+        """Index the shard's records from start on, then rewrite the index file."""
+        shard_file = self._shard_file(month)
+        end = start
+        if size > start:
+            with open(shard_file, 'rb') as f:
+                f.seek(start)
+                tail = f.read()
+            for line in tail.split(b'\n')[:-1]:
+                try:
+                    entries[json.loads(line)['date']] = (end, len(line))
+                except (ValueError, KeyError, TypeError):
+                    logger.warning(f"Skipping unreadable record at byte {end} of {shard_file}")
+                end += len(line) + 1
+            if end < size:
+                logger.warning(f"Cutting off a partly written record at the end of {shard_file}")
+                with open(shard_file, 'r+b') as f:
+                    f.truncate(end)
+        logger.debug(f"Rebuilt index of {shard_file} ({len(entries)} dates)")
+
+        self._close_month(month)
+        index_file = self._index_file(month)
+        tmp_file = index_file.with_name(index_file.name + '.tmp')
+        with open(tmp_file, 'wb') as f:
+            for date_str, (offset, length) in entries.items():
+                f.write(ENTRY.pack(int(date_str), offset, length))
+        os.replace(tmp_file, index_file)
+
+    def _writer(self, month: str) -> Tuple[BinaryIO, BinaryIO]:
+        if self._pid != os.getpid():
+            # Handles inherited by a forked child are the parent's to use
+            self._writers = {}
+            self._pid = os.getpid()
+        if month not in self._writers:
+            self._load_index(month)
+            self.archive_dir.mkdir(parents=True, exist_ok=True)
+            self._writers[month] = (open(self._shard_file(month), 'ab'), open(self._index_file(month), 'ab'))
+        return self._writers[month]
+
+    def append(self, record: Dict) -> None:
+        """Add a solved puzzle ({'date': YYYYMMDD, 'words': [...], ...}), superseding any earlier one for its date."""
+        date_str = record['date']
+        month = date_str[:6]
+        line = json.dumps(record, separators=(',', ':')).encode('utf-8')
+        shard, index = self._writer(month)
+        offset = shard.seek(0, os.SEEK_END)
+        shard.write(line + b'\n')
+        shard.flush()
+        index.write(ENTRY.pack(int(date_str), offset, len(line)))
+        index.flush()
+        self._index[month][date_str] = (offset, len(line))
+
+    def get(self, date_str: str) -> Optional[Dict]:
+        """The latest record for a date, if any."""
+        entry = self._load_index(date_str[:6]).get(date_str)
+        if entry is None:
+            return None
+        offset, length = entry
+        with open(self._shard_file(date_str[:6]), 'rb') as f:
+            f.seek(offset)
+            return json.loads(f.read(length))
+
+    def fingerprint(self, date_str: str) -> Optional[str]:
+        """Fingerprint stored with a date's solution, if any."""
+        record = self.get(date_str)
+        return record.get('fingerprint') if record else None
+
+    def dates(self) -> List[str]:
+        """Every date with a solution, in order."""
+        return sorted(date_str for month in self.months() for date_str in self._load_index(month))
+
+    def records(self, start: Optional[str] = None, end: Optional[str] = None) -> Iterator[Dict]:
+        """Latest records for dates from start to end (YYYYMMDD, inclusive), in date order, a shard at a time."""
+        for month in self.months():
+            if (start and month < start[:6]) or (end and month > end[:6]):
+                continue
+            entries = self._load_index(month)
+            wanted = sorted(date_str for date_str in entries
+                            if (not start or date_str >= start) and (not end or date_str <= end))
+            if not wanted:
+                continue
+            with open(self._shard_file(month), 'rb') as f:
+                data = f.read()
+            for date_str in wanted:
+                offset, length = entries[date_str]
+                yield json.loads(data[offset:offset + length])
+
+    def export(self, record: Dict, solution_file: Path) -> None:
+        """Write a record as a standalone per-day solution file."""
+        solution_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(solution_file, 'w') as f:
+            json.dump(daily_format(record), f, indent=2)
+
+    def import_legacy_files(self, solutions_dir: Path) -> int:
+        """One-time import of per-day solution files written before the archive; returns the count."""
+        marker = self.archive_dir / LEGACY_MARKER
+        if marker.exists():
+            return 0
+        imported = 0
+        if solutions_dir.exists():
+            for file in sorted(solutions_dir.glob("*.json")):
+                if not (file.stem.isdigit() and len(file.stem) == 8):
+                    continue
+                try:
+                    with open(file, 'r') as f:
+                        data = json.load(f)
+                except (json.JSONDecodeError, IOError) as e:
+                    logger.warning(f"Error loading solution from {file}: {e}")
+                    continue
+                self.append(from_daily_format(data, file.stem))
+                imported += 1
+        self.archive_dir.mkdir(parents=True, exist_ok=True)
+        marker.touch()
+        if imported:
+            logger.info(f"Imported {imported} solution files into {self.archive_dir}")
+        return imported
+
+    def _close_month(self, month: str) -> None:
+        handles = self._writers.pop(month, None)
+        if handles and self._pid == os.getpid():
+            for handle in handles:
+                handle.close()
+
+    def close(self) -> None:
+        for month in list(self._writers):
+            self._close_month(month)
+
+
+# Open archives by directory, so every writer and reader in a process shares one
+_archives: Dict[Path, SolutionArchive] = {}
+
+
+def archive_for(game_config) -> SolutionArchive:
+    """The solution archive of a game (GameConfig), importing its old per-day files on first use."""
+    archive = _archives.get(game_config.archive_dir)
+    if archive is None:
+        archive = _archives[game_config.archive_dir] = SolutionArchive(game_config.archive_dir)
+        archive.import_legacy_files(game_config.solutions_dir)
+    return archive
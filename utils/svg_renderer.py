@@ -0,0 +1,72 @@
+from typing import Dict, List, Optional, Tuple
+from pathlib import Path
+from html import escape
+
+SIZE = 400
+MARGIN = 80
+# Stroke colour per word, cycled for longer paths
+WORD_COLORS = ['#e4572e', '#2e86ab', '#76b041', '#a23b72', '#f18f01', '#3b1f2b']
+
+
+def letter_positions(sides: List[str]) -> Dict[str, Tuple[float, float]]:
+    """
+    Place each letter on the box, sides ordered TOP, LEFT, BOTTOM, RIGHT as
+    LetterBoxed stores them.
+    """
+    low, high = MARGIN, SIZE - MARGIN
+    span = high - low
+    positions = {}
+    for side_idx, side in enumerate(sides):
+        for i, letter in enumerate(side):
+            t = low + span * (i + 1) / (len(side) + 1)
+            positions[letter] = [
+                (t, low),    # top
+                (low, t),    # left
+                (t, high),   # bottom
+                (high, t),   # right
+            ][side_idx]
+    return positions
+
+
+def render_letter_boxed_svg(path: List[str], sides: List[str], date_str: Optional[str] = None) -> str:
+    """Return an SVG document drawing the solution path on the board."""
+    positions = letter_positions(sides)
+    low, high = MARGIN, SIZE - MARGIN
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{SIZE}" height="{SIZE}" '
+        f'viewBox="0 0 {SIZE} {SIZE}" font-family="sans-serif">',
+        f'<rect width="{SIZE}" height="{SIZE}" fill="#ffffff"/>',
+        f'<rect x="{low}" y="{low}" width="{high - low}" height="{high - low}" '
+        f'fill="none" stroke="#222222" stroke-width="3"/>',
+    ]
+    if date_str:
+        parts.append(f'<text x="{SIZE / 2}" y="28" font-size="18" text-anchor="middle">'
+                     f'{escape(date_str)}</text>')
+
+    for word_idx, word in enumerate(path):
+        points = ' '.join(f'{positions[c][0]:.1f},{positions[c][1]:.1f}' for c in word if c in positions)
+        color = WORD_COLORS[word_idx % len(WORD_COLORS)]
+        parts.append(f'<polyline points="{points}" fill="none" stroke="{color}" '
+                     f'stroke-width="3" stroke-linejoin="round" stroke-opacity="0.85"/>')
+
+    used = set(''.join(path))
+    for letter, (x, y) in positions.items():
+        fill = '#ffd166' if letter in used else '#ffffff'
+        parts.append(f'<circle cx="{x:.1f}" cy="{y:.1f}" r="14" fill="{fill}" stroke="#222222" stroke-width="2"/>')
+        parts.append(f'<text x="{x:.1f}" y="{y + 6:.1f}" font-size="16" font-weight="bold" '
+                     f'text-anchor="middle">{escape(letter.upper())}</text>')
+
+    if path:
+        parts.append(f'<text x="{SIZE / 2}" y="{SIZE - 24}" font-size="14" text-anchor="middle">'
+                     f'{escape(" - ".join(word.upper() for word in path))}</text>')
+    parts.append('</svg>')
+    return '\n'.join(parts)
+
+
+def save_letter_boxed_svg(path: List[str], sides: List[str], output_path: Path,
+                          date_str: Optional[str] = None) -> Path:
+    """Write the solution SVG to output_path and return it."""
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(render_letter_boxed_svg(path, sides, date_str), encoding='utf-8')
+    return output_path
@@ -1,29 +1,47 @@
-from typing import Set, Dict, List, Optional
+from typing import Iterable, Set, Dict, List, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
 import logging
-import json
 from pathlib import Path
-import matplotlib.pyplot as plt
-import networkx as nx
+from utils.svg_renderer import save_letter_boxed_svg
+from utils.solution_archive import archive_for
 
 logger = logging.getLogger(__name__)
 
 class GameVisualizer:
-    def __init__(self):
+    """
+    Displays and saves game results.
+
+    matplotlib and networkx are only imported when a picture is actually
+    drawn. With render=False no picture is drawn at all; with
+    background=True drawing runs on a single worker thread so solving and
+    JSON output are not held up, and wait() blocks until it has finished.
+    renderer='svg' draws the board directly as SVG without either library.
+
+    Solutions are appended to each game's month-sharded SolutionArchive;
+    export_daily=True also writes the older per-day JSON file for each.
+    """
+
+    def __init__(self, render: bool = True, background: bool = False, renderer: str = 'matplotlib',
+                 export_daily: bool = False):
         self.logger = logging.getLogger(__name__)
+        self.render = render
+        self.background = background
+        self.renderer = renderer
+        self.export_daily = export_daily
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending: List[Future] = []
         # Suppress matplotlib debug messages
         logging.getLogger('matplotlib.font_manager').setLevel(logging.WARNING)
 
-    def save_results(self, game_type: str, words: Set[str], solution_file: Path, 
-                    solution_data: Dict, game_specific_data: Optional[Dict] = None) -> None:
-        """Save results to JSON file with proper formatting."""
-        if game_specific_data:
-            solution_data.update(game_specific_data)
-            
-        with open(solution_file, 'w') as f:
-            json.dump(solution_data, f, indent=2)
+    def save_results(self, game_config, record: Dict) -> None:
+        """Append a solution record to the game's archive, exporting it as a per-day file if enabled."""
+        archive = archive_for(game_config)
+        archive.append(record)
+        if self.export_daily:
+            archive.export(record, game_config.solutions_dir / f"{record['date']}.json")
 
-    def display_word_summary(self, words: Set[str]) -> None:
-        """Display summary of found words."""
+    def display_word_summary(self, words: List[str]) -> None:
+        """Display summary of found words (given in sorted order)."""
         if not words:
             logger.warning("No valid words found.")
             return
@@ -32,15 +50,16 @@ class GameVisualizer:
         
         # Group words by length
         words_by_length = {}
-        for word in sorted(words):
+        for word in words:
             words_by_length.setdefault(len(word), []).append(word)
 
         # Display summary
         for length, group in sorted(words_by_length.items(), reverse=True):
             logger.info(f"{length} letters: {len(group)} words")
-            logger.debug(f"Words: {', '.join(sorted(group))}")
+            logger.debug(f"Words: {', '.join(group)}")
 
-    def display_letter_boxed_path(self, solution_path: List[str], sides: List[str]) -> None:
+    def display_letter_boxed_path(self, solution_path: List[str], sides: List[str],
+                                  output_path: Optional[Path] = None, date_str: Optional[str] = None) -> None:
         """Visualize Letter Boxed solution path using matplotlib."""
         if not solution_path:
             return
@@ -64,10 +83,54 @@ class GameVisualizer:
             [path for paths in solution_paths.values() for path in paths], 
             key=len
         )
-        self._create_path_visualization(shortest_path, sides)
+        self._render(shortest_path, sides, output_path, date_str)
 
-    def _create_path_visualization(self, path: List[str], sides: List[str]) -> None:
+    def _render(self, path: List[str], sides: List[str],
+                output_path: Optional[Path] = None, date_str: Optional[str] = None) -> None:
+        """Draw a solution now, on the background worker, or not at all."""
+        if not self.render:
+            return
+        if not self.background:
+            self.render_solution(path, sides, output_path, date_str)
+            return
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='render')
+        self._pending.append(self._executor.submit(
+            self.render_solution, list(path), list(sides), output_path, date_str
+        ))
+
+    def render_solution(self, path: List[str], sides: List[str],
+                        output_path: Optional[Path] = None, date_str: Optional[str] = None) -> None:
+        """Draw a solution path with the configured renderer."""
+        if self.renderer == 'svg':
+            saved = save_letter_boxed_svg(path, sides, output_path or Path('letter_boxed_solution.svg'), date_str)
+            logger.info(f"Solution visualization saved as '{saved}'")
+        else:
+            self._create_path_visualization(path, sides, output_path)
+
+    def wait(self) -> None:
+        """Block until queued background renders are written."""
+        pending, self._pending = self._pending, []
+        for future in pending:
+            try:
+                future.result()
+            except Exception as e:
+                logger.error(f"Failed to render solution: {e}")
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def _create_path_visualization(self, path: List[str], sides: List[str],
+                                   output_path: Optional[Path] = None) -> None:
         """Create the visual representation of a solution path."""
+        import matplotlib
+        if self.background:
+            # pyplot must not try to open a GUI window off the main thread
+            matplotlib.use('Agg')
+        import matplotlib.pyplot as plt
+        import networkx as nx
+
         # Create graph
         G = nx.DiGraph()
         
@@ -113,51 +176,67 @@ class GameVisualizer:
                 font_weight='bold')
         
         # Save the visualization
-        plt.savefig('letter_boxed_solution.png')
+        output_path = output_path or Path('letter_boxed_solution.png')
+        plt.savefig(output_path)
         plt.close()
-        logger.info("Solution visualization saved as 'letter_boxed_solution.png'")
+        logger.info(f"Solution visualization saved as '{output_path}'")
 
-    def format_solution_data(self, words: Set[str], date_str: str) -> Dict:
-        """Format solution data for storage."""
-        words_by_length = {}
-        for word in sorted(words):
-            words_by_length.setdefault(len(word), []).append(word)
+    def solution_record(self, words: Iterable[str], date_str: str) -> Dict:
+        """Archive record for a solved puzzle; its words are sorted here, once."""
+        return {'date': date_str, 'words': sorted(words)}
 
-        return {
-            'date': date_str,
-            'total_words': len(words),
-            'words_by_length': {
-                str(length): words 
-                for length, words in sorted(words_by_length.items())
-            }
-        }
-
-    def output_game_results(self, game_type: str, words: Set[str], config, game) -> None:
+    def output_game_results(self, game_type: str, words: Set[str], config, game,
+                            fingerprint: Optional[str] = None) -> None:
         """Handle all visualization and saving of game results."""
         if not words:
             logger.warning("No valid words found.")
             return
 
-        # Save actual words for future reference
-        game.word_manager.save_actual_words(game_type, words, config.current_date_str)
+        record = self.solution_record(words, config.current_date_str)
+        if fingerprint:
+            # Lets an unchanged re-run recognize this solution and leave it alone
+            record['fingerprint'] = fingerprint
+
+        # Save actual words for future reference (games whose words are only candidates opt out)
+        if game.records_actual_words:
+            game.word_manager.save_actual_words(game_type, record['words'], config.current_date_str)
 
-        # Format basic solution data
-        solution_data = self.format_solution_data(words, config.current_date_str)
-        
         # Add game-specific data and visualization
         game_specific_data = None
         if game_type == 'LB' and hasattr(game, 'solution_path') and game.solution_path:
             game_specific_data = {'solution_path': game.solution_path}
-            self.display_letter_boxed_solution(game.solution_path, game.sides)
+            output_path = None
+            if self.renderer == 'svg':
+                output_path = config.CONFIGS[game_type].solutions_dir / f"{config.current_date_str}.svg"
+            self.display_letter_boxed_solution(game.solution_path, game.sides, output_path, config.display_date)
+        elif game_type == 'SB' and hasattr(game, 'Score'):
+            game_specific_data = {'score': game.Score()}
+            self.display_spelling_bee_score(game_specific_data['score'])
+        elif game_type == 'WD' and hasattr(game, 'BestGuesses'):
+            game_specific_data = {'best_guesses': game.BestGuesses()}
+            self.display_wordle_guesses(game_specific_data['best_guesses'])
 
         # Save results
-        solution_file = config.CONFIGS[game_type].solutions_dir / f"{config.current_date_str}.json"
-        self.save_results(game_type, words, solution_file, solution_data, game_specific_data)
+        if game_specific_data:
+            record.update(game_specific_data)
+        self.save_results(config.CONFIGS[game_type], record)
 
         # Display word summary
-        self.display_word_summary(words)
+        self.display_word_summary(record['words'])
+
+    def display_spelling_bee_score(self, score: Dict) -> None:
+        """Display Spelling Bee score, pangrams and rank thresholds."""
+        logger.info(f"\nMaximum score: {score['max_score']}")
+        logger.info(f"Pangrams: {', '.join(score['pangrams']) or 'none'}")
+        logger.info("Ranks: " + ", ".join(f"{name} {points}" for name, points in score['ranks'].items()))
+
+    def display_wordle_guesses(self, best_guesses: List[Dict]) -> None:
+        """Display the suggested next Wordle guesses."""
+        logger.info("\nBest guesses: " + (", ".join(
+            f"{guess['word']} ({guess['entropy']:.2f} bits)" for guess in best_guesses) or 'none'))
 
-    def display_letter_boxed_solution(self, solution_path: List[str], sides: List[str]) -> None:
+    def display_letter_boxed_solution(self, solution_path: List[str], sides: List[str],
+                                      output_path: Optional[Path] = None, date_str: Optional[str] = None) -> None:
         """Display Letter Boxed solution details and visualization."""
         logger.info("\nSolution path:")
         logger.info(" -> ".join(solution_path))
@@ -165,4 +244,4 @@ class GameVisualizer:
         logger.info(f"Number of words: {len(solution_path)}")
         
         # Generate visual representation of the solution
-        self.display_letter_boxed_path(solution_path, sides)
+        self.display_letter_boxed_path(solution_path, sides, output_path, date_str)
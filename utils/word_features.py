@@ -0,0 +1,239 @@
+from typing import Dict, Iterable, List, Optional, Sequence
+import numpy as np
+
+from utils.letter_index import FOREIGN_BIT, submasks
+from utils.prefix_trie import PrefixTrie
+
+# 26 x 26 adjacent-letter pairs packed into 64-bit words
+PAIR_BITS = 26 * 26
+PAIR_WORDS = (PAIR_BITS + 63) // 64
+
+
+def pair_mask(pairs: Iterable[tuple]) -> np.ndarray:
+    """Pack (first, second) letter pairs into a PAIR_WORDS-long uint64 bitset."""
+    bits = np.zeros(PAIR_WORDS, dtype=np.uint64)
+    for a, b in pairs:
+        p = (ord(a) - 97) * 26 + (ord(b) - 97)
+        bits[p >> 6] |= np.uint64(1 << (p & 63))
+    return bits
+
+
+def compute_features(words: Sequence[str]) -> Dict[str, np.ndarray]:
+    """
+    Compute length, 26-bit letter mask, first/last letter and adjacent-pair
+    bitset columns for every word in one vectorized pass.
+
+    Characters outside a-z set FOREIGN_BIT in the mask and code 255 in
+    first/last, so such words never pass a letter filter.
+    """
+    n = len(words)
+    if n == 0:
+        return {
+            'length': np.zeros(0, dtype=np.uint8),
+            'mask': np.zeros(0, dtype=np.uint32),
+            'first': np.zeros(0, dtype=np.uint8),
+            'last': np.zeros(0, dtype=np.uint8),
+            'pairs': np.zeros((0, PAIR_WORDS), dtype=np.uint64),
+        }
+
+    encoded = np.array([word.encode('ascii', 'replace') for word in words], dtype=bytes)
+    width = encoded.dtype.itemsize
+    chars = encoded.view(np.uint8).reshape(n, width)
+    present = chars != 0
+    length = present.sum(axis=1).astype(np.uint8)
+
+    codes = chars.astype(np.int16) - 97
+    letter = present & (codes >= 0) & (codes < 26)
+    foreign = (present & ~letter).any(axis=1)
+
+    shifts = np.clip(codes, 0, 25).astype(np.uint32)
+    bits = np.where(letter, np.left_shift(np.uint32(1), shifts), np.uint32(0))
+    mask = np.bitwise_or.reduce(bits, axis=1)
+    mask[foreign] |= np.uint32(FOREIGN_BIT)
+
+    rows = np.arange(n)
+    first = np.where(letter[:, 0], codes[:, 0], 255).astype(np.uint8)
+    last_pos = np.maximum(length.astype(np.int64) - 1, 0)
+    last = np.where(letter[rows, last_pos], codes[rows, last_pos], 255).astype(np.uint8)
+
+    pairs = np.zeros((n, PAIR_WORDS), dtype=np.uint64)
+    if width > 1:
+        adjacent = letter[:, :-1] & letter[:, 1:]
+        row_idx, col_idx = np.nonzero(adjacent)
+        pair_idx = codes[row_idx, col_idx].astype(np.int64) * 26 + codes[row_idx, col_idx + 1]
+        pair_bits = np.left_shift(np.uint64(1), (pair_idx & 63).astype(np.uint64))
+        np.bitwise_or.at(pairs, (row_idx, pair_idx >> 6), pair_bits)
+
+    return {'length': length, 'mask': mask, 'first': first, 'last': last, 'pairs': pairs}
+
+
+class WordFeatureTable:
+    """
+    Columnar per-word features shared by every game type.
+
+    Rows are built once per dictionary load; each game type only keeps a
+    boolean `active` column recording which rows belong to its word list
+    (base words minus invalid words plus actual words). Game filters are
+    vectorized boolean expressions over these columns.
+
+    Base rows are read from `words`, normally the memory-mapped compiled
+    dictionary, which is searched by its row() method instead of holding a
+    Python string per word; words appended later are kept in a small list.
+
+    Attributes:
+        length, mask, first, last (np.ndarray): Per-row scalar features
+        pairs (np.ndarray): (rows, PAIR_WORDS) uint64 adjacent-pair bitsets
+    """
+
+    def __init__(self, words: Sequence[str], features: Dict[str, np.ndarray] = None):
+        self._base = words
+        self._base_rows = len(words)
+        # Sorted stores find rows by binary search; plain sequences get a dict
+        self._base_index: Optional[Dict[str, int]] = (
+            None if hasattr(words, 'row') else {word: i for i, word in enumerate(words)}
+        )
+        self._extra: List[str] = []
+        self._extra_index: Dict[str, int] = {}
+        features = features if features is not None else compute_features(list(words))
+        self.length = features['length']
+        self.mask = features['mask']
+        self.first = features['first']
+        self.last = features['last']
+        self.pairs = features['pairs']
+        self._active: Dict[str, np.ndarray] = {}
+        # Rows ordered by mask, for exact-mask lookups; rebuilt after extend()
+        self._mask_order: Optional[np.ndarray] = None
+        self._sorted_masks: Optional[np.ndarray] = None
+        # Prefix trie over the base rows, built on first use (None if unsorted)
+        self._trie: Optional[PrefixTrie] = None
+        self._trie_built = False
+
+    def __len__(self) -> int:
+        return self._base_rows + len(self._extra)
+
+    def row(self, word: str) -> int:
+        """Row of word, or -1 if it has none."""
+        if word in self._extra_index:
+            return self._extra_index[word]
+        if self._base_index is not None:
+            return self._base_index.get(word, -1)
+        return self._base.row(word)
+
+    def word(self, row: int) -> str:
+        if row < self._base_rows:
+            return self._base[row]
+        return self._extra[row - self._base_rows]
+
+    def has_game(self, game_type: str) -> bool:
+        return game_type in self._active
+
+    def active(self, game_type: str) -> np.ndarray:
+        """Rows in a game's word list; a new game starts with every base row."""
+        if game_type not in self._active:
+            active = np.zeros(len(self), dtype=bool)
+            active[:self._base_rows] = True
+            self._active[game_type] = active
+        return self._active[game_type]
+
+    def set_active(self, game_type: str, words: Iterable[str], value: bool) -> None:
+        """Add words to (value=True) or remove them from a game's word list."""
+        words = list(words)
+        if value:
+            self.extend(words)
+        rows = [row for row in map(self.row, words) if row >= 0]
+        if rows:
+            self.active(game_type)[rows] = value
+
+    def extend(self, words: Iterable[str]) -> None:
+        """Append rows for unseen words; they start inactive for every game."""
+        new_words = [word for word in dict.fromkeys(words) if self.row(word) < 0]
+        if not new_words:
+            return
+
+        features = compute_features(new_words)
+        for word in new_words:
+            self._extra_index[word] = len(self)
+            self._extra.append(word)
+        self.length = np.concatenate([self.length, features['length']])
+        self.mask = np.concatenate([self.mask, features['mask']])
+        self.first = np.concatenate([self.first, features['first']])
+        self.last = np.concatenate([self.last, features['last']])
+        self.pairs = np.concatenate([self.pairs, features['pairs']])
+        for game_type, active in self._active.items():
+            self._active[game_type] = np.concatenate([active, np.zeros(len(new_words), dtype=bool)])
+        self._mask_order = self._sorted_masks = None
+
+    def _build_trie(self) -> None:
+        if not self._trie_built:
+            self._trie = PrefixTrie.build(self._base)
+            self._trie_built = True
+
+    def _build_mask_order(self) -> None:
+        if self._mask_order is None:
+            order = np.argsort(self.mask, kind='stable').astype(np.int32)
+            # Published last, so a reader that sees the order also sees the masks
+            self._sorted_masks = self.mask[order]
+            self._mask_order = order
+
+    def build_indexes(self) -> None:
+        """Build the lookup indexes now rather than on first use (e.g. before concurrent readers)."""
+        self._build_mask_order()
+        self._build_trie()
+
+    def prefix_rows(self, step, state) -> Optional[np.ndarray]:
+        """
+        Candidate rows whose leading letters pass step (see PrefixTrie.walk).
+
+        Appended rows are always included. Returns None when the base rows
+        are not in sorted order, so callers fall back to a full scan.
+        """
+        self._build_trie()
+        if self._trie is None:
+            return None
+        rows = self._trie.rows(step, state)
+        if self._extra:
+            rows = np.concatenate([rows, np.arange(self._base_rows, len(self), dtype=np.int64)])
+        return rows
+
+    def letters_within(self, allowed_mask: int, rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """Rows (of all, or of the given row numbers) using only letters from allowed_mask."""
+        mask = self.mask if rows is None else self.mask[rows]
+        return (mask & np.uint32(~allowed_mask & 0xFFFFFFFF)) == 0
+
+    def letters_include(self, required_mask: int) -> np.ndarray:
+        """Rows using every letter in required_mask."""
+        required = np.uint32(required_mask)
+        return (self.mask & required) == required
+
+    def avoids_pairs(self, forbidden: np.ndarray, rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """Rows (of all, or of the given row numbers) with no adjacent pair in the forbidden pair bitset."""
+        pairs = self.pairs if rows is None else self.pairs[rows]
+        return ~np.any(pairs & forbidden, axis=1)
+
+    def rows_with_letters(self, required_mask: int, allowed_mask: int) -> np.ndarray:
+        """
+        Row numbers of words using only allowed letters and every required one.
+
+        Looks up each qualifying exact mask in the mask-sorted row order, so
+        the cost follows the number of letters, not the number of rows.
+        """
+        if required_mask & ~allowed_mask:
+            return np.zeros(0, dtype=np.int64)
+        self._build_mask_order()
+
+        wanted = np.fromiter(submasks(required_mask, allowed_mask), dtype=np.uint32)
+        starts = np.searchsorted(self._sorted_masks, wanted, side='left')
+        ends = np.searchsorted(self._sorted_masks, wanted, side='right')
+        spans = [self._mask_order[start:end] for start, end in zip(starts, ends) if end > start]
+        if not spans:
+            return np.zeros(0, dtype=np.int64)
+        return np.sort(np.concatenate(spans)).astype(np.int64)
+
+    def select(self, rows: np.ndarray) -> List[str]:
+        """Words for a boolean row selection."""
+        return self.select_rows(np.flatnonzero(rows))
+
+    def select_rows(self, rows: Iterable[int]) -> List[str]:
+        """Words for an array of row numbers."""
+        word = self.word
+        return [word(int(row)) for row in rows]
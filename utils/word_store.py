@@ -0,0 +1,53 @@
+from collections.abc import Set as AbstractSet
+from typing import Iterable, Iterator, Set
+
+
+class WordListView(AbstractSet):
+    """
+    One game's word list as a read-only base plus small per-game overlays.
+
+    The base is the memory-mapped compiled dictionary (or any sorted,
+    set-like sequence) shared by every game type and every forked worker;
+    only the words a game removes from it (invalid) or adds to it (actual
+    words missing from the dictionary) are held per game.
+
+    Invariants: removed is a subset of base, added is disjoint from base.
+    """
+
+    def __init__(self, base, removed: Iterable[str] = (), added: Iterable[str] = ()):
+        self.base = base
+        self.removed: Set[str] = {word for word in removed if word in base}
+        self.added: Set[str] = {word for word in added if word not in base}
+
+    @classmethod
+    def _from_iterable(cls, iterable: Iterable[str]) -> Set[str]:
+        # Set operators (|, -, &, ^) produce plain sets
+        return set(iterable)
+
+    def __contains__(self, word: object) -> bool:
+        if word in self.added:
+            return True
+        return word not in self.removed and word in self.base
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self.added
+        removed = self.removed
+        if removed:
+            yield from (word for word in self.base if word not in removed)
+        else:
+            yield from self.base
+
+    def __len__(self) -> int:
+        return len(self.base) - len(self.removed) + len(self.added)
+
+    def add(self, word: str) -> None:
+        if word in self.removed:
+            self.removed.discard(word)
+        elif word not in self.base:
+            self.added.add(word)
+
+    def discard(self, word: str) -> None:
+        if word in self.added:
+            self.added.discard(word)
+        elif word in self.base:
+            self.removed.add(word)
@@ -0,0 +1,284 @@
+from pathlib import Path
+from typing import Dict, List, Sequence, Tuple
+from datetime import datetime
+import json
+import logging
+import os
+import numpy as np
+
+from utils.errors import GameConfigError
+
+logger = logging.getLogger(__name__)
+
+WORD_LENGTH = 5
+# Each position is gray (0), yellow (1) or green (2); position i is worth 3**i
+PATTERNS = 3 ** WORD_LENGTH
+SOLVED = PATTERNS - 1
+POWERS = tuple(3 ** i for i in range(WORD_LENGTH))
+FEEDBACK_VALUES = {'g': 2, '2': 2, 'y': 1, '1': 1, 'b': 0, 'x': 0, '0': 0, '.': 0, '-': 0, '_': 0}
+FORMAT_VERSION = 1
+# Answer rows filled per step of a build, bounding its temporary memory
+BUILD_ROWS = 256
+# Pattern codes bincounted per step of an entropy pass
+ENTROPY_CELLS = 1 << 22
+
+
+def pattern_code(feedback: str) -> int:
+    """Base-3 code of a feedback string such as 'GYBBG' (or '21002')."""
+    if not isinstance(feedback, str) or len(feedback) != WORD_LENGTH:
+        raise GameConfigError(f"Feedback must be {WORD_LENGTH} characters: {feedback!r}")
+    try:
+        return sum(FEEDBACK_VALUES[c] * power for c, power in zip(feedback.lower(), POWERS))
+    except KeyError:
+        raise GameConfigError(f"Feedback may only use G, Y and B: {feedback!r}")
+
+
+def pattern_string(code: int) -> str:
+    """Inverse of pattern_code, as G/Y/B letters."""
+    return ''.join('BYG'[code // power % 3] for power in POWERS)
+
+
+def feedback(guess: str, answer: str) -> int:
+    """Pattern code the game shows for guess when the answer is answer."""
+    values = [0] * WORD_LENGTH
+    unmatched: Dict[str, int] = {}
+    for i, (g, a) in enumerate(zip(guess, answer)):
+        if g == a:
+            values[i] = 2
+        else:
+            unmatched[a] = unmatched.get(a, 0) + 1
+    for i, g in enumerate(guess):
+        if not values[i] and unmatched.get(g, 0):
+            values[i] = 1
+            unmatched[g] -= 1
+    return sum(value * power for value, power in zip(values, POWERS))
+
+
+def encode(words: Sequence[str]) -> np.ndarray:
+    """(len(words), 5) array of letter codes 0-25."""
+    if not len(words):
+        return np.zeros((0, WORD_LENGTH), dtype=np.uint8)
+    return (np.frombuffer(''.join(words).encode('ascii'), dtype=np.uint8)
+            .reshape(-1, WORD_LENGTH) - 97).astype(np.uint8)
+
+
+def vocabulary(words: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Rows of the five-letter a-z words in a word store, and their letters.
+
+    Packed stores (the compiled dictionary) are read straight from their
+    bytes without decoding a word.
+    """
+    if hasattr(words, 'packed'):
+        offsets, blob = words.packed()
+        starts = offsets[:-1].astype(np.int64)
+        rows = np.flatnonzero(np.diff(offsets) == WORD_LENGTH + 1)
+        letters = blob[starts[rows, None] + np.arange(WORD_LENGTH)] - np.uint8(97)
+    else:
+        rows = np.array([i for i, word in enumerate(words) if len(word) == WORD_LENGTH
+                         and word.isascii()], dtype=np.int64)
+        letters = encode([words[i] for i in rows]) if len(rows) else encode([])
+    # Bytes below 'a' wrap around, so anything outside a-z is >= 26
+    keep = (letters < 26).all(axis=1)
+    return rows[keep], np.ascontiguousarray(letters[keep])
+
+
+def _signature_groups(letters: np.ndarray) -> List[Tuple[np.ndarray, np.ndarray]]:
+    """Words grouped by which of their positions repeat a letter, with that 5x5 pattern."""
+    same = letters[:, :, None] == letters[:, None, :]
+    keys = np.packbits(same.reshape(len(letters), -1), axis=1)
+    _, group = np.unique(keys, axis=0, return_inverse=True)
+    group = group.ravel()
+    return [(rows, same[rows[0]]) for rows in
+            (np.flatnonzero(group == g) for g in range(int(group.max()) + 1 if len(group) else 0))]
+
+
+def feedback_codes(guesses: np.ndarray, answers: np.ndarray, groups=None) -> np.ndarray:
+    """
+    Pattern codes of every guess against every answer, (guesses, answers) uint8.
+
+    Greens are five column comparisons. A guess letter that occurs once is
+    yellow wherever the answer has it anywhere else, a single bit test
+    against the answer's letter mask. Only positions repeating a letter need
+    the answer's letter counts, less greens and earlier yellows of that
+    letter; guesses are grouped by where they repeat letters, so each group
+    runs just the counting steps it needs. groups (from _signature_groups
+    of guesses) may be passed in when the same guesses are reused.
+    """
+    codes = np.zeros((len(guesses), len(answers)), dtype=np.uint8)
+    if not len(guesses) or not len(answers):
+        return codes
+    answer_masks = np.bitwise_or.reduce(np.left_shift(np.uint32(1), answers.astype(np.uint32)), axis=1)
+    counts = np.zeros((26, len(answers)), dtype=np.int8)
+    for i in range(WORD_LENGTH):
+        np.add.at(counts, (answers[:, i], np.arange(len(answers))), 1)
+
+    for rows, same in groups if groups is not None else _signature_groups(guesses):
+        g = guesses[rows]
+        green = [g[:, i, None] == answers[None, :, i] for i in range(WORD_LENGTH)]
+        block = np.zeros((len(rows), len(answers)), dtype=np.uint8)
+        yellow = []
+        for i in range(WORD_LENGTH):
+            repeats = [j for j in range(WORD_LENGTH) if j != i and same[i, j]]
+            if not repeats:
+                found = ((answer_masks[None, :] >> g[:, i, None].astype(np.uint32)) & 1).astype(bool)
+            else:
+                left = counts[g[:, i]]
+                for j in repeats:
+                    left -= green[j]
+                    if j < i:
+                        left -= yellow[j]
+                found = left > 0
+            found &= ~green[i]
+            yellow.append(found)
+            block += green[i] * np.uint8(2 * POWERS[i]) + found * np.uint8(POWERS[i])
+        codes[rows] = block
+    return codes
+
+
+def pattern_counts(codes: np.ndarray) -> np.ndarray:
+    """
+    (guesses, PATTERNS) histogram of each column of an (answers, guesses) code block.
+
+    Patterns are bincounted with a per-guess offset a slab of guesses at a
+    time, so this is a few vectorized passes whatever the sizes.
+    """
+    answers, guesses = codes.shape
+    counts = np.zeros((guesses, PATTERNS), dtype=np.int64)
+    step = max(1, ENTROPY_CELLS // max(answers, 1))
+    offsets = np.arange(step, dtype=np.intp) * PATTERNS
+    for start in range(0, guesses, step):
+        slab = np.asarray(codes[:, start:start + step])
+        width = slab.shape[1]
+        # Cell order does not matter to a histogram, so the slab is never transposed
+        index = slab + offsets[:width]
+        counts[start:start + width] = np.bincount(
+            index.ravel(), minlength=width * PATTERNS).reshape(width, PATTERNS)
+    return counts
+
+
+def entropies(counts: np.ndarray) -> np.ndarray:
+    """Shannon entropy, in bits, of each row of a pattern histogram."""
+    total = counts.sum(axis=1)
+    xlogx = (counts * np.log2(np.maximum(counts, 1))).sum(axis=1)
+    return np.log2(np.maximum(total, 1)) - xlogx / np.maximum(total, 1)
+
+
+class FeedbackMatrix:
+    """
+    Wordle pattern of every five-letter dictionary word against every other.
+
+    codes[a, g] is the pattern guess g shows when a is the answer. It is
+    stored answer-major as a .npy file next to the compiled dictionary and
+    memory-mapped, so the remaining candidates of a puzzle are a handful of
+    contiguous rows and every forked worker shares the same pages. The
+    entropy of each opening guess over the whole vocabulary is stored beside
+    it. Both are rebuilt only when the dictionary checksum changes.
+
+    Attributes:
+        rows (np.ndarray): Dictionary (feature table) row of each word, ascending
+        letters (np.ndarray): (words, 5) letter codes
+        codes (np.ndarray): (words, words) uint8 pattern codes, memory-mapped
+        opening (np.ndarray): Entropy of each word as the first guess
+    """
+
+    def __init__(self, rows: np.ndarray, letters: np.ndarray, codes: np.ndarray, opening: np.ndarray):
+        self.rows = rows
+        self.letters = letters
+        self.codes = codes
+        self.opening = opening
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    @classmethod
+    def load(cls, path: Path, words, checksum: str) -> 'FeedbackMatrix':
+        """The matrix for words (a sorted word store) from path, building it if missing or stale."""
+        path = Path(path)
+        meta_file = path.with_suffix('.json')
+        opening_file = path.with_name(path.stem + '_opening.npy')
+        rows, letters = vocabulary(words)
+        try:
+            with open(meta_file, 'r') as f:
+                meta = json.load(f)
+            if meta.get('format_version') == FORMAT_VERSION and meta.get('checksum') == checksum:
+                codes = np.load(path, mmap_mode='r')
+                opening = np.load(opening_file)
+                if codes.shape == (len(rows), len(rows)) and opening.shape == (len(rows),):
+                    return cls(rows, letters, codes, opening)
+            logger.debug(f"Feedback matrix {path} is stale; rebuilding")
+        except (OSError, ValueError):
+            pass
+
+        cls.build(path, letters, checksum)
+        return cls(rows, letters, np.load(path, mmap_mode='r'), np.load(opening_file))
+
+    @staticmethod
+    def build(path: Path, letters: np.ndarray, checksum: str) -> None:
+        """Compute and write the matrix and opening entropies for the given words."""
+        started = datetime.now()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Per-process temporary names, so concurrent builders never rename each other's files
+        tmp_file = path.with_name(f"{path.stem}.{os.getpid()}.tmp.npy")
+        count = len(letters)
+        codes = np.lib.format.open_memmap(tmp_file, mode='w+', dtype=np.uint8, shape=(count, count))
+        groups = _signature_groups(letters)
+        # Opening histograms are accumulated while each block is still in memory
+        counts = np.zeros((count, PATTERNS), dtype=np.int64)
+        for start in range(0, count, BUILD_ROWS):
+            block = feedback_codes(letters, letters[start:start + BUILD_ROWS], groups).T
+            codes[start:start + BUILD_ROWS] = block
+            counts += pattern_counts(block)
+        opening = entropies(counts)
+        codes.flush()
+        del codes
+        os.replace(tmp_file, path)
+
+        opening_file = path.with_name(path.stem + '_opening.npy')
+        tmp_opening = path.with_name(f"{path.stem}_opening.{os.getpid()}.tmp.npy")
+        np.save(tmp_opening, opening)
+        os.replace(tmp_opening, opening_file)
+        meta_file = path.with_suffix('.json')
+        tmp_meta = meta_file.with_name(f"{meta_file.name}.{os.getpid()}.tmp")
+        with open(tmp_meta, 'w') as f:
+            json.dump({
+                'format_version': FORMAT_VERSION,
+                'checksum': checksum,
+                'word_count': count,
+                'built_at': started.isoformat()
+            }, f, indent=2)
+        os.replace(tmp_meta, meta_file)
+        logger.info(f"Built {count}x{count} feedback matrix in "
+                    f"{(datetime.now() - started).total_seconds():.1f}s")
+
+    def indices(self, rows: np.ndarray) -> np.ndarray:
+        """Positions in the matrix of the given dictionary rows; rows outside it are dropped."""
+        rows = np.asarray(rows, dtype=np.int64)
+        found = np.searchsorted(self.rows, rows)
+        found = np.minimum(found, max(len(self.rows) - 1, 0))
+        return found[(len(self.rows) > 0) & (self.rows[found] == rows)]
+
+    def patterns(self, guess: str) -> np.ndarray:
+        """Pattern of guess against every word (computed directly, no matrix read)."""
+        return feedback_codes(encode([guess]), self.letters)[0]
+
+    def best_guesses(self, candidates: np.ndarray, guesses: np.ndarray, count: int = 5) -> List[Tuple[int, float]]:
+        """
+        The count guesses (matrix positions) that split candidates into the most even patterns.
+
+        Ranked by entropy; ties go to a guess that could itself be the
+        answer, then to dictionary order. Opening entropies are read from
+        disk when the candidates are the whole vocabulary.
+        """
+        if not len(candidates) or not len(guesses):
+            return []
+        if len(candidates) == len(self):
+            scores = self.opening[guesses]
+        else:
+            codes = self.codes[np.sort(candidates)]
+            if len(guesses) < len(self):
+                codes = codes[:, guesses]
+            scores = entropies(pattern_counts(codes))
+        is_candidate = np.isin(guesses, candidates)
+        order = np.lexsort((guesses, ~is_candidate, -np.round(scores, 9)))[:count]
+        return [(int(guesses[i]), float(scores[i])) for i in order]